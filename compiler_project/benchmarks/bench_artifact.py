@@ -0,0 +1,39 @@
+"""
+Compare running the front end against loading a saved compilation artifact.
+
+Usage (from compiler_project/): python -m benchmarks.bench_artifact [functions]
+"""
+import sys
+import time
+
+from src.parser import Parser
+from src.artifact import build_artifact, dumps, loads
+from benchmarks.programs import generate_program
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    source = generate_program(functions)
+    parser = Parser()
+
+    start = time.perf_counter()
+    artifact = build_artifact(source, parser)
+    front_end = time.perf_counter() - start
+
+    data = dumps(artifact)
+    start = time.perf_counter()
+    loaded = loads(data)
+    load_time = time.perf_counter() - start
+
+    assert loaded.ast == artifact.ast
+    assert loaded.semantic_errors == artifact.semantic_errors
+    assert len(loaded.symbol_table.symbols) == len(artifact.symbol_table.symbols)
+
+    print(f"source:    {len(source) / 1024:.0f} KiB, {functions} functions")
+    print(f"artifact:  {len(data) / 1024:.0f} KiB")
+    print(f"front end: {front_end * 1000:.1f}ms")
+    print(f"load:      {load_time * 1000:.1f}ms ({front_end / load_time:.0f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
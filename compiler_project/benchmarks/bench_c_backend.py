@@ -0,0 +1,84 @@
+"""
+Differential check and execution benchmark for the native C backend.
+
+Every program is run by the reference interpreter, the Python backend and
+the native build (as an executable and as a shared object); results and
+final globals must agree before anything is timed. The executable timing
+includes starting a process, the shared object timing doesn't.
+
+Usage (from compiler_project/):
+    python -m benchmarks.bench_c_backend
+    python -m benchmarks.bench_c_backend FILE ENTRY [ARGS...]
+"""
+import sys
+import tempfile
+import time
+
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.py_backend import compile_program
+from src.c_backend import NativeBuilder, compile_native
+from benchmarks.programs import PROGRAMS
+
+
+def best_of(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _argument(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def main():
+    if len(sys.argv) > 2:
+        with open(sys.argv[1], 'r') as file:
+            programs = {sys.argv[1]: (file.read(), sys.argv[2], [_argument(arg) for arg in sys.argv[3:]])}
+    else:
+        programs = PROGRAMS
+
+    parser = Parser()
+    builder = NativeBuilder(tempfile.mkdtemp())
+    print(f"{'program':<10} {'interpreter':>12} {'python':>10} {'executable':>11} {'shared':>10} {'build':>8}")
+    for name, (source, entry, args) in programs.items():
+        ast = parser.parse(source)
+        if parser.errors:
+            raise SystemExit(f"{name}: {parser.errors}")
+
+        start = time.perf_counter()
+        runners = {
+            'interpreter': Interpreter(ast),
+            'python': compile_program(ast),
+            'executable': compile_native(ast, 'executable', builder),
+            'shared': compile_native(ast, 'shared', builder),
+        }
+        build = time.perf_counter() - start
+
+        expected = runners['interpreter'].run(entry, args)
+        expected_globals = runners['interpreter'].globals
+        for runner_name, runner in runners.items():
+            actual = runner.run(entry, args)
+            if actual != expected or runner.globals != expected_globals:
+                raise SystemExit(f"{name}: {runner_name} result {actual!r} differs from interpreter {expected!r}")
+
+        times = {runner_name: best_of(lambda: runner.run(entry, args)) for runner_name, runner in runners.items()}
+        print(f"{name:<10} {times['interpreter'] * 1000:>10.1f}ms {times['python'] * 1000:>8.1f}ms "
+              f"{times['executable'] * 1000:>9.1f}ms {times['shared'] * 1000:>8.2f}ms {build * 1000:>6.0f}ms")
+
+        # Run again against the warm cache to show the build is reused
+        start = time.perf_counter()
+        compile_native(ast, 'executable', builder)
+        print(f"{'':<10} cached rebuild {(time.perf_counter() - start) * 1000:.2f}ms, "
+              f"shared object {times['interpreter'] / times['shared']:.0f}x faster than the interpreter")
+
+
+if __name__ == '__main__':
+    main()
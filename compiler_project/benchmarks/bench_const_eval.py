@@ -0,0 +1,82 @@
+"""
+Measure what folding constant pure calls at compile time removes from run time.
+
+Usage (from compiler_project/): python -m benchmarks.bench_const_eval
+"""
+import time
+
+from src.const_eval import fold_pure_calls
+from src.interpreter import Interpreter
+from src.py_backend import compile_program
+from src.service import CompileEngine
+
+# A table filled from pure calls with constant (or constant-propagated) arguments
+TABLE = """
+int table[64];
+
+int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+int power(int base, int exponent) {
+    int result;
+    result = 1;
+    while (exponent > 0) {
+        result = result * base;
+        exponent = exponent - 1;
+    }
+    return result;
+}
+
+int fill(int n) {
+    int i;
+    int depth;
+    depth = 18;
+    i = 0;
+    while (i < n) {
+        table[i - i / 64 * 64] = fib(depth) + power(3, 12) - i;
+        i = i + 1;
+    }
+    return table[0];
+}
+"""
+
+
+def best_of(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    result = CompileEngine().compile(TABLE)
+    if not result.semantic_success:
+        raise SystemExit(result.syntax_errors + result.semantic_errors)
+    start = time.perf_counter()
+    folded, folder = fold_pure_calls(result.ast)
+    fold_time = time.perf_counter() - start
+    print(f"pure functions: {', '.join(sorted(folder.pure))}")
+    for name, args, value in folder.folds:
+        print(f"folded {name}({', '.join(map(repr, args))}) = {value!r}")
+    print(f"folding took {fold_time * 1000:.1f}ms, {len(folder.memo)} memo entries")
+
+    entry, args = 'fill', [16]
+    print(f"{'backend':<12} {'before':>10} {'after':>10} {'speedup':>8}")
+    for backend, build in (('interpreter', Interpreter), ('python', compile_program)):
+        before, after = build(result.ast), build(folded)
+        if before.run(entry, args) != after.run(entry, args) or before.globals != after.globals:
+            raise SystemExit(f"{backend}: folded program computes something else")
+        slow = best_of(lambda: before.run(entry, args))
+        fast = best_of(lambda: after.run(entry, args))
+        print(f"{backend:<12} {slow * 1000:>8.1f}ms {fast * 1000:>8.2f}ms {slow / fast:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare a cold compiler process against compiling through a warm daemon.
+
+Usage (from compiler_project/): python -m benchmarks.bench_daemon [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.daemon import DaemonClient, start_daemon
+
+SOURCE = 'examples/test.c'
+
+
+def time_command(command, runs, env):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with open(SOURCE, 'r') as file:
+        code = file.read()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), 'bench.sock')
+    env = dict(os.environ, COMPILER_SOCKET=socket_path)
+    start_daemon(socket_path)
+    try:
+        cold = time_command([sys.executable, '-m', 'src.main', SOURCE], runs, env)
+        client_process = time_command([sys.executable, '-m', 'src.daemon', 'compile', SOURCE], runs, env)
+
+        with DaemonClient(socket_path) as client:
+            client.compile(code)
+            samples = []
+            for _ in range(runs * 20):
+                start = time.perf_counter()
+                response = client.compile(code)
+                samples.append(time.perf_counter() - start)
+            assert response['ok'] and response['semantic_success']
+            round_trip = statistics.median(samples)
+    finally:
+        with DaemonClient(socket_path) as client:
+            client.request({'op': 'shutdown'})
+
+    print(f"cold process (python -m src.main): {cold * 1000:7.1f}ms")
+    print(f"client process (src.daemon):       {client_process * 1000:7.1f}ms ({cold / client_process:.1f}x)")
+    print(f"in-process round trip:             {round_trip * 1000:7.2f}ms ({cold / round_trip:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Memory and time of parsing and checking a large generated program, with and
+without hash-consing.
+
+For each mode: AST nodes (distinct objects), memory held by what the
+grammar actions allocated (AST nodes, position and intern tables, measured
+with tracemalloc), parse time, semantic analysis
+time and the number of expression types the analyzer computed. Both modes
+must report the same diagnostics and cross references.
+
+Usage (from compiler_project/): python -m benchmarks.bench_hash_cons [FUNCTIONS]
+"""
+import sys
+import time
+import tracemalloc
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.semantic import SemanticAnalyzer
+from src.service import CompileEngine
+from src.symbol_table import SymbolTable
+from benchmarks.programs import generate_program
+
+
+def best_of(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def count_nodes(node, seen):
+    if isinstance(node, list):
+        for item in node:
+            count_nodes(item, seen)
+    elif isinstance(node, tuple) and id(node) not in seen:
+        seen.add(id(node))
+        for child in node[1:]:
+            count_nodes(child, seen)
+    return len(seen)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    functions = int(argv[0]) if argv else 2000
+    source = generate_program(functions)
+    tokens = Lexer().tokenize(source)
+    print(f"{functions} functions, {len(tokens)} tokens")
+
+    results = []
+    print(f"{'mode':<10} {'nodes':>9} {'memory':>10} {'parse':>9} {'semantic':>9} {'types':>8}")
+    for hash_cons in (False, True):
+        parser = Parser(hash_cons)
+        parse_time = best_of(lambda: parser.parse(source, tokens))
+        tracemalloc.start()
+        ast = parser.parse(source, tokens)
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, '*parser.py')])
+        tracemalloc.stop()
+        memory = sum(statistic.size for statistic in snapshot.statistics('filename'))
+        nodes = count_nodes(ast, set())
+
+        def analyze():
+            analyzer = SemanticAnalyzer(SymbolTable())
+            analyzer.analyze(ast)
+            return analyzer
+        semantic_time = best_of(analyze)
+        types = len(analyze().types)
+
+        result = CompileEngine(hash_cons).compile(source)
+        references = sorted((reference.start, reference.key) for reference in result.xref._references)
+        results.append((result.syntax_errors, result.semantic_errors, references))
+        mode = 'hash-cons' if hash_cons else 'plain'
+        print(f"{mode:<10} {nodes:>9} {memory / 2 ** 20:>8.1f}MB {parse_time * 1000:>7.1f}ms "
+              f"{semantic_time * 1000:>7.1f}ms {types:>8}")
+    if results[0] != results[1]:
+        raise SystemExit("hash-consing changed the diagnostics or cross references")
+
+
+if __name__ == '__main__':
+    main()
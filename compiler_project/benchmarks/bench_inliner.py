@@ -0,0 +1,122 @@
+"""
+Execution benchmark for function inlining.
+
+Each program runs before and after inline_functions on the interpreter and
+the Python backend; results and final globals must match before timing.
+Programs with no call inlined run the same code twice and aren't timed.
+
+Usage (from compiler_project/): python -m benchmarks.bench_inliner [THRESHOLD]
+"""
+import sys
+import time
+
+from src.inliner import DEFAULT_THRESHOLD, inline_functions
+from src.interpreter import Interpreter
+from src.py_backend import compile_program
+from src.service import CompileEngine
+from benchmarks.programs import PROGRAMS
+
+# Small helpers called from loops, one of them through another
+HELPERS = """
+int data[2048];
+
+int square(int x) {
+    return x * x;
+}
+
+int absolute(int x) {
+    if (x < 0) {
+        return 0 - x;
+    }
+    return x;
+}
+
+int clamp(int v, int low, int high) {
+    if (v < low) {
+        return low;
+    }
+    if (v > high) {
+        return high;
+    }
+    return v;
+}
+
+int energy(int a, int b) {
+    return square(a - b) + absolute(a - b);
+}
+
+int smooth(int rounds) {
+    int r;
+    int i;
+    int total;
+    i = 0;
+    while (i < 2048) {
+        data[i] = square(i - i / 97 * 97) - 2000;
+        i = i + 1;
+    }
+    r = 0;
+    total = 0;
+    while (r < rounds) {
+        i = 1;
+        while (i < 2048) {
+            data[i] = clamp(data[i] + data[i - 1] / 3, 0 - 5000, 5000);
+            total = total + energy(data[i], data[i - 1]) / 64;
+            i = i + 1;
+        }
+        r = r + 1;
+    }
+    return total;
+}
+"""
+
+
+def best_of_each(funcs, repeat=5):
+    """Time the functions in turn, so clock and cache warm-up doesn't favor one."""
+    best = [None] * len(funcs)
+    for _ in range(repeat):
+        for k, func in enumerate(funcs):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best[k] = elapsed if best[k] is None else min(best[k], elapsed)
+    return best
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    threshold = int(argv[0]) if argv else DEFAULT_THRESHOLD
+    engine = CompileEngine()
+    programs = dict(PROGRAMS, helpers=(HELPERS, 'smooth', [8]))
+    rows = []
+    for name, (source, entry, args) in programs.items():
+        result = engine.compile(source)
+        if not result.semantic_success:
+            raise SystemExit(f"{name}: {result.syntax_errors + result.semantic_errors}")
+        inlined, inliner = inline_functions(result.ast, engine.parser.positions, threshold)
+        if inliner.decisions:
+            print(f"== {name}")
+            print(inliner.report())
+
+        row = [name]
+        for build in (Interpreter, compile_program):
+            before, after = build(result.ast), build(inlined)
+            if before.run(entry, args) != after.run(entry, args) or before.globals != after.globals:
+                raise SystemExit(f"{name}: inlined program computes something else")
+            if any(decision.inlined for decision in inliner.decisions):
+                row.extend(best_of_each([lambda: before.run(entry, args), lambda: after.run(entry, args)]))
+        rows.append(row)
+
+    print()
+    print(f"threshold {threshold}")
+    print(f"{'program':<10} {'interpreter':>11} {'inlined':>10} {'speedup':>8} {'python':>9} {'inlined':>10} {'speedup':>8}")
+    for name, *times in rows:
+        if not times:
+            print(f"{name:<10} {'nothing inlined':>31}")
+            continue
+        slow, fast, py_slow, py_fast = times
+        print(f"{name:<10} {slow * 1000:>9.1f}ms {fast * 1000:>8.1f}ms {slow / fast:>7.2f}x "
+              f"{py_slow * 1000:>7.1f}ms {py_fast * 1000:>8.1f}ms {py_slow / py_fast:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
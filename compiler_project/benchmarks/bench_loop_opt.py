@@ -0,0 +1,112 @@
+"""
+Execution benchmark for while-loop invariant code motion and strength reduction.
+
+Each program runs before and after optimize_loops on the interpreter and
+the Python backend; results and final globals must match before timing.
+The REGRESSIONS programs are only checked, not timed.
+
+Usage (from compiler_project/): python -m benchmarks.bench_loop_opt
+"""
+import time
+
+from src.interpreter import Interpreter
+from src.loop_opt import optimize_loops
+from src.py_backend import compile_program
+from src.service import CompileEngine
+from benchmarks.programs import PROGRAMS
+
+# Row-major updates: an invariant table lookup and scale factor per row,
+# row * width recomputed per element
+KERNEL = """
+int grid[8192];
+int weights[64];
+
+int kernel(int rows, int width) {
+    int row;
+    int col;
+    int total;
+    row = 0;
+    total = 0;
+    while (row < 64) {
+        weights[row] = row * 3 - row / 7;
+        row = row + 1;
+    }
+    row = 0;
+    while (row < rows) {
+        col = 0;
+        while (col < width) {
+            grid[row * width + col] = weights[row - row / 64 * 64] * (width * 4 + 1) + col * 3;
+            total = total + grid[row * width + col] / (rows + 1);
+            col = col + 1;
+        }
+        row = row + 1;
+    }
+    return total;
+}
+"""
+
+# Programs the optimizer once got wrong
+REGRESSIONS = {
+    # A guarded hoist from the condition: the guard read the temporary before it was set
+    'guard': ("int a[5]; int k; int main(void) { int i; int s; a[2] = 7; k = 2; i = 0; s = 0; "
+              "while (i < a[k]) { s = s + 1; i = i + 1; } return s; }", 'main', []),
+    # A call inside a candidate's enclosing expression made replacement hash a list
+    'call': ("int f(int x) { return x + 1; } int main(void) { int i; int s; int n; n = 3; i = 0; s = 0; "
+             "while (i < 10) { s = s + n * 4 + f(i); i = i + 1; } return s; }", 'main', []),
+}
+
+
+def check(engine, name, source, entry, args):
+    """Optimize a program and compare it with the original on both backends; returns the builds."""
+    result = engine.compile(source)
+    if not result.semantic_success:
+        raise SystemExit(f"{name}: {result.syntax_errors + result.semantic_errors}")
+    optimized, optimizer = optimize_loops(result.ast, engine.parser.positions)
+    builds = []
+    for build in (Interpreter, compile_program):
+        before, after = build(result.ast), build(optimized)
+        if before.run(entry, args) != after.run(entry, args) or before.globals != after.globals:
+            raise SystemExit(f"{name}: optimized program computes something else")
+        builds.append((before, after))
+    return optimizer, builds
+
+
+def best_of_each(funcs, repeat=5):
+    """Time the functions in turn, so clock and cache warm-up doesn't favor one."""
+    best = [None] * len(funcs)
+    for _ in range(repeat):
+        for k, func in enumerate(funcs):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best[k] = elapsed if best[k] is None else min(best[k], elapsed)
+    return best
+
+
+def main():
+    engine = CompileEngine()
+    for name, (source, entry, args) in REGRESSIONS.items():
+        check(engine, name, source, entry, args)
+
+    programs = dict(PROGRAMS, kernel=(KERNEL, 'kernel', [16, 512]))
+    rows = []
+    for name, (source, entry, args) in programs.items():
+        optimizer, builds = check(engine, name, source, entry, args)
+        if optimizer.loops:
+            print(f"== {name}")
+            print(optimizer.report())
+
+        row = [name]
+        for before, after in builds:
+            row.extend(best_of_each([lambda: before.run(entry, args), lambda: after.run(entry, args)]))
+        rows.append(row)
+
+    print()
+    print(f"{'program':<10} {'interpreter':>11} {'optimized':>10} {'speedup':>8} {'python':>9} {'optimized':>10} {'speedup':>8}")
+    for name, slow, fast, py_slow, py_fast in rows:
+        print(f"{name:<10} {slow * 1000:>9.1f}ms {fast * 1000:>8.1f}ms {slow / fast:>7.2f}x "
+              f"{py_slow * 1000:>7.1f}ms {py_fast * 1000:>8.1f}ms {py_slow / py_fast:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare PLY's parse loop with the integer-table LRDriver.
+
+Both parse the same TokenBuffer, so the timings isolate the parse loop
+(table lookups, symbol objects and reduction dispatch).
+
+Usage (from compiler_project/): python -m benchmarks.bench_lr_driver [functions]
+"""
+import sys
+import time
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.lr_driver import LRDriver
+from benchmarks.programs import generate_program
+
+
+def best_of(func, repeat=7):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    source = generate_program(functions)
+    tokens = Lexer().tokenize(source)
+    parser = Parser()
+    driver = LRDriver(parser.parser)
+
+    def ply_parse():
+        parser.reset()
+        return parser.parser.parse(lexer=tokens.stream())
+
+    def driver_parse():
+        parser.reset()
+        return driver.parse(tokens)
+
+    ply_time, ply_ast = best_of(ply_parse)
+    driver_time, driver_ast = best_of(driver_parse)
+    assert ply_ast == driver_ast
+
+    print(f"tokens: {len(tokens)}")
+    print(f"PLY:    {ply_time * 1000:.1f}ms ({len(tokens) / ply_time / 1000:.0f}k tokens/s)")
+    print(f"driver: {driver_time * 1000:.1f}ms ({len(tokens) / driver_time / 1000:.0f}k tokens/s)")
+    print(f"speedup: {ply_time / driver_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
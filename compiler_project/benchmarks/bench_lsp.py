@@ -0,0 +1,125 @@
+"""
+Keystroke-to-diagnostic latency of the language server.
+
+Opens a large generated program in `python -m src.main lsp`, types a
+statement into `main` one character at a time at a steady typing speed,
+and reports the latency percentiles and analysis counters the server
+recorded, for several debounce settings: p50 and max over every keystroke,
+and the settled latency after the final keystroke. With no debounce every
+keystroke starts an analysis; when keys come faster than a compilation,
+newer keystrokes cancel most of them and only the pause publishes.
+
+Usage (from compiler_project/): python -m benchmarks.bench_lsp [FUNCTIONS] [KEY_INTERVAL_MS]
+"""
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.programs import generate_program
+
+TYPED = "    result = result + helper1(result, 3);\n"
+DEBOUNCES = (0.0, 0.05, 0.15, 0.3)
+URI = 'file:///bench.c'
+
+
+class Client:
+    """A minimal LSP client for a server subprocess."""
+
+    def __init__(self, debounce):
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'src.main', 'lsp', '--debounce', str(debounce)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.messages = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+        self.next_id = 0
+
+    def _read(self):
+        stdout = self.process.stdout
+        while True:
+            header = stdout.readline()
+            if not header:
+                return
+            stdout.readline()
+            self.messages.put(json.loads(stdout.read(int(header.split(b':')[1]))))
+
+    def send(self, method, params=None, request=False):
+        message = {'jsonrpc': '2.0', 'method': method, 'params': params or {}}
+        if request:
+            self.next_id += 1
+            message['id'] = self.next_id
+        body = json.dumps(message).encode('utf-8')
+        self.process.stdin.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+        self.process.stdin.flush()
+        return message.get('id')
+
+    def wait(self, match, timeout=60):
+        deadline = time.monotonic() + timeout
+        while True:
+            message = self.messages.get(timeout=max(0.0, deadline - time.monotonic()))
+            if match(message):
+                return message
+
+    def request(self, method, params=None):
+        request_id = self.send(method, params, request=True)
+        return self.wait(lambda message: message.get('id') == request_id)['result']
+
+    def wait_diagnostics(self, version):
+        return self.wait(lambda message: message.get('method') == 'textDocument/publishDiagnostics'
+                         and message['params']['version'] == version)
+
+    def close(self):
+        self.request('shutdown')
+        self.send('exit')
+        self.process.wait()
+
+
+def type_into(client, code, interval):
+    """Type TYPED at the start of main's closing line; returns the final version."""
+    line = code.rstrip('\n').count('\n')  # main's closing brace
+    column, version = 0, 1
+    for char in TYPED:
+        version += 1
+        position = {'line': line, 'character': column}
+        client.send('textDocument/didChange', {
+            'textDocument': {'uri': URI, 'version': version},
+            'contentChanges': [{'range': {'start': position, 'end': position}, 'text': char}],
+        })
+        if char == '\n':
+            line, column = line + 1, 0
+        else:
+            column += 1
+        time.sleep(interval)
+    return version
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    interval = (float(sys.argv[2]) if len(sys.argv) > 2 else 80) / 1000
+    code = generate_program(functions)
+    print(f"{functions} functions, {code.count(chr(10))} lines; typing {len(TYPED)} keys, "
+          f"one every {interval * 1000:.0f}ms")
+    print(f"{'debounce':>9} {'p50':>9} {'max':>9} {'settled':>9} {'analyses':>9} {'cancelled':>9}")
+    for debounce in DEBOUNCES:
+        client = Client(debounce)
+        client.request('initialize', {'capabilities': {}})
+        client.send('initialized')
+        client.send('textDocument/didOpen',
+                    {'textDocument': {'uri': URI, 'languageId': 'c', 'version': 1, 'text': code}})
+        client.wait_diagnostics(1)
+        version = type_into(client, code, interval)
+        diagnostics = client.wait_diagnostics(version)['params']['diagnostics']
+        metrics = client.request('compiler/latency')
+        client.close()
+        if diagnostics:
+            print(f"unexpected diagnostics: {diagnostics}")
+        latency, counters = metrics['latency_ms'], metrics['counters']
+        print(f"{debounce * 1000:>7.0f}ms {latency['p50']:>7.1f}ms {latency['max']:>7.1f}ms "
+              f"{metrics['settled_ms']['max']:>7.1f}ms "
+              f"{counters.get('analyses', 0):>9} {counters.get('cancelled', 0):>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Lexing time on a large generated source, serial vs. a process pool.
+
+Usage (from compiler_project/): python -m benchmarks.bench_parallel_lexer [megabytes]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.lexer import Lexer
+from src.parallel_lexer import tokenize_parallel
+from benchmarks.programs import generate_program
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    unit = generate_program(100)
+    source = unit * max(1, int(megabytes * 1024 * 1024 / len(unit)))
+
+    start = time.perf_counter()
+    expected = Lexer().tokenize(source)
+    serial = time.perf_counter() - start
+    print(f"source: {len(source) / 1024 / 1024:.0f} MiB, {len(expected)} tokens")
+    print(f"{'workers':>7} {'seconds':>8} {'speedup':>8}")
+    print(f"{'serial':>7} {serial:>8.2f} {1:>7.2f}x")
+
+    cores = os.cpu_count() or 1
+    for workers in sorted({1, 2, 4, cores}):
+        with ProcessPoolExecutor(workers) as executor:
+            # Warm the workers so pool startup isn't timed
+            tokenize_parallel(unit, executor=executor, min_size=0)
+            start = time.perf_counter()
+            tokens = tokenize_parallel(source, workers, executor)
+            elapsed = time.perf_counter() - start
+        assert tokens.types == expected.types and tokens.starts == expected.starts
+        assert tokens.lines == expected.lines and tokens.lengths == expected.lengths
+        print(f"{workers:>7} {elapsed:>8.2f} {serial / elapsed:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Differential check and execution benchmark for the Python backend.
+
+Every sample program is run by the reference interpreter and by the
+compiled Python code; their results and final globals must match before
+either is timed.
+
+Usage (from compiler_project/): python -m benchmarks.bench_py_backend
+"""
+import time
+
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.py_backend import compile_program
+from benchmarks.programs import PROGRAMS
+
+
+def best_of(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = Parser()
+    print(f"{'program':<10} {'interpreter':>12} {'compiled':>12} {'speedup':>8}")
+    for name, (source, entry, args) in PROGRAMS.items():
+        ast = parser.parse(source)
+        if parser.errors:
+            raise SystemExit(f"{name}: {parser.errors}")
+
+        interpreter = Interpreter(ast)
+        program = compile_program(ast)
+        expected = interpreter.run(entry, args)
+        actual = program.run(entry, args)
+        if expected != actual or interpreter.globals != program.globals:
+            raise SystemExit(f"{name}: compiled result {actual!r} differs from interpreter {expected!r}")
+
+        interpreted = best_of(lambda: interpreter.run(entry, args))
+        compiled = best_of(lambda: program.run(entry, args))
+        print(f"{name:<10} {interpreted * 1000:>10.1f}ms {compiled * 1000:>10.1f}ms {interpreted / compiled:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Execution benchmark for deep recursion.
+
+Runs tail-recursive and non-tail-recursive functions at growing depths on
+the interpreter, the stack machine and the Python backend, each before and
+after eliminate_tail_calls. Results must match wherever both sides finish;
+a run that exceeds the Python recursion limit is reported as "too deep".
+Times are per call in the source.
+
+Usage (from compiler_project/): python -m benchmarks.bench_recursion
+"""
+import time
+
+from src.interpreter import Interpreter
+from src.py_backend import compile_program
+from src.service import CompileEngine
+from src.stack_machine import StackMachine
+from src.tail_calls import eliminate_tail_calls
+
+RECURSION = """
+int count(int n, int acc) {
+    if (n == 0) {
+        return acc;
+    }
+    return count(n - 1, acc + (n - n / 7 * 7));
+}
+
+int sum(int n) {
+    if (n == 0) {
+        return 0;
+    }
+    return n + sum(n - 1);
+}
+
+int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+"""
+
+# (entry, args, calls made)
+CASES = [
+    ('count', [100, 0], 101),
+    ('count', [10000, 0], 10001),
+    ('count', [200000, 0], 200001),
+    ('sum', [100], 101),
+    ('sum', [10000], 10001),
+    ('sum', [200000], 200001),
+    ('fib', [18], 8361),
+]
+
+BUILDS = [('interpreter', Interpreter), ('stack', StackMachine), ('python', compile_program)]
+
+
+def best_time(func, repeat=3):
+    """Time a run; None if it exceeds the Python recursion limit."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            value = func()
+        except RecursionError:
+            return None, None
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def main():
+    engine = CompileEngine()
+    result = engine.compile(RECURSION)
+    if not result.semantic_success:
+        raise SystemExit(f"{result.syntax_errors + result.semantic_errors}")
+    looped, eliminator = eliminate_tail_calls(result.ast, engine.parser.positions)
+    print(eliminator.report())
+    print()
+
+    header = f"{'call':<16}"
+    for name, _ in BUILDS:
+        header += f" {name:>12} {'+tail calls':>12}"
+    print(header + "   (microseconds per call)")
+    for entry, args, calls in CASES:
+        row = f"{entry + str(tuple(args)).replace(' ', ''):<16}"
+        values = set()
+        for _, build in BUILDS:
+            for ast in (result.ast, looped):
+                program = build(ast)
+                seconds, value = best_time(lambda: program.run(entry, args))
+                if seconds is None:
+                    row += f" {'too deep':>12}"
+                    continue
+                values.add(value)
+                row += f" {seconds / calls * 1e6:>12.2f}"
+        if len(values) != 1:
+            raise SystemExit(f"{entry}{tuple(args)}: builds disagree: {values}")
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Load test for the web compile service.
+
+Starts the Flask app under werkzeug's multithreaded WSGI server in one or
+more processes, then drives it from a pool of client threads. Every
+response is checked against a serially rendered one, so cross-request
+state leaks show up as failures rather than as odd timings.
+
+Usage (from compiler_project/): python -m benchmarks.bench_service [seconds]
+"""
+import multiprocessing
+import os
+import socket
+import sys
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.programs import generate_program
+
+SOURCES = [open('examples/test.c').read(), open('semantic_test.c').read(), generate_program(20)]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def serve(port):
+    import logging
+    from werkzeug.serving import make_server
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    from web_app import app, engine_pool
+    engine_pool.warm()
+    make_server('127.0.0.1', port, app, threaded=True).serve_forever()
+
+
+def post(port, source):
+    data = urllib.parse.urlencode({'code': source}).encode()
+    with urllib.request.urlopen(f'http://127.0.0.1:{port}/', data) as response:
+        return response.read()
+
+
+def wait_ready(port):
+    for _ in range(200):
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.1):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise SystemExit(f"server on port {port} did not start")
+
+
+def run_load(ports, clients, seconds, expected):
+    deadline = time.perf_counter() + seconds
+
+    def client(worker):
+        done = 0
+        while time.perf_counter() < deadline:
+            k = (worker + done) % len(SOURCES)
+            body = post(ports[(worker + done) % len(ports)], SOURCES[k])
+            if body != expected[k]:
+                raise AssertionError(f"response for source {k} differs from the serial one")
+            done += 1
+        return done
+
+    with ThreadPoolExecutor(clients) as executor:
+        return sum(executor.map(client, range(clients))) / seconds
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    cores = os.cpu_count() or 1
+    process_counts = sorted({1, 2, min(4, cores), cores})
+    print(f"{'processes':>9} {'clients':>8} {'req/s':>8}")
+    for processes in process_counts:
+        ports = [free_port() for _ in range(processes)]
+        servers = [multiprocessing.Process(target=serve, args=(port,), daemon=True) for port in ports]
+        for server in servers:
+            server.start()
+        try:
+            for port in ports:
+                wait_ready(port)
+            expected = [post(ports[0], source) for source in SOURCES]
+            for clients in (1, 4, 16):
+                throughput = run_load(ports, clients, seconds, expected)
+                print(f"{processes:>9} {clients:>8} {throughput:>8.1f}")
+        finally:
+            for server in servers:
+                server.terminate()
+
+
+if __name__ == '__main__':
+    main()
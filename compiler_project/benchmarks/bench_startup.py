@@ -0,0 +1,71 @@
+"""
+Measure CLI startup: wall time per mode and `python -X importtime` cost per module.
+
+Usage (from compiler_project/): python -m benchmarks.bench_startup [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SOURCE = 'examples/test.c'
+
+# Measure with cached bytecode, as an installed compiler would run
+ENV = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+MODES = {
+    'tokens': ['--tokens', SOURCE],
+    'syntax': ['--syntax', SOURCE],
+    'full': [SOURCE],
+}
+
+
+def wall_time(args, runs):
+    samples = []
+    for _ in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'src.main'] + args,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, env=ENV)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples[1:])  # The first run writes bytecode
+
+
+def interpreter_time(runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True, env=ENV)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def import_times(args):
+    """Run the CLI under -X importtime and get {module: (self us, cumulative us)}."""
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'src.main'] + args,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True, env=ENV)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = interpreter_time(runs)
+    print(f"{'interpreter only':<18} {baseline * 1000:6.1f}ms")
+    for mode, args in MODES.items():
+        elapsed = wall_time(args, runs)
+        times = import_times(args)
+        total = sum(own for own, _ in times.values())
+        print(f"{mode:<18} {elapsed * 1000:6.1f}ms  imports {total / 1000:5.1f}ms over {len(times)} modules")
+        ours = sorted(((cumulative, module) for module, (_, cumulative) in times.items()
+                       if module.startswith(('src', 'ply'))), reverse=True)
+        for cumulative, module in ours[:6]:
+            print(f"    {module:<24} {cumulative / 1000:5.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Build a symbol index over a generated multi-file corpus and time queries.
+
+Usage (from compiler_project/): python -m benchmarks.bench_symbol_index [files] [queries]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.symbol_index import SymbolIndex
+
+FILE_TEMPLATE = """int counter{k};
+
+int work{k}(int n) {{
+    int i;
+    i = 0;
+    while (i < n) {{
+        counter{k} = counter{k} + work{prev}(i);
+        i = i + 1;
+    }}
+    return counter{k};
+}}
+
+int main{k}(void) {{
+    return work{k}(10) + work{prev}(3);
+}}
+"""
+
+
+def write_corpus(root, files):
+    for k in range(files):
+        directory = os.path.join(root, f'pkg{k // 100}')
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f'file{k}.c'), 'w') as file:
+            file.write(FILE_TEMPLATE.format(k=k, prev=(k - 1) % files))
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(p / 100 * len(samples)))] * 1e6 for p in (50, 90, 99)}
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    with tempfile.TemporaryDirectory() as root:
+        corpus = os.path.join(root, 'corpus')
+        write_corpus(corpus, files)
+        database = os.path.join(root, 'symbols.db')
+
+        with SymbolIndex(database) as index:
+            start = time.perf_counter()
+            stats = index.update([corpus])
+            full = time.perf_counter() - start
+            assert stats['indexed'] == files
+
+            start = time.perf_counter()
+            stats = index.update([corpus])
+            unchanged = time.perf_counter() - start
+            assert stats['unchanged'] == files
+
+            # Touch 1% of the files
+            changed = random.Random(0).sample(range(files), max(1, files // 100))
+            for k in changed:
+                with open(os.path.join(corpus, f'pkg{k // 100}', f'file{k}.c'), 'a') as file:
+                    file.write('\nint extra(void) { return 1; }\n')
+            start = time.perf_counter()
+            stats = index.update([corpus])
+            incremental = time.perf_counter() - start
+            assert stats['indexed'] == len(changed)
+
+            names = random.Random(1).choices(range(files), k=queries)
+            timings = {'declarations': [], 'callers': []}
+            for k in names:
+                start = time.perf_counter()
+                found = index.declarations(f'work{k}')
+                timings['declarations'].append(time.perf_counter() - start)
+                assert len(found) == 1
+                start = time.perf_counter()
+                found = index.callers(f'work{k}')
+                timings['callers'].append(time.perf_counter() - start)
+                assert len(found) == 3
+
+        size = os.path.getsize(database)
+
+    print(f"corpus:       {files} files, index {size / 1024 / 1024:.1f} MiB")
+    print(f"full index:   {full:.2f}s ({full / files * 1000:.2f}ms per file)")
+    print(f"no changes:   {unchanged:.2f}s")
+    print(f"1% changed:   {incremental:.2f}s ({len(changed)} files)")
+    for query, samples in timings.items():
+        p = percentiles(samples)
+        print(f"{query + ':':<13} p50 {p[50]:.0f}us  p90 {p[90]:.0f}us  p99 {p[99]:.0f}us ({queries} queries)")
+
+
+if __name__ == '__main__':
+    main()
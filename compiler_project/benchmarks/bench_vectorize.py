@@ -0,0 +1,95 @@
+"""
+Execution benchmark for NumPy vectorization of element-wise loops.
+
+Runs the same program with arrays of increasing size on the Python backend
+with and without vectorize, after checking that results and final globals
+match.
+
+Usage (from compiler_project/): python -m benchmarks.bench_vectorize
+"""
+import time
+
+from src import vectorize
+from src.py_backend import compile_program
+from src.service import CompileEngine
+
+SIZES = (1000, 10000, 100000, 1000000)
+
+
+def element_wise(size):
+    """An axpy, a three-point stencil and an integer sum over arrays of `size` elements."""
+    return f"""
+float x[{size}];
+float y[{size}];
+int a[{size}];
+int b[{size}];
+
+int run(int n, int rounds) {{
+    int i;
+    int r;
+    int total;
+    i = 0;
+    while (i < n) {{
+        x[i] = i * 0.25;
+        a[i] = i - i / 1000 * 1000;
+        i = i + 1;
+    }}
+    r = 0;
+    total = 0;
+    while (r < rounds) {{
+        i = 0;
+        while (i < n) {{
+            y[i] = 1.5 * x[i] + y[i];
+            i = i + 1;
+        }}
+        i = 1;
+        while (i < n - 1) {{
+            b[i] = (a[i - 1] + a[i] * 2 + a[i + 1]) / 4 + r;
+            i = i + 1;
+        }}
+        i = 0;
+        while (i < n) {{
+            total = total + b[i];
+            i = i + 1;
+        }}
+        r = r + 1;
+    }}
+    return total;
+}}
+"""
+
+
+def best_of_each(funcs, repeat=3):
+    """Time the functions in turn, so clock and cache warm-up doesn't favor one."""
+    best = [None] * len(funcs)
+    for _ in range(repeat):
+        for k, func in enumerate(funcs):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best[k] = elapsed if best[k] is None else min(best[k], elapsed)
+    return best
+
+
+def main():
+    if vectorize.numpy is None:
+        print("NumPy is not installed: vectorized loops fall back to scalar execution")
+    engine = CompileEngine()
+    print(f"{'size':>9} {'scalar':>10} {'vectorized':>11} {'speedup':>8} {'loops':>6}")
+    for size in SIZES:
+        result = engine.compile(element_wise(size))
+        if not result.semantic_success:
+            raise SystemExit(result.syntax_errors + result.semantic_errors)
+        args = [size, 4]
+        scalar = compile_program(result.ast)
+        vectorized = compile_program(result.ast, vectorize=True)
+        if scalar.run('run', args) != vectorized.run('run', args) or scalar.globals != vectorized.globals:
+            raise SystemExit(f"size {size}: vectorized program computes something else")
+        slow, fast = best_of_each([lambda: scalar.run('run', args), lambda: vectorized.run('run', args)])
+        used = sum(1 for loop in vectorized.vector_loops if loop.runs)
+        print(f"{size:>9} {slow * 1000:>8.1f}ms {fast * 1000:>9.1f}ms {slow / fast:>7.1f}x "
+              f"{used:>3}/{len(vectorized.vector_loops)}")
+
+
+if __name__ == '__main__':
+    main()
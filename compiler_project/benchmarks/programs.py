@@ -0,0 +1,157 @@
+"""
+Sample programs shared by the benchmark scripts. Each entry maps a name to
+(source, entry function, arguments).
+"""
+
+FIB = """
+int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+"""
+
+SIEVE = """
+int flags[20000];
+int count;
+
+int sieve(int n) {
+    int i;
+    int j;
+    i = 2;
+    while (i < n) {
+        flags[i] = 1;
+        i = i + 1;
+    }
+    i = 2;
+    while (i * i < n) {
+        if (flags[i] == 1) {
+            j = i * i;
+            while (j < n) {
+                flags[j] = 0;
+                j = j + i;
+            }
+        }
+        i = i + 1;
+    }
+    count = 0;
+    i = 2;
+    while (i < n) {
+        count = count + flags[i];
+        i = i + 1;
+    }
+    return count;
+}
+"""
+
+NUMERIC = """
+float samples[1000];
+float mean;
+
+int collatz(int n) {
+    int steps;
+    steps = 0;
+    while (n != 1) {
+        if (n - n / 2 * 2 == 0) {
+            n = n / 2;
+        } else {
+            n = 3 * n + 1;
+        }
+        steps = steps + 1;
+    }
+    return steps;
+}
+
+int run(int n) {
+    int i;
+    int total;
+    float sum;
+    i = 0;
+    total = 0;
+    sum = 0;
+    while (i < n) {
+        samples[i - i / 1000 * 1000] = i / 3;
+        sum = sum + samples[i - i / 1000 * 1000] / 7;
+        total = total + collatz(i + 1) + (0 - i) / 4;
+        i = i + 1;
+    }
+    mean = sum / n;
+    return total;
+}
+"""
+
+STENCIL = """
+int grid[4096];
+int next[4096];
+
+int smooth(int steps) {
+    int s;
+    int i;
+    int total;
+    i = 0;
+    while (i < 4096) {
+        grid[i] = i * 7 - i / 5 * 31;
+        i = i + 1;
+    }
+    s = 0;
+    while (s < steps) {
+        i = 1;
+        while (i < 4095) {
+            next[i] = (grid[i - 1] + grid[i] + grid[i + 1] + s) / 3;
+            i = i + 1;
+        }
+        i = 1;
+        while (i < 4095) {
+            grid[i] = next[i];
+            i = i + 1;
+        }
+        s = s + 1;
+    }
+    total = 0;
+    i = 0;
+    while (i < 4096) {
+        total = total + grid[i];
+        i = i + 1;
+    }
+    return total;
+}
+"""
+
+PROGRAMS = {
+    'fib': (FIB, 'fib', [20]),
+    'sieve': (SIEVE, 'sieve', [20000]),
+    'numeric': (NUMERIC, 'run', [3000]),
+    'stencil': (STENCIL, 'smooth', [10]),
+}
+
+
+def generate_program(functions):
+    """Generate a large, semantically valid program with the given number of functions."""
+    parts = ['int counter;\n']
+    for k in range(functions):
+        parts.append(f"""
+int helper{k}(int a, int b) {{
+    int total;
+    int i;
+    total = 0;
+    i = 0;
+    while (i < a) {{
+        if (i > b) {{
+            total = total + i * 2;
+        }} else {{
+            total = total - b / 3;
+        }}
+        i = i + 1;
+    }}
+    counter = counter + 1;
+    return total + helper{k - 1 if k else 0}(0, b);
+}}
+""")
+    parts.append("""
+void main(void) {
+    int result;
+    result = helper0(10, 4);
+}
+""")
+    return ''.join(parts)
@@ -0,0 +1,125 @@
+import hashlib
+import marshal
+import struct
+import zlib
+
+from .symbol_table import Symbol, SymbolTable
+
+# Header: magic, format version, payload CRC32, payload length
+MAGIC = b'CLCA'
+VERSION = 1
+_HEADER = struct.Struct('<4sHII')
+
+# Only attributes that differ from a fresh Symbol are written
+_DEFAULT_ATTRIBUTES = Symbol(None, None).attributes
+
+
+class ArtifactError(Exception):
+    """Raised when an artifact is corrupt or written by another format version."""
+    pass
+
+
+class CompilationArtifact:
+    """Front-end results of one compilation: AST, symbol table and diagnostics."""
+
+    def __init__(self, ast, symbol_table, syntax_errors=None, semantic_errors=None, source_hash=None):
+        self.ast = ast
+        self.symbol_table = symbol_table
+        self.syntax_errors = list(syntax_errors or [])
+        self.semantic_errors = list(semantic_errors or [])
+        self.source_hash = source_hash
+
+    @property
+    def success(self):
+        return self.ast is not None and not self.syntax_errors and not self.semantic_errors
+
+
+def build_artifact(source, parser=None):
+    """Run the front end over source text and capture its results."""
+    from .parser import Parser
+    from .semantic import SemanticAnalyzer
+
+    parser = parser or Parser()
+    symbol_table = SymbolTable()
+    ast = parser.parse(source)
+    semantic_errors = []
+    if ast:
+        analyzer = SemanticAnalyzer(symbol_table)
+        analyzer.analyze(ast)
+        semantic_errors = analyzer.errors
+    return CompilationArtifact(ast, symbol_table, parser.errors, semantic_errors, source_digest(source))
+
+
+def source_digest(source):
+    """Get a stable digest of source text, used to key cached artifacts."""
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def _pack_symbol_table(table):
+    symbols = [
+        (name, scope, symbol.type, symbol.line_no, symbol.kind, symbol.size,
+         {key: value for key, value in symbol.attributes.items() if _DEFAULT_ATTRIBUTES.get(key) != value})
+        for (name, scope), symbol in table.symbols.items()
+    ]
+    scopes = [(scope, sorted(names), table.scope_sizes.get(scope, 0))
+              for scope, names in table.scope_symbols.items()]
+    return (symbols, scopes, table.current_scope, list(table.scope_stack),
+            table.scope_level, table.next_memory_location)
+
+
+def _unpack_symbol_table(state):
+    symbols, scopes, current_scope, scope_stack, scope_level, next_memory_location = state
+    table = SymbolTable()
+    for name, scope, type, line_no, kind, size, attributes in symbols:
+        symbol = Symbol(name, type, line_no, kind, size)
+        symbol.scope = scope
+        symbol.attributes.update(attributes)
+        table.symbols[(name, scope)] = symbol
+    table.scope_symbols = {scope: set(names) for scope, names, _ in scopes}
+    table.scope_sizes = {scope: size for scope, _, size in scopes}
+    table.current_scope = current_scope
+    table.scope_stack = scope_stack
+    table.scope_level = scope_level
+    table.next_memory_location = next_memory_location
+    return table
+
+
+def dumps(artifact):
+    """Serialize an artifact to bytes."""
+    payload = marshal.dumps((
+        artifact.source_hash,
+        artifact.ast,
+        _pack_symbol_table(artifact.symbol_table),
+        artifact.syntax_errors,
+        artifact.semantic_errors,
+    ))
+    return _HEADER.pack(MAGIC, VERSION, zlib.crc32(payload), len(payload)) + payload
+
+
+def loads(data):
+    """Deserialize an artifact written by dumps()."""
+    if len(data) < _HEADER.size:
+        raise ArtifactError("Artifact is truncated")
+    magic, version, checksum, length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ArtifactError("Not a compilation artifact")
+    if version != VERSION:
+        raise ArtifactError(f"Unsupported artifact version {version}, expected {VERSION}")
+    payload = memoryview(data)[_HEADER.size:]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise ArtifactError("Artifact checksum mismatch")
+    source_hash, ast, table_state, syntax_errors, semantic_errors = marshal.loads(payload)
+    return CompilationArtifact(ast, _unpack_symbol_table(table_state),
+                               syntax_errors, semantic_errors, source_hash)
+
+
+def save(artifact, path):
+    """Write an artifact to a file."""
+    with open(path, 'wb') as file:
+        file.write(dumps(artifact))
+
+
+def load(path):
+    """Read an artifact from a file."""
+    with open(path, 'rb') as file:
+        return loads(file.read())
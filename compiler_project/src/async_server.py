@@ -0,0 +1,217 @@
+"""
+Asyncio compile server.
+
+Compilations run in a bounded process pool so a pathological input can't
+stall the event loop. Each compilation gets a CPU-time budget, the number of
+pending compilations is bounded (extra requests are rejected with 429), and
+identical sources already in flight share one compilation.
+
+    python -m src.async_server --port 8080 --workers 4 --queue 64 --cpu-limit 2
+
+POST /compile with a JSON body {"code": "..."}; GET /metrics for queue depth
+and latency percentiles.
+"""
+import argparse
+import asyncio
+import collections
+import hashlib
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+MAX_BODY_SIZE = 1024 * 1024
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 413: 'Payload Too Large',
+            422: 'Unprocessable Entity', 429: 'Too Many Requests', 500: 'Internal Server Error'}
+
+
+# Worker side
+
+class _CpuLimitExceeded(Exception):
+    pass
+
+
+def _on_cpu_limit(signum, frame):
+    raise _CpuLimitExceeded()
+
+
+_engine = None
+
+
+def _init_worker():
+    global _engine
+    from .service import CompileEngine
+    signal.signal(signal.SIGPROF, _on_cpu_limit)
+    _engine = CompileEngine()
+
+
+def _compile_in_worker(code, cpu_limit):
+    """Compile in a pool process and return a (status, payload) pair."""
+    signal.setitimer(signal.ITIMER_PROF, cpu_limit)
+    try:
+        result = _engine.compile(code)
+    except _CpuLimitExceeded:
+        return 422, {'error': f"CPU time limit of {cpu_limit}s exceeded"}
+    except RecursionError:
+        return 422, {'error': "Program is nested too deeply"}
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+    return 200, result.summary()
+
+
+# Server side
+
+class CompileServer:
+    """Dispatches compilations to a process pool with backpressure and coalescing."""
+
+    def __init__(self, workers=None, max_pending=64, cpu_limit=2.0, latency_window=1024):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.cpu_limit = cpu_limit
+        self.executor = self._new_executor()
+        self.inflight = {}
+        self.pending = 0
+        self.latencies = collections.deque(maxlen=latency_window)
+        self.counters = collections.Counter()
+
+    def _new_executor(self):
+        return ProcessPoolExecutor(self.workers, initializer=_init_worker)
+
+    async def compile(self, code):
+        """Compile source text and return a (status, payload) pair."""
+        start = time.perf_counter()
+        self.counters['requests'] += 1
+        key = hashlib.sha1(code.encode('utf-8')).digest()
+
+        future = self.inflight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+        elif self.pending >= self.max_pending:
+            self.counters['rejected'] += 1
+            return 429, {'error': "Compile queue is full, retry later"}
+        else:
+            future = asyncio.ensure_future(self._dispatch(code))
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+
+        status, payload = await asyncio.shield(future)
+        self.latencies.append(time.perf_counter() - start)
+        self.counters[f'status_{status}'] += 1
+        return status, payload
+
+    async def _dispatch(self, code):
+        self.pending += 1
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            return await loop.run_in_executor(executor, _compile_in_worker, code, self.cpu_limit)
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); replace the pool for later requests. Every
+            # request on the broken pool fails, so only the first one replaces it
+            if self.executor is executor:
+                self.executor = self._new_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+            return 500, {'error': "Compile worker crashed"}
+        finally:
+            self.pending -= 1
+
+    def metrics(self):
+        """Get queue depth, counters and latency percentiles in milliseconds."""
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 3)
+
+        return {
+            'workers': self.workers,
+            'pending': self.pending,
+            'running': min(self.pending, self.workers),
+            'queue_depth': max(0, self.pending - self.workers),
+            'max_pending': self.max_pending,
+            'inflight_sources': len(self.inflight),
+            'counters': dict(self.counters),
+            'latency_ms': {'p50': percentile(50), 'p90': percentile(90), 'p99': percentile(99)},
+        }
+
+    # HTTP
+
+    async def handle_connection(self, reader, writer):
+        try:
+            status, payload, headers = await self._handle_request(reader)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            status, payload, headers = 400, {'error': "Malformed request"}, {}
+        body = json.dumps(payload).encode('utf-8')
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                'Content-Type: application/json',
+                f'Content-Length: {len(body)}',
+                'Connection: close']
+        head.extend(f'{name}: {value}' for name, value in headers.items())
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader):
+        request_head = await reader.readuntil(b'\r\n\r\n')
+        lines = request_head.decode('latin-1').split('\r\n')
+        method, path, _ = lines[0].split(' ', 2)
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics(), {}
+        if method != 'POST' or path != '/compile':
+            return 404, {'error': f"No route for {method} {path}"}, {}
+
+        length = int(headers.get('content-length', 0))
+        if length > MAX_BODY_SIZE:
+            return 413, {'error': f"Request body larger than {MAX_BODY_SIZE} bytes"}, {}
+        body = await reader.readexactly(length)
+        try:
+            code = json.loads(body)['code']
+        except (ValueError, KeyError, TypeError):
+            return 400, {'error': "Expected a JSON body with a 'code' string"}, {}
+        if not isinstance(code, str):
+            return 400, {'error': "Expected a JSON body with a 'code' string"}, {}
+
+        status, payload = await self.compile(code)
+        return status, payload, {'Retry-After': '1'} if status == 429 else {}
+
+    async def serve(self, host='127.0.0.1', port=8080):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Asyncio compile server")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8080)
+    arg_parser.add_argument('--workers', type=int, default=None)
+    arg_parser.add_argument('--queue', type=int, default=64, help="Maximum pending compilations")
+    arg_parser.add_argument('--cpu-limit', type=float, default=2.0, help="CPU seconds per compilation")
+    args = arg_parser.parse_args()
+
+    server = CompileServer(args.workers, args.queue, args.cpu_limit)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
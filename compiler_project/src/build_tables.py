@@ -0,0 +1,59 @@
+"""
+Regenerate the precomputed lexer and parser tables shipped in src/.
+
+Lexer() and Parser() only read src/lextab.py, src/lrtab.py (LRDriver's
+integer tables) and src/parsetab.py (PLY's, for error recovery); run this
+after changing token rules or the grammar:
+
+    python -m src.build_tables [--debug]
+
+--debug also writes the LALR state dump to src/parser.out.
+"""
+import argparse
+import os
+
+from ply import lex, yacc
+
+from .lexer import Lexer, rules_digest
+from .lr_driver import LRTables
+from .parser import Parser, grammar_digest
+
+TABLES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _remove(*names):
+    for name in names:
+        path = os.path.join(TABLES_DIR, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def build_lextab():
+    """Write src/lextab.py and stamp it with the checksum of the rules it came from."""
+    _remove('lextab.py')
+    # With optimize set and no table to read, PLY builds one and writes it
+    lex.lex(module=Lexer(), optimize=True, lextab='lextab', outputdir=TABLES_DIR)
+    with open(os.path.join(TABLES_DIR, 'lextab.py'), 'a') as file:
+        file.write(f"_rules_digest = {rules_digest()!r}\n")
+
+
+def build_parsetab(debug=False):
+    """Write src/parsetab.py and src/lrtab.py, and src/parser.out with debug."""
+    _remove('parsetab.py', 'lrtab.py')
+    lr_parser = yacc.yacc(module=Parser(), debug=debug, debugfile='parser.out', write_tables=True,
+                          outputdir=TABLES_DIR)
+    with open(os.path.join(TABLES_DIR, 'lrtab.py'), 'w') as file:
+        file.write(LRTables(lr_parser).to_source(grammar_digest()))
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Regenerate src/lextab.py and src/parsetab.py")
+    arg_parser.add_argument('--debug', action='store_true', help="Also write src/parser.out")
+    args = arg_parser.parse_args(argv)
+    build_lextab()
+    build_parsetab(args.debug)
+    print(f"Wrote tables to {TABLES_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,599 @@
+"""
+Native backend: translate a checked AST into portable C and build it with `cc`.
+
+The generated translation unit is plain C99 and is built either as an
+executable (the default; each run is a fresh process, so a crash can't
+take the caller down) or as a shared object called in-process through
+ctypes. Builds are cached by a digest of the generated C plus the compiler
+and flags, so a program is only compiled once per cache directory:
+
+    program = compile_native(ast)
+    program.run('main', [10])
+    program.globals
+
+`int` is a 64-bit `long long` (wrapping on overflow, where the other
+execution paths have unbounded integers), `float` is `double`, `char` and
+`boolean` are small integers converted back on the Python side. Division
+truncates toward zero and division by zero and array indices outside the
+declared size fail with the same messages as the interpreter. Operands are
+evaluated left to right like everywhere else: where C leaves the order
+open and an operand has side effects, the earlier operands are stored in
+temporaries first.
+"""
+import ctypes
+import os
+import shutil
+import subprocess
+import tempfile
+
+from .artifact import source_digest
+from .interpreter import DECLARATIONS_ONLY, ExecutionError
+
+DEFAULT_FLAGS = ('-std=c99', '-O2', '-fwrapv')
+
+# Exit status the generated main() uses for a run-time error
+_RUNTIME_ERROR = 3
+
+_C_TYPES = {'int': 'long long', 'float': 'double', 'char': 'char', 'boolean': 'int'}
+_CTYPES = {'int': ctypes.c_longlong, 'float': ctypes.c_double, 'char': ctypes.c_char, 'boolean': ctypes.c_int}
+_LITERALS = ('number', 'char', 'boolean')
+
+_RUNTIME = r"""#include <setjmp.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+static jmp_buf cl_trap;
+static char cl_message[256];
+
+static void cl_fail(const char *message) {
+    snprintf(cl_message, sizeof cl_message, "%s", message);
+    longjmp(cl_trap, 1);
+}
+
+static long long cl_index(long long index, long long size, const char *name) {
+    if (index < 0 || index >= size) {
+        snprintf(cl_message, sizeof cl_message,
+                 "Array index %lld out of bounds for '%s' of size %lld", index, name, size);
+        longjmp(cl_trap, 1);
+    }
+    return index;
+}
+
+static long long cl_idiv(long long left, long long right) {
+    if (right == 0) cl_fail("Division by zero");
+    return left / right;
+}
+
+static double cl_fdiv(double left, double right) {
+    if (right == 0) cl_fail("Division by zero");
+    return left / right;
+}
+
+const char *cl_error(void) {
+    return cl_message;
+}
+"""
+
+
+class NativeBuildError(Exception):
+    """Raised when the system C compiler can't be found or rejects the generated source."""
+    pass
+
+
+def decode_value(type, value):
+    """Convert a scalar read back from C to the value the interpreter would hold."""
+    if type == 'char':
+        return chr(value & 0xff) if isinstance(value, int) else value.decode('latin-1')
+    if type == 'boolean':
+        return bool(value)
+    return value
+
+
+def _parse_value(type, text):
+    if type == 'float':
+        return float.fromhex(text)
+    return decode_value(type, int(text))
+
+
+class CCodeGenerator:
+    """Translate a checked AST into a C translation unit.
+
+    Names are mangled like the Python backend's (`f_`, `g_`, `v_` with a
+    suffix for shadowed locals). Array parameters are passed as a pointer
+    and a length so indexing them stays checked. Every function with scalar
+    parameters gets an exported `cl_call_<name>` wrapper that traps run-time
+    errors and returns nonzero on failure; `cl_reset` zeroes the globals.
+    Accesses whose node id is in `safe_accesses` are indexed unchecked.
+    """
+
+    def __init__(self, safe_accesses=None):
+        self.safe_accesses = safe_accesses or set()
+        self.lines = []
+        self.functions = {}
+        self.global_scope = {}
+        self.global_decls = []
+        self.scopes = []
+        self.used_names = set()
+        self.temporaries = []  # (C type, name) for the current function
+
+    def generate(self, ast):
+        """Generate the C source for a program AST."""
+        if ast is None:
+            raise ExecutionError("Cannot execute a program that failed to parse")
+        self.lines = [_RUNTIME]
+        self.functions = {}
+        self.global_scope = {}
+        self.global_decls = []
+
+        for decl in ast[1]:
+            if decl[0] == 'fun_decl':
+                params = [] if decl[3] == 'void' else decl[3]
+                self.functions[decl[2]] = (decl[1], params)
+            elif decl[0] in ('var_decl', 'array_decl'):
+                c_name = f'g_{decl[2]}'
+                size = decl[3] if decl[0] == 'array_decl' else None
+                self.global_scope[decl[2]] = (c_name, decl[1], size)
+                self.global_decls.append(decl)
+            elif decl[0] not in DECLARATIONS_ONLY:
+                raise ExecutionError(f"Cannot execute node '{decl[0]}'")
+
+        for decl in self.global_decls:
+            c_name, type, size = self.global_scope[decl[2]]
+            suffix = f'[{size}]' if size is not None else ''
+            self.lines.append(f'{_C_TYPES[type]} {c_name}{suffix};')
+        self.lines.append('')
+        for name in self.functions:
+            self.lines.append(f'static {self._signature(name)};')
+        self.lines.append('')
+
+        for decl in ast[1]:
+            if decl[0] == 'fun_decl':
+                self._function(decl)
+        self._reset()
+        for name in self.functions:
+            self._wrapper(name)
+        self._main()
+        return '\n'.join(self.lines) + '\n'
+
+    # Declarations
+
+    def _return_type(self, fun_type):
+        return 'void' if fun_type == 'void' else _C_TYPES[fun_type]
+
+    def _param_list(self, params, names=None):
+        parts = []
+        for k, param in enumerate(params):
+            name = names[k] if names else f'v_{param[2]}'
+            if param[0] == 'array_param':
+                parts.append(f'{_C_TYPES[param[1]]} *{name}, long long {name}_len')
+            else:
+                parts.append(f'{_C_TYPES[param[1]]} {name}')
+        return ', '.join(parts) or 'void'
+
+    def _signature(self, name, names=None):
+        fun_type, params = self.functions[name]
+        return f'{self._return_type(fun_type)} f_{name}({self._param_list(params, names)})'
+
+    def _declare_local(self, name, type, size=None, is_param=False):
+        c_name = f'v_{name}'
+        counter = 1
+        while c_name in self.used_names:
+            counter += 1
+            c_name = f'v_{name}_{counter}'
+        self.used_names.add(c_name)
+        self.used_names.add(f'{c_name}_len')
+        if is_param and type.startswith('array_'):
+            size = f'{c_name}_len'
+        self.scopes[-1][name] = (c_name, type[len('array_'):] if type.startswith('array_') else type, size)
+        return c_name
+
+    def _resolve(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        if name in self.global_scope:
+            return self.global_scope[name]
+        raise ExecutionError(f"Variable '{name}' not declared")
+
+    def _function(self, node):
+        fun_type, fun_name, body = node[1], node[2], node[4]
+        self.scopes = [{}]
+        self.used_names = set()
+        self.temporaries = []
+
+        names = []
+        for param in self.functions[fun_name][1]:
+            type = f'array_{param[1]}' if param[0] == 'array_param' else param[1]
+            names.append(self._declare_local(param[2], type, is_param=True))
+
+        self.lines.append(f'static {self._signature(fun_name, names)} {{')
+        body_lines = []
+        self._compound(body, body_lines, 1)
+        for c_type, name in self.temporaries:
+            self._emit(self.lines, 1, f'{c_type} {name};')
+        self.lines.extend(body_lines)
+        if fun_type != 'void':
+            self._emit(self.lines, 1, 'return 0;')  # The zero value, like the other engines
+        self.lines.append('}')
+        self.lines.append('')
+        self.scopes = []
+
+    def _reset(self):
+        self.lines.append('void cl_reset(void) {')
+        for decl in self.global_decls:
+            c_name = f'g_{decl[2]}'
+            if decl[0] == 'array_decl':
+                self._emit(self.lines, 1, f'memset({c_name}, 0, sizeof {c_name});')
+            else:
+                self._emit(self.lines, 1, f'{c_name} = 0;')
+        self.lines.append('}')
+        self.lines.append('')
+
+    def _callable(self, name):
+        """Whether an entry point can be called with values from outside (no array parameters)."""
+        return all(param[0] == 'param' for param in self.functions[name][1])
+
+    def _wrapper(self, name):
+        if not self._callable(name):
+            return
+        fun_type, params = self.functions[name]
+        args = [f'a{k}' for k in range(len(params))]
+        parts = [f'{_C_TYPES[param[1]]} a{k}' for k, param in enumerate(params)]
+        call = f"f_{name}({', '.join(args)})"
+        if fun_type != 'void':
+            parts.append(f'{_C_TYPES[fun_type]} *result')
+            call = f'*result = {call}'
+        self.lines.append(f"int cl_call_{name}({', '.join(parts) or 'void'}) {{")
+        self._emit(self.lines, 1, 'if (setjmp(cl_trap)) return 1;')
+        self._emit(self.lines, 1, f'{call};')
+        self._emit(self.lines, 1, 'return 0;')
+        self.lines.append('}')
+        self.lines.append('')
+
+    def _main(self):
+        """Emit main(): `program ENTRY ARGS...` prints the result and every global."""
+        out = ['#ifdef CL_MAIN', 'int main(int argc, char **argv) {',
+               '    int failed = 1;', '    if (argc < 2) return 2;']
+        parse = {'int': 'strtoll({}, NULL, 10)', 'float': 'strtod({}, NULL)',
+                 'char': '(char)strtol({}, NULL, 10)', 'boolean': '(int)strtol({}, NULL, 10)'}
+        show = {'int': '" %lld", {}', 'float': '" %a", {}', 'char': '" %d", (int){}', 'boolean': '" %d", {}'}
+        for name, (fun_type, params) in self.functions.items():
+            if not self._callable(name):
+                continue
+            args = [parse[param[1]].format(f'argv[{k + 2}]') for k, param in enumerate(params)]
+            out.append(f'    if (strcmp(argv[1], "{name}") == 0) {{')
+            out.append(f'        if (argc != {len(params) + 2}) return 2;')
+            if fun_type == 'void':
+                out.append(f"        failed = cl_call_{name}({', '.join(args)});")
+                out.append('        if (!failed) printf("result\\n");')
+            else:
+                args.append('&result')
+                out.append(f'        {_C_TYPES[fun_type]} result;')
+                out.append(f"        failed = cl_call_{name}({', '.join(args)});")
+                out.append(f'        if (!failed) printf("result"{show[fun_type].format("result")});')
+                out.append('        if (!failed) printf("\\n");')
+            out.append('    }')
+        out.append(f'    if (failed) {{ fprintf(stderr, "%s\\n", cl_error()); return {_RUNTIME_ERROR}; }}')
+        for decl in self.global_decls:
+            c_name, type, size = self.global_scope[decl[2]]
+            out.append(f'    printf("global {decl[2]}");')
+            if size is None:
+                out.append(f'    printf({show[type].format(c_name)});')
+            else:
+                out.append(f'    for (long long i = 0; i < {size}; i++) printf({show[type].format(c_name + "[i]")});')
+            out.append('    printf("\\n");')
+        out += ['    return 0;', '}', '#endif']
+        self.lines.extend(out)
+
+    # Statements
+
+    def _emit(self, out, level, text):
+        out.append('    ' * level + text)
+
+    def _compound(self, node, out, level):
+        self.scopes.append({})
+        for decl in node[1]:
+            size = decl[3] if decl[0] == 'array_decl' else None
+            c_name = self._declare_local(decl[2], decl[1], size)
+            if size is None:
+                self._emit(out, level, f'{_C_TYPES[decl[1]]} {c_name} = 0;')
+            else:
+                self._emit(out, level, f'{_C_TYPES[decl[1]]} {c_name}[{size}] = {{0}};')
+        for stmt in node[2]:
+            self._statement(stmt, out, level)
+        self.scopes.pop()
+
+    def _statement(self, node, out, level):
+        kind = node[0]
+        if kind == 'compound_stmt':
+            self._emit(out, level, '{')
+            self._compound(node, out, level + 1)
+            self._emit(out, level, '}')
+        elif kind == 'expr_stmt':
+            self._emit(out, level, f'{self._expression(node[1])[0]};')
+        elif kind == 'empty_stmt':
+            self._emit(out, level, ';')
+        elif kind == 'if_stmt':
+            self._emit(out, level, f'if ({self._expression(node[1])[0]}) {{')
+            self._statement(node[2], out, level + 1)
+            self._emit(out, level, '}')
+        elif kind == 'if_else_stmt':
+            self._emit(out, level, f'if ({self._expression(node[1])[0]}) {{')
+            self._statement(node[2], out, level + 1)
+            self._emit(out, level, '} else {')
+            self._statement(node[3], out, level + 1)
+            self._emit(out, level, '}')
+        elif kind == 'while_stmt':
+            self._emit(out, level, f'while ({self._expression(node[1])[0]}) {{')
+            self._statement(node[2], out, level + 1)
+            self._emit(out, level, '}')
+        elif kind == 'return_stmt':
+            if node[1] is None:
+                self._emit(out, level, 'return;')
+            else:
+                self._emit(out, level, f'return {self._expression(node[1])[0]};')
+        else:
+            raise ExecutionError(f"Cannot execute node '{kind}'")
+
+    # Expressions
+
+    def _temporary(self, type):
+        name = f'cl_t{len(self.temporaries) + 1}'
+        self.temporaries.append((_C_TYPES[type], name))
+        return name
+
+    def _ordered(self, nodes):
+        """Get (setup, [(code, type), ...]) for operands C may evaluate in any order.
+
+        An operand is stored in a temporary by `setup`, a comma-separated
+        prefix, when a later operand has side effects or when it has side
+        effects and a later operand reads anything, so side effects happen
+        left to right.
+        """
+        compiled = [self._expression(node) for node in nodes]
+        setup, operands = [], []
+        for k, (node, (code, type)) in enumerate(zip(nodes, compiled)):
+            later = nodes[k + 1:]
+            if node[0] in _LITERALS or not (
+                    any(_has_effects(other) for other in later)
+                    or (_has_effects(node) and any(other[0] not in _LITERALS for other in later))):
+                operands.append((code, type))
+                continue
+            temp = self._temporary(type)
+            setup.append(f'{temp} = {code}, ')
+            operands.append((temp, type))
+        return ''.join(setup), operands
+
+    def _element(self, node):
+        """Return the (C lvalue, element type) of an array_access node."""
+        c_name, element_type, size = self._resolve(node[1])
+        index = node[2]
+        if index[0] == 'number' and index[1].__class__ is int and isinstance(size, int) and 0 <= index[1] < size:
+            return f'{c_name}[{index[1]}]', element_type
+        index_code = self._expression(index)[0]
+        if id(node) in self.safe_accesses:
+            return f'{c_name}[{index_code}]', element_type
+        return f'{c_name}[cl_index({index_code}, {size}, "{node[1]}")]', element_type
+
+    def _expression(self, node):
+        """Return the (code, type) pair for an expression."""
+        kind = node[0]
+        if kind == 'number':
+            if node[1].__class__ is int:
+                return f'{node[1]}LL', 'int'
+            return repr(node[1]), 'float'
+        if kind == 'char':
+            return str(ord(node[1])), 'char'
+        if kind == 'boolean':
+            return ('1' if node[1] == 'true' else '0'), 'boolean'
+        if kind == 'var':
+            c_name, var_type, _ = self._resolve(node[1])
+            return c_name, var_type
+        if kind == 'array_access':
+            return self._element(node)
+        if kind == 'assign':
+            target, value = node[1], node[2]
+            value_code, value_type = self._expression(value)
+            if target[0] != 'array_access':
+                target_code, target_type, _ = self._resolve(target[1])
+                return f'({target_code} = {value_code})', target_type
+            target_code, target_type = self._element(target)
+            if value[0] not in _LITERALS and (_has_effects(value) or _has_effects(target[2])):
+                temp = self._temporary(value_type)  # The value first, then the index
+                return f'({temp} = {value_code}, {target_code} = {temp})', target_type
+            return f'({target_code} = {value_code})', target_type
+        if kind == 'call':
+            if node[1] not in self.functions:
+                raise ExecutionError(f"Function '{node[1]}' not declared")
+            fun_type, params = self.functions[node[1]]
+            if len(params) != len(node[2]):
+                raise ExecutionError(f"Wrong number of arguments for function '{node[1]}'")
+            scalars = [arg for param, arg in zip(params, node[2]) if param[0] != 'array_param']
+            setup, operands = self._ordered(scalars)
+            codes = iter(code for code, _ in operands)
+            args = []
+            for param, arg in zip(params, node[2]):
+                if param[0] == 'array_param':
+                    c_name, _, size = self._resolve(arg[1])
+                    args.append(f'{c_name}, {size}')
+                else:
+                    args.append(next(codes))
+            call = f"f_{node[1]}({', '.join(args)})"
+            return (f'({setup}{call})' if setup else call), fun_type
+        if kind in ('and', 'or'):
+            left = self._expression(node[1])[0]
+            right = self._expression(node[2])[0]
+            return f"({left} {'&&' if kind == 'and' else '||'} {right})", 'boolean'
+        if kind == 'relop':
+            setup, ((left, _), (right, _)) = self._ordered([node[2], node[3]])
+            return f'({setup}{left} {node[1]} {right})', 'boolean'
+        if kind in ('addop', 'mulop'):
+            setup, ((left, left_type), (right, right_type)) = self._ordered([node[2], node[3]])
+            result_type = 'float' if 'float' in (left_type, right_type) else 'int'
+            if node[1] == '/':
+                code = f"cl_{'f' if result_type == 'float' else 'i'}div({left}, {right})"
+                return (f'({setup}{code})' if setup else code), result_type
+            return f'({setup}{left} {node[1]} {right})', result_type
+        raise ExecutionError(f"Cannot evaluate node '{kind}'")
+
+
+def _has_effects(node):
+    """Whether evaluating an expression can change a variable: it calls or assigns."""
+    if node[0] in ('call', 'assign'):
+        return True
+    return any(_has_effects(child) for child in node[1:] if isinstance(child, tuple))
+
+
+def default_cache_dir():
+    """Get the build cache directory from COMPILER_CACHE_DIR, or a per-user default."""
+    cache_dir = os.environ.get('COMPILER_CACHE_DIR')
+    if not cache_dir:
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'compiler', 'native')
+    return cache_dir
+
+
+class NativeBuilder:
+    """Builds generated C with the system compiler, caching outputs by digest.
+
+    The cache key covers the C source, the compiler and its flags, so
+    changing any of them builds afresh; outputs are written under a
+    temporary name and renamed into place, so concurrent builds of the same
+    program never see a partial file.
+    """
+
+    def __init__(self, cache_dir=None, cc=None, flags=DEFAULT_FLAGS):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.cc = cc or os.environ.get('CC', 'cc')
+        self.flags = tuple(flags)
+        self.builds = 0  # Cache misses that ran the compiler
+
+    def build(self, source, kind='executable'):
+        """Get the path of the built program, compiling it only on a cache miss."""
+        if kind not in ('executable', 'shared'):
+            raise ValueError(f"Unknown build kind {kind!r}")
+        if kind == 'shared':
+            flags = self.flags + ('-shared', '-fPIC')
+        else:
+            flags = self.flags + ('-DCL_MAIN',)
+        digest = source_digest('\0'.join((self.cc,) + flags + (source,)))
+        path = os.path.join(self.cache_dir, f"{digest}{'.so' if kind == 'shared' else ''}")
+        if os.path.exists(path):
+            return path
+
+        if shutil.which(self.cc) is None:
+            raise NativeBuildError(f"C compiler '{self.cc}' not found")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.cache_dir) as build_dir:
+            c_path = os.path.join(build_dir, 'program.c')
+            with open(c_path, 'w') as file:
+                file.write(source)
+            out_path = os.path.join(build_dir, 'program.out')
+            completed = subprocess.run([self.cc, *flags, '-o', out_path, c_path],
+                                       capture_output=True, text=True)
+            if completed.returncode != 0:
+                raise NativeBuildError(f"{self.cc} failed:\n{completed.stderr.strip()}")
+            os.replace(out_path, path)
+        self.builds += 1
+        return path
+
+
+class NativeProgram:
+    """A program compiled to native code, run as a subprocess or in-process.
+
+    With kind='executable' every run starts a fresh process; with
+    kind='shared' the object is loaded once with ctypes and globals are
+    zeroed before each run.
+    """
+
+    def __init__(self, source, generator, path, kind):
+        self.source = source
+        self.path = path
+        self.kind = kind
+        self.functions = generator.functions
+        self.global_scope = generator.global_scope
+        self._globals = {}
+        self._library = ctypes.CDLL(path) if kind == 'shared' else None
+
+    @property
+    def globals(self):
+        """Current values of the global variables."""
+        if self._library is None:
+            return dict(self._globals)
+        values = {}
+        for name, (c_name, type, size) in self.global_scope.items():
+            if size is None:
+                values[name] = decode_value(type, _CTYPES[type].in_dll(self._library, c_name).value)
+            else:
+                array = (_CTYPES[type] * size).in_dll(self._library, c_name)
+                values[name] = [decode_value(type, value) for value in array]
+        return values
+
+    def _check_entry(self, entry, args):
+        if entry not in self.functions:
+            raise ExecutionError(f"Function '{entry}' not declared")
+        fun_type, params = self.functions[entry]
+        if len(params) != len(args):
+            raise ExecutionError(f"Wrong number of arguments for function '{entry}'")
+        if any(param[0] == 'array_param' for param in params):
+            raise ExecutionError(f"Function '{entry}' takes an array and can't be a native entry point")
+        return fun_type, params
+
+    def run(self, entry='main', args=None):
+        """Run the program from a fresh global state and return the entry function's result."""
+        args = list(args or [])
+        fun_type, params = self._check_entry(entry, args)
+        if self._library is not None:
+            return self._call(entry, fun_type, params, args)
+
+        argv = [self.path, entry]
+        for param, arg in zip(params, args):
+            if param[1] == 'float':
+                argv.append(float(arg).hex())
+            elif param[1] == 'char':
+                argv.append(str(ord(arg)))
+            else:
+                argv.append(str(int(arg)))
+        completed = subprocess.run(argv, capture_output=True, text=True)
+        if completed.returncode == _RUNTIME_ERROR:
+            raise ExecutionError(completed.stderr.strip())
+        if completed.returncode != 0:
+            raise ExecutionError(f"Native program exited with status {completed.returncode}")
+
+        result = None
+        self._globals = {}
+        for line in completed.stdout.splitlines():
+            fields = line.split()
+            if fields[0] == 'result':
+                result = _parse_value(fun_type, fields[1]) if len(fields) > 1 else None
+            else:
+                name = fields[1]
+                _, type, size = self.global_scope[name]
+                values = [_parse_value(type, field) for field in fields[2:]]
+                self._globals[name] = values[0] if size is None else values
+        return result
+
+    def _call(self, entry, fun_type, params, args):
+        self._library.cl_reset()
+        function = getattr(self._library, f'cl_call_{entry}')
+        function.restype = ctypes.c_int
+        c_args = []
+        for param, arg in zip(params, args):
+            if param[1] == 'char':
+                arg = arg.encode('latin-1')
+            c_args.append(_CTYPES[param[1]](arg))
+        result = _CTYPES[fun_type]() if fun_type != 'void' else None
+        if result is not None:
+            c_args.append(ctypes.byref(result))
+        if function(*c_args):
+            self._library.cl_error.restype = ctypes.c_char_p
+            raise ExecutionError(self._library.cl_error().decode('utf-8'))
+        return None if result is None else decode_value(fun_type, result.value)
+
+
+def compile_native(ast, kind='executable', builder=None, safe_accesses=None):
+    """Translate a checked AST to C, build it (or reuse a cached build) and load it."""
+    generator = CCodeGenerator(safe_accesses)
+    source = generator.generate(ast)
+    path = (builder or NativeBuilder()).build(source, kind)
+    return NativeProgram(source, generator, path, kind)
@@ -0,0 +1,216 @@
+"""
+Compile-time evaluation of calls to pure functions.
+
+A function is pure when it reads and writes only its own parameters and
+locals: it touches no global variable or array, takes no array parameter
+(the caller's array could change between calls) and only calls functions
+that are pure themselves. Purity is found over the call graph by assuming
+every defined function pure and removing impure ones until nothing
+changes, so mutually recursive pure functions stay pure.
+
+PureCallFolder replaces a call to a pure function whose arguments are all
+constant by the literal it returns. Arguments are constant when they are
+literals, or when range analysis proved an `int` argument can only hold one
+value at that call site (`number = 5; factorial(number)`). Evaluation runs
+the reference interpreter under a step budget and a deadline, so a
+non-terminating or expensive call is simply left alone, and every pure call
+made along the way is memoized by (function, arguments). Calls that would
+fail at run time (division by zero, a bad index) are left for the run time
+to report.
+
+    folded_ast, folder = fold_pure_calls(ast)
+"""
+import time
+
+from .interpreter import ExecutionError, Interpreter
+from .range_analysis import RangeAnalyzer, is_pure
+
+DEFAULT_MAX_STEPS = 200000
+DEFAULT_MAX_SECONDS = 0.5
+
+# Results that fit the backends: C `long long` for ints
+_INT_MIN, _INT_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+class BudgetExceeded(Exception):
+    """Raised inside the evaluator when a call runs past its step or time budget."""
+    pass
+
+
+class _Evaluator(Interpreter):
+    """An interpreter that counts statements and memoizes pure calls."""
+
+    def __init__(self, ast, memo):
+        super().__init__(ast)
+        self.memo = memo
+        self.steps = 0
+        self.max_steps = 0
+        self.deadline = 0.0
+
+    def evaluate_call(self, fun_name, args, max_steps, max_seconds):
+        self.steps = 0
+        self.max_steps = max_steps
+        self.deadline = time.perf_counter() + max_seconds
+        return self.call(fun_name, args)
+
+    def call(self, fun_name, args):
+        key = (fun_name, tuple((arg.__class__, arg) for arg in args))  # Keep 1, 1.0 and true apart
+        if key in self.memo:
+            return self.memo[key]
+        value = super().call(fun_name, args)
+        self.memo[key] = value
+        return value
+
+    def execute(self, node):
+        self.steps += 1
+        if self.steps > self.max_steps or (not self.steps & 1023 and time.perf_counter() > self.deadline):
+            raise BudgetExceeded()
+        super().execute(node)
+
+
+def _literal(value):
+    """Get the AST literal for a value, or None if it can't be written as one."""
+    if value.__class__ is bool:
+        return ('boolean', 'true' if value else 'false')
+    if value.__class__ is int:
+        return ('number', value) if _INT_MIN <= value <= _INT_MAX else None
+    if value.__class__ is float:
+        return ('number', value) if value - value == 0 else None  # Not inf or nan
+    if value.__class__ is str and len(value) == 1:
+        return ('char', value)
+    return None
+
+
+def _constant(node):
+    """Get the value of a literal node, or raise ValueError."""
+    if node[0] in ('number', 'char'):
+        return node[1]
+    if node[0] == 'boolean':
+        return node[1] == 'true'
+    raise ValueError(node[0])
+
+
+class PureCallFolder:
+    """Finds pure functions and folds their constant calls out of an AST."""
+
+    def __init__(self, ast, max_steps=DEFAULT_MAX_STEPS, max_seconds=DEFAULT_MAX_SECONDS):
+        self.ast = ast
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+        self.functions = {decl[2]: decl for decl in ast[1] if decl[0] == 'fun_decl'}
+        self.calls = {}  # function -> names it calls
+        self.pure = self._find_pure()
+        self.memo = {}  # (function, args) -> value
+        self.folds = []  # (function, args, value) for every call folded
+        self.rejected = 0  # Constant calls left in place: over budget, failing, or no literal result
+        self._evaluator = None
+        self._arguments = {}
+
+    # Purity
+
+    def _find_pure(self):
+        pure = set()
+        for name, decl in self.functions.items():
+            params = [] if decl[3] == 'void' else decl[3]
+            callees = set()
+            if (all(param[0] == 'param' for param in params)
+                    and self._touches_only_locals(decl[4], [{param[2] for param in params}], callees)):
+                pure.add(name)
+            self.calls[name] = callees
+
+        changed = True
+        while changed:
+            changed = False
+            for name in list(pure):
+                if not self.calls[name] <= pure:
+                    pure.discard(name)
+                    changed = True
+        return pure
+
+    def _touches_only_locals(self, node, scopes, callees):
+        """Walk a function body; False as soon as a name resolves to a global."""
+        kind = node[0]
+        if kind == 'compound_stmt':
+            scopes.append({decl[2] for decl in node[1]})
+            try:
+                return all(self._touches_only_locals(stmt, scopes, callees) for stmt in node[2])
+            finally:
+                scopes.pop()
+        if kind in ('var', 'array_access'):
+            if not any(node[1] in scope for scope in scopes):
+                return False
+            return kind == 'var' or self._touches_only_locals(node[2], scopes, callees)
+        if kind == 'call':
+            callees.add(node[1])
+            return all(self._touches_only_locals(arg, scopes, callees) for arg in node[2])
+        return all(self._touches_only_locals(child, scopes, callees)
+                   for child in node[1:] if isinstance(child, tuple))
+
+    # Folding
+
+    def fold(self):
+        """Get a copy of the AST with constant pure calls replaced by their values.
+
+        Subtrees without a folded call are shared with the original AST, so
+        positions and other id()-keyed tables still apply to them.
+        """
+        bounds = RangeAnalyzer()
+        bounds.analyze(self.ast)
+        self._arguments = bounds.arguments
+        self._evaluator = _Evaluator(self.ast, self.memo)
+        return self._fold(self.ast)
+
+    def _fold(self, node):
+        original = id(node)
+        children = []
+        changed = False
+        for child in node[1:]:
+            if isinstance(child, tuple):
+                folded = self._fold(child)
+            elif isinstance(child, list):
+                folded = [self._fold(item) if isinstance(item, tuple) else item for item in child]
+                if all(a is b for a, b in zip(folded, child)):
+                    folded = child
+            else:
+                folded = child
+            changed = changed or folded is not child
+            children.append(folded)
+        if changed:
+            node = (node[0],) + tuple(children)
+        if node[0] == 'call' and node[1] in self.pure:
+            return self._fold_call(node, self._arguments.get(original)) or node
+        return node
+
+    def _fold_call(self, node, intervals):
+        fun_type = self.functions[node[1]][1]
+        if fun_type == 'void':
+            return None
+        args = []
+        for k, arg in enumerate(node[2]):
+            try:
+                args.append(_constant(arg))
+                continue
+            except ValueError:
+                pass
+            # Not a literal; range analysis may still have pinned it to one int
+            if intervals is None or not is_pure(arg) or intervals[k][0] != intervals[k][1]:
+                return None
+            args.append(intervals[k][0])
+
+        try:
+            value = self._evaluator.evaluate_call(node[1], args, self.max_steps, self.max_seconds)
+        except (BudgetExceeded, ExecutionError, RecursionError, TypeError):
+            self.rejected += 1
+            return None
+        literal = None if value is None else _literal(value)
+        if literal is None:
+            self.rejected += 1
+            return None
+        self.folds.append((node[1], tuple(args), value))
+        return literal
+
+
+def fold_pure_calls(ast, max_steps=DEFAULT_MAX_STEPS, max_seconds=DEFAULT_MAX_SECONDS):
+    """Fold the constant pure calls of a checked AST; returns (new AST, folder)."""
+    folder = PureCallFolder(ast, max_steps, max_seconds)
+    return folder.fold(), folder
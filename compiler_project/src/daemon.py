@@ -0,0 +1,307 @@
+"""
+Persistent compile daemon on a Unix domain socket.
+
+The daemon pays for PLY, the lexer regexes and the parse tables once and
+keeps a warm CompileEngine resident; the client side of this module only
+imports the standard library, so a compile costs one interpreter start
+plus a socket round trip.
+
+    python -m src.daemon serve &
+    python -m src.daemon compile examples/test.c
+    python -m src.daemon stop
+
+Frames are a 4-byte big-endian length followed by that many bytes of
+UTF-8 JSON. Requests are {"op": "compile", "code": "..."}, {"op": "ping"},
+{"op": "stats"} or {"op": "shutdown"}; every response carries "ok".
+"""
+import argparse
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+_LENGTH = struct.Struct('>I')
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+class DaemonError(Exception):
+    """Raised when the daemon can't be reached or a frame is malformed."""
+    pass
+
+
+def default_socket_path():
+    """Get the socket path from COMPILER_SOCKET, or a per-user default."""
+    socket_path = os.environ.get('COMPILER_SOCKET')
+    if not socket_path:
+        import tempfile
+        socket_path = os.path.join(tempfile.gettempdir(), f'compiler-{os.getuid()}.sock')
+    return socket_path
+
+
+def send_frame(sock, message):
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _recv_exactly(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise DaemonError("Connection closed mid-frame")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_frame(sock):
+    """Read one frame, or return None if the peer closed the connection between frames."""
+    head = sock.recv(_LENGTH.size, socket.MSG_WAITALL)
+    if not head:
+        return None
+    if len(head) != _LENGTH.size:
+        raise DaemonError("Connection closed mid-frame")
+    length, = _LENGTH.unpack(head)
+    if length > MAX_FRAME_SIZE:
+        raise DaemonError(f"Frame of {length} bytes exceeds {MAX_FRAME_SIZE}")
+    try:
+        return json.loads(_recv_exactly(sock, length))
+    except ValueError:
+        raise DaemonError("Frame is not valid JSON")
+
+
+# Server side
+
+class CompileDaemon:
+    """Serves compile requests from one resident CompileEngine.
+
+    Each connection gets a thread so an idle client can't block others;
+    compilations themselves take turns on the engine.
+    """
+
+    def __init__(self, socket_path=None, idle_timeout=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.engine = None
+        self.engine_lock = threading.Lock()
+        self.running = False
+        self.last_activity = time.monotonic()
+        self.stats = {'requests': 0, 'compiles': 0, 'compile_seconds': 0.0, 'started': time.time()}
+
+    def _bind(self):
+        if os.path.exists(self.socket_path):
+            try:
+                DaemonClient(self.socket_path).request({'op': 'ping'})
+            except (DaemonError, OSError):
+                os.unlink(self.socket_path)  # Left behind by a daemon that died
+            else:
+                raise DaemonError(f"A daemon is already listening on {self.socket_path}")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        server.listen(16)
+        return server
+
+    def serve(self):
+        """Warm the engine and serve until a shutdown request or the idle timeout."""
+        from .service import CompileEngine
+        self.engine = CompileEngine()
+        self.engine.compile('void main(void) { }')
+
+        server = self._bind()
+        server.settimeout(0.25)  # Wake up to notice shutdown and idleness
+        self.running = True
+        self.last_activity = time.monotonic()
+        try:
+            while self.running:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    if self.idle_timeout and time.monotonic() - self.last_activity > self.idle_timeout:
+                        break
+                    continue
+                connection.settimeout(None)
+                threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+        finally:
+            server.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _serve_connection(self, connection):
+        # A client may send several requests over one connection
+        with connection:
+            while self.running:
+                try:
+                    request = recv_frame(connection)
+                    if request is None:
+                        return
+                    send_frame(connection, self.handle(request))
+                except (DaemonError, OSError):
+                    return
+
+    def handle(self, request):
+        """Answer one request message."""
+        self.stats['requests'] += 1
+        self.last_activity = time.monotonic()
+        op = request.get('op') if isinstance(request, dict) else None
+        if op == 'ping':
+            return {'ok': True, 'pid': os.getpid()}
+        if op == 'stats':
+            return {'ok': True, 'pid': os.getpid(), **self.stats}
+        if op == 'shutdown':
+            self.running = False
+            return {'ok': True}
+        if op == 'compile':
+            code = request.get('code')
+            if not isinstance(code, str):
+                return {'ok': False, 'error': "Expected a 'code' string"}
+            with self.engine_lock:
+                start = time.perf_counter()
+                try:
+                    result = self.engine.compile(code)
+                except RecursionError:
+                    return {'ok': False, 'error': "Program is nested too deeply"}
+                elapsed = time.perf_counter() - start
+                summary = result.summary()
+            self.stats['compiles'] += 1
+            self.stats['compile_seconds'] += elapsed
+            self.last_activity = time.monotonic()
+            return {'ok': True, 'compile_ms': round(elapsed * 1000, 3), **summary}
+        return {'ok': False, 'error': f"Unknown op {op!r}"}
+
+
+# Client side
+
+class DaemonClient:
+    """A connection to a running daemon."""
+
+    def __init__(self, socket_path=None, timeout=60):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self.sock = None
+
+    def connect(self):
+        if self.sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError as e:
+                sock.close()
+                raise DaemonError(f"No daemon listening on {self.socket_path}: {e}")
+            self.sock = sock
+        return self.sock
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def request(self, message):
+        sock = self.connect()
+        try:
+            send_frame(sock, message)
+            response = recv_frame(sock)
+        except OSError as e:
+            self.close()
+            raise DaemonError(str(e))
+        if response is None:
+            self.close()
+            raise DaemonError("Daemon closed the connection")
+        return response
+
+    def compile(self, code):
+        return self.request({'op': 'compile', 'code': code})
+
+
+def start_daemon(socket_path=None, idle_timeout=None, wait=10.0):
+    """Start a daemon in the background and wait until it answers."""
+    import subprocess
+    socket_path = socket_path or default_socket_path()
+    command = [sys.executable, '-m', 'src.daemon', '--socket', socket_path, 'serve']
+    if idle_timeout:
+        command += ['--idle-timeout', str(idle_timeout)]
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.Popen(command, cwd=package_root, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + wait
+    while True:
+        try:
+            with DaemonClient(socket_path) as client:
+                return client.request({'op': 'ping'})
+        except DaemonError:
+            if time.monotonic() > deadline:
+                raise DaemonError(f"Daemon didn't start on {socket_path}")
+            time.sleep(0.02)
+
+
+def _print_result(path, response):
+    for error in response['syntax_errors']:
+        print(f"{path}: {error}")
+    for error in response['semantic_errors']:
+        print(f"{path}: {error}")
+    if response['syntax_success'] and response['semantic_success']:
+        print(f"{path}: ok ({response['token_count']} tokens, {len(response['symbols'])} symbols)")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Persistent compile daemon")
+    arg_parser.add_argument('--socket', default=None, help="Socket path (default: $COMPILER_SOCKET)")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help="Run the daemon in the foreground")
+    serve.add_argument('--idle-timeout', type=float, default=None, help="Exit after this many idle seconds")
+    compile = commands.add_parser('compile', help="Compile files through the daemon")
+    compile.add_argument('files', nargs='+')
+    compile.add_argument('--json', action='store_true', help="Print the raw responses")
+    compile.add_argument('--start', action='store_true', help="Start a daemon if none is running")
+    commands.add_parser('ping', help="Check that the daemon is running")
+    commands.add_parser('stats', help="Show request counters")
+    commands.add_parser('stop', help="Shut the daemon down")
+    args = arg_parser.parse_args(argv)
+
+    if args.command == 'serve':
+        CompileDaemon(args.socket, args.idle_timeout).serve()
+        return 0
+
+    try:
+        with DaemonClient(args.socket) as client:
+            if args.command == 'compile':
+                if args.start:
+                    try:
+                        client.connect()
+                    except DaemonError:
+                        start_daemon(args.socket)
+                failed = False
+                for path in args.files:
+                    with open(path, 'r') as file:
+                        response = client.compile(file.read())
+                    if args.json:
+                        print(json.dumps(response))
+                    elif not response['ok']:
+                        print(f"{path}: {response['error']}")
+                    else:
+                        _print_result(path, response)
+                    failed = failed or not (response['ok'] and response['syntax_success']
+                                            and response['semantic_success'])
+                return 1 if failed else 0
+            if args.command == 'stop':
+                client.request({'op': 'shutdown'})
+            else:
+                print(json.dumps(client.request({'op': args.command})))
+            return 0
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
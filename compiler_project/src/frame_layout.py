@@ -0,0 +1,87 @@
+"""
+Stack frame layout for function locals.
+
+SymbolTable hands out one global, ever-increasing memory location per
+symbol. This stage assigns offsets within per-function frames instead:
+parameters and locals of a scope are packed and aligned by their type
+size, and sibling block scopes (which are never live at the same time)
+start at the same offset so they share slots. Each frame's size is the
+deepest point any scope chain reaches, so a backend can allocate a whole
+frame in one go.
+"""
+from .type_system import get_type
+
+
+class Frame:
+    """Layout of one function's frame."""
+
+    def __init__(self, function, scope):
+        self.function = function
+        self.scope = scope
+        self.size = 0
+        self.alignment = 1
+        self.slots = {}          # (name, scope) -> offset
+        self.scope_offsets = {}  # scope -> offset its first slot may start at
+
+    def __repr__(self):
+        return f"Frame({self.function}, size={self.size}, slots={len(self.slots)})"
+
+
+def storage_size(symbol):
+    """Get the bytes a symbol occupies and the alignment it needs."""
+    type = get_type(symbol.type)
+    if type is None:
+        return 0, 1
+    if symbol.kind == 'array':
+        element_size = type.element.size
+        return element_size * (symbol.attributes['size'] or symbol.size or 0), max(1, element_size)
+    return type.size, max(1, type.size)
+
+
+def _align(offset, alignment):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def layout_frames(symbol_table):
+    """Lay out a frame for every function scope in an analyzed symbol table.
+
+    Records each local's 'frame_offset' and each function's 'frame_size' in
+    the symbol attributes, and returns {function name: Frame}.
+    """
+    # Symbols per scope in declaration order, and the scope tree
+    scope_members = {}
+    for (name, scope), symbol in symbol_table.symbols.items():
+        scope_members.setdefault(scope, []).append(symbol)
+    children = {}
+    for scope in symbol_table.scope_symbols:
+        if scope != 'global':
+            children.setdefault(scope.rsplit('.', 1)[0], []).append(scope)
+
+    frames = {}
+    for scope in children.get('global', []):
+        # Function scopes are named 'global.<function>_<counter>'
+        function = scope[len('global.'):].rsplit('_', 1)[0]
+        frame = Frame(function, scope)
+        _layout_scope(frame, scope, 0, scope_members, children)
+        frame.size = _align(frame.size, frame.alignment)
+        frames[function] = frame
+
+        symbol = symbol_table.symbols.get((function, 'global'))
+        if symbol is not None and symbol.kind == 'function':
+            symbol.attributes['frame_size'] = frame.size
+    return frames
+
+
+def _layout_scope(frame, scope, offset, scope_members, children):
+    frame.scope_offsets[scope] = offset
+    for symbol in scope_members.get(scope, []):
+        size, alignment = storage_size(symbol)
+        offset = _align(offset, alignment)
+        frame.slots[(symbol.name, scope)] = offset
+        symbol.attributes['frame_offset'] = offset
+        offset += size
+        frame.alignment = max(frame.alignment, alignment)
+    frame.size = max(frame.size, offset)
+    # Siblings all start where this scope's own slots end
+    for child in sorted(children.get(scope, [])):
+        _layout_scope(frame, child, offset, scope_members, children)
@@ -0,0 +1,602 @@
+"""
+Function inlining driven by a size/benefit cost model.
+
+A call costs a frame, argument binding and a return whatever the callee
+does, so inlining saves roughly the same amount per executed call while
+the code it adds grows with the callee. The cost of a call site is the
+callee's size in AST nodes, plus for the statement form below what it adds
+around the copy: ASSIGNMENT_COST per parameter bound and value returned,
+and BLOCK_COST per block, since every block entered allocates a scope in
+the interpreter. It is inlined when that cost fits the budget:
+the threshold, multiplied by LOOP_WEIGHT for each enclosing `while` loop
+(at most MAX_LOOP_WEIGHTING levels), since calls in loops run more often.
+A callee with a loop of its own does enough work per call that the frame
+is a small part of it, so its calls only get the plain threshold. A
+threshold of 0 inlines nothing.
+
+The call graph comes from the `call` nodes. Functions that can reach
+themselves through it are never inlined, and functions are processed
+callees first, so a helper's own helpers are already inlined when it is
+inlined into its callers. A call site is inlined in one of two ways:
+
+- Expression form: a callee whose body is `return e;` (no locals, no
+  assignments) has its arguments substituted into `e` at the call. Used
+  when argument and result types match exactly and substituting doesn't
+  change what is evaluated or in which order.
+- Statement form: the callee body is copied in front of the statement
+  the call is in, after assignments of the arguments to locals standing
+  for the parameters; returns assign a result local that replaces the
+  call. Used for the call evaluated first in its statement (reads of the
+  caller's own scalars before it are fine, the callee can't change them),
+  so it doesn't move relative to anything observable. Returns must be
+  in tail position once statements after an `if` that returns are moved
+  into its else branch; a `return` inside a loop, or a value function
+  that can reach its end without one, is not inlined.
+
+Every local and parameter copied in gets a new name, `_i<n>_<name>`, which
+no source identifier can spell, so nothing in the caller's `block` scopes
+is shadowed. An array parameter is replaced by the array passed, so a
+bounds error in inlined code names the caller's array. A call is left
+alone when the caller has a local with the name of a global the callee
+uses.
+
+    inlined, inliner = inline_functions(ast, positions, threshold=40)
+    print(inliner.report())
+"""
+from .loop_opt import contains, may_fault
+
+DEFAULT_THRESHOLD = 40
+LOOP_WEIGHT = 4
+MAX_LOOP_WEIGHTING = 2
+ASSIGNMENT_COST = 3  # The expr_stmt, assign and var nodes around a bound argument or a returned value
+BLOCK_COST = 4
+
+_LITERALS = ('number', 'char', 'boolean')
+
+
+def size(node):
+    """Count the AST nodes in a tree."""
+    if isinstance(node, list):
+        return sum(size(item) for item in node)
+    if not isinstance(node, tuple):
+        return 0
+    return 1 + sum(size(child) for child in node[1:] if isinstance(child, (tuple, list)))
+
+
+def _uses(node, name):
+    """Count the reads of a scalar name in an expression."""
+    if not isinstance(node, tuple):
+        return 0
+    if node[0] == 'var':
+        return int(node[1] == name)
+    return sum(_uses(child, name) for child in node[1:] if isinstance(child, (tuple, list)))
+
+
+def _count(node, kinds):
+    """Count the nodes of the given kinds in a tree."""
+    if isinstance(node, list):
+        return sum(_count(item, kinds) for item in node)
+    if not isinstance(node, tuple):
+        return 0
+    return (node[0] in kinds) + sum(_count(child, kinds) for child in node[1:] if isinstance(child, (tuple, list)))
+
+
+def _callees(node, found):
+    if isinstance(node, list):
+        for item in node:
+            _callees(item, found)
+    elif isinstance(node, tuple):
+        if node[0] == 'call':
+            found.add(node[1])
+        for child in node[1:]:
+            if isinstance(child, (tuple, list)):
+                _callees(child, found)
+    return found
+
+
+def _always_returns(node):
+    kind = node[0]
+    if kind == 'return_stmt':
+        return True
+    if kind == 'compound_stmt':
+        return bool(node[2]) and _always_returns(node[2][-1])
+    if kind == 'if_else_stmt':
+        return _always_returns(node[2]) and _always_returns(node[3])
+    return False
+
+
+class NotInlinable(Exception):
+    """Raised while preparing a callee whose body can't be copied into a caller."""
+    pass
+
+
+class InlineDecision:
+    """Whether one call site was inlined, and why."""
+
+    def __init__(self, caller, callee, line, cost, budget, inlined, reason=None):
+        self.caller = caller
+        self.callee = callee
+        self.line = line
+        self.cost = cost
+        self.budget = budget
+        self.inlined = inlined
+        self.reason = reason
+
+    def __repr__(self):
+        state = 'inlined' if self.inlined else f'kept: {self.reason}'
+        return f"InlineDecision({self.callee} into {self.caller}, line {self.line}, {state})"
+
+
+class _Callee:
+    """A function body prepared for copying: locals renamed apart and returns in tail position."""
+
+    def __init__(self, decl, body, expression, result_type, used_globals, reason=None):
+        self.decl = decl
+        self.params = [] if decl is None or decl[3] == 'void' else decl[3]
+        self.body = body
+        self.expression = expression  # The `e` of a `{ return e; }` body, else None
+        self.result_type = result_type  # Type of expression, None if unknown
+        self.used_globals = used_globals
+        self.reason = reason
+        self.size = size(body) if body is not None else 0
+        self.has_loop = body is not None and contains(body, {'while_stmt'})
+        self.statement_cost = 0  # Cost of the statement form: the body and what it adds around it
+        if body is not None:
+            assignments = sum(param[0] == 'param' for param in self.params) + _count(body, {'return_stmt'})
+            blocks = _count(body, {'compound_stmt'})
+            self.statement_cost = self.size + ASSIGNMENT_COST * assignments + BLOCK_COST * blocks
+
+
+class Inliner:
+    """Inlines small non-recursive functions into their callers; see the module docstring."""
+
+    def __init__(self, ast, positions=None, threshold=DEFAULT_THRESHOLD):
+        self.ast = ast
+        self.positions = positions or {}
+        self.threshold = threshold
+        self.functions = {decl[2]: decl for decl in ast[1] if decl[0] == 'fun_decl'}
+        self.return_types = {decl[2]: decl[1] for decl in ast[1] if decl[0] in ('fun_decl', 'fun_proto')}
+        self.global_types = {}
+        for decl in ast[1]:
+            if decl[0] in ('var_decl', 'extern_var_decl'):
+                self.global_types[decl[2]] = decl[1]
+            elif decl[0] in ('array_decl', 'extern_array_decl'):
+                self.global_types[decl[2]] = f'array_{decl[1]}'
+        self.calls = {name: _callees(decl[4], set()) for name, decl in self.functions.items()}
+        self.recursive = {name for name in self.functions if name in self._reachable(name)}
+        self.decisions = []
+        self.scopes = []
+        self.caller = None
+        self.line = None
+        self.depth = 0
+        self._prepared = {}
+        self._decided = {}  # id() -> call node with a decision, kept alive so ids aren't reused
+        self._counter = 0
+
+    def inline(self):
+        """Get the inlined copy of the AST; untouched subtrees are shared with the original."""
+        for name in self._callees_first():
+            self.functions[name] = self._function(self.functions[name])
+        return (self.ast[0], [self.functions[decl[2]] if decl[0] == 'fun_decl' else decl
+                              for decl in self.ast[1]])
+
+    def report(self):
+        """Format one line per call site considered."""
+        out = []
+        for decision in self.decisions:
+            where = f"{decision.caller}:{decision.line}" if decision.line is not None else decision.caller
+            if decision.inlined:
+                out.append(f"inlined {decision.callee} at {where} (cost {decision.cost}, budget {decision.budget})")
+            else:
+                out.append(f"kept {decision.callee} at {where}: {decision.reason}")
+        return '\n'.join(out)
+
+    # Call graph
+
+    def _reachable(self, name):
+        seen = set()
+        stack = list(self.calls[name])
+        while stack:
+            callee = stack.pop()
+            if callee in seen or callee not in self.calls:
+                continue
+            seen.add(callee)
+            stack.extend(self.calls[callee])
+        return seen
+
+    def _callees_first(self):
+        order, visited = [], set()
+
+        def visit(name):
+            visited.add(name)
+            for callee in sorted(self.calls[name]):
+                if callee in self.functions and callee not in visited:
+                    visit(callee)
+            order.append(name)
+
+        for name in self.functions:
+            if name not in visited:
+                visit(name)
+        return order
+
+    # Scopes and types
+
+    def _rebuilt(self, old, new):
+        """Give a rebuilt node the source position of the node it replaces."""
+        position = self.positions.get(id(old))
+        if position is not None:
+            self.positions[id(new)] = position
+        return new
+
+    def _lookup(self, name, scopes):
+        for scope in reversed(scopes):
+            if name in scope:
+                return scope[name]
+        return self.global_types.get(name)
+
+    def _type(self, node, scopes):
+        kind = node[0]
+        if kind == 'number':
+            return 'int' if node[1].__class__ is int else 'float'
+        if kind == 'char':
+            return 'char'
+        if kind in ('boolean', 'relop', 'and', 'or'):
+            return 'boolean'
+        if kind == 'var':
+            return self._lookup(node[1], scopes)
+        if kind == 'array_access':
+            array_type = self._lookup(node[1], scopes) or ''
+            return array_type[len('array_'):] if array_type.startswith('array_') else None
+        if kind == 'call':
+            return self.return_types.get(node[1])
+        if kind == 'assign':
+            return self._type(node[1], scopes)
+        if kind in ('addop', 'mulop'):
+            left, right = self._type(node[2], scopes), self._type(node[3], scopes)
+            if left in ('int', 'float') and right in ('int', 'float'):
+                return 'float' if 'float' in (left, right) else 'int'
+        return None
+
+    def _is_local(self, name):
+        return any(name in scope for scope in self.scopes)
+
+    def _stable(self, node):
+        """Whether an expression's value can't be changed by a call and evaluating it can't fail."""
+        kind = node[0]
+        if kind in _LITERALS:
+            return True
+        if kind == 'var':
+            return self._is_local(node[1]) and not self._lookup(node[1], self.scopes).startswith('array_')
+        if kind in ('addop', 'mulop', 'relop'):
+            return not may_fault(node) and self._stable(node[2]) and self._stable(node[3])
+        if kind in ('and', 'or'):
+            return self._stable(node[1]) and self._stable(node[2])
+        return False
+
+    # Callees
+
+    def _fresh(self, name):
+        if name.startswith('_i') and '_' in name[2:]:
+            name = name.split('_', 2)[2]  # Copied again from a prepared body
+        self._counter += 1
+        return f'_i{self._counter}_{name}'
+
+    def _prepare(self, name):
+        callee = self._prepared.get(name)
+        if callee is not None:
+            return callee
+        decl = self.functions.get(name)
+        if decl is None:
+            callee = _Callee(None, None, None, None, set(), "no definition")
+        elif name in self.recursive:
+            callee = _Callee(decl, None, None, None, set(), "recursive")
+        else:
+            params = [] if decl[3] == 'void' else decl[3]
+            scope = {param[2]: param[2] for param in params}
+            used_globals = set()
+            body = self._rename(decl[4], [scope], used_globals)
+            try:
+                body = ('compound_stmt', body[1], self._tail(body[2]))
+                if decl[1] != 'void' and not _always_returns(body):
+                    raise NotInlinable("may reach its end without a return")
+            except NotInlinable as e:
+                callee = _Callee(decl, None, None, None, used_globals, str(e))
+            else:
+                expression = result_type = None
+                if (not body[1] and len(body[2]) == 1 and body[2][0][0] == 'return_stmt'
+                        and body[2][0][1] is not None and not contains(body[2][0][1], {'assign'})):
+                    expression = body[2][0][1]
+                    types = {param[2]: f'array_{param[1]}' if param[0] == 'array_param' else param[1]
+                             for param in params}
+                    result_type = self._type(expression, [types])
+                callee = _Callee(decl, body, expression, result_type, used_globals)
+        self._prepared[name] = callee
+        return callee
+
+    def _rename(self, node, scopes, used_globals, result=None, bind=False):
+        """Copy a callee subtree with every declared name mapped through scopes.
+
+        Names that resolve to no scope are globals and are collected in
+        used_globals. With bind set, `return e;` becomes an assignment of
+        `e` to the result local (or just `e;` with no result local).
+        """
+        kind = node[0]
+        if kind == 'compound_stmt':
+            scope = {decl[2]: self._fresh(decl[2]) for decl in node[1]}
+            decls = [decl[:2] + (scope[decl[2]],) + decl[3:] for decl in node[1]]
+            scopes.append(scope)
+            stmts = [self._rename(stmt, scopes, used_globals, result, bind) for stmt in node[2]]
+            scopes.pop()
+            return self._rebuilt(node, ('compound_stmt', decls, stmts))
+        if kind in ('var', 'array_access'):
+            name = node[1]
+            for scope in reversed(scopes):
+                if name in scope:
+                    name = scope[name]
+                    break
+            else:
+                used_globals.add(name)
+            if kind == 'var':
+                return name if isinstance(name, tuple) else ('var', name)  # A substituted argument
+            return ('array_access', name, self._rename(node[2], scopes, used_globals, result, bind))
+        if kind == 'return_stmt' and bind:
+            if node[1] is None:
+                return self._rebuilt(node, ('empty_stmt',))
+            value = self._rename(node[1], scopes, used_globals, result, bind)
+            if result is not None:
+                value = ('assign', ('var', result), value)
+            return self._rebuilt(node, ('expr_stmt', value))
+        children = []
+        for child in node[1:]:
+            if isinstance(child, tuple):
+                child = self._rename(child, scopes, used_globals, result, bind)
+            elif isinstance(child, list):
+                child = [self._rename(item, scopes, used_globals, result, bind) if isinstance(item, tuple) else item
+                         for item in child]
+            children.append(child)
+        new = (kind,) + tuple(children)
+        return self._rebuilt(node, new) if kind.endswith('_stmt') else new
+
+    def _tail(self, stmts):
+        """Move the statements after one that may return onto its paths that don't."""
+        for k, stmt in enumerate(stmts):
+            if contains(stmt, {'return_stmt'}):
+                return stmts[:k] + [self._push(stmt, stmts[k + 1:])]
+        return stmts
+
+    def _push(self, stmt, rest):
+        kind = stmt[0]
+        if kind == 'return_stmt':
+            return stmt  # Whatever follows is unreachable
+        if not contains(stmt, {'return_stmt'}):
+            return ('compound_stmt', [], [stmt] + self._tail(rest)) if rest else stmt
+        if kind == 'compound_stmt':
+            return self._rebuilt(stmt, ('compound_stmt', stmt[1], self._tail(stmt[2] + rest)))
+        if kind == 'if_stmt':
+            otherwise = ('compound_stmt', [], self._tail(rest)) if rest else ('empty_stmt',)
+            return self._rebuilt(stmt, ('if_else_stmt', stmt[1], self._push(stmt[2], rest), otherwise))
+        if kind == 'if_else_stmt':
+            return self._rebuilt(stmt, ('if_else_stmt', stmt[1], self._push(stmt[2], rest), self._push(stmt[3], rest)))
+        raise NotInlinable("returns from inside a loop")
+
+    # Decisions
+
+    def _decide(self, node, callee, cost):
+        """Record whether a call site is inlined; cost None means it can't be in its position."""
+        name = node[1]
+        budget = self.threshold
+        if not callee.has_loop:
+            budget *= LOOP_WEIGHT ** min(self.depth, MAX_LOOP_WEIGHTING)
+        reason = callee.reason
+        if reason is None:
+            shadowed = sorted(name for name in callee.used_globals if self._is_local(name))
+            if shadowed:
+                reason = f"global '{shadowed[0]}' is shadowed at the call"
+            elif cost is None:
+                reason = "not evaluated first in its statement"
+            elif cost > budget:
+                reason = "too large"
+        self._decided[id(node)] = node
+        self.decisions.append(InlineDecision(self.caller, name, self.line, cost or callee.size, budget,
+                                             reason is None, reason))
+        return reason is None
+
+    def _expression_form(self, node, callee):
+        """Get the callee's expression with the call's arguments substituted, or None."""
+        expression = callee.expression
+        if expression is None or callee.result_type != callee.decl[1]:
+            return None
+        has_call = contains(expression, {'call'})
+        values = {}
+        for param, arg in zip(callee.params, node[2]):
+            if param[0] == 'array_param':
+                values[param[2]] = arg[1]
+                continue
+            if self._type(arg, self.scopes) != param[1]:
+                return None
+            if not self._stable(arg):
+                # Evaluated where the parameter is read instead of before the call
+                if has_call or contains(arg, {'call', 'assign'}) or may_fault(arg) or _uses(expression, param[2]) > 1:
+                    return None
+            values[param[2]] = arg
+        scope = {name: value for name, value in values.items()}
+        return self._rename(expression, [scope], set())
+
+    def _statement_form(self, node, callee):
+        """Get (declarations, statements, result local) that replace a call evaluated first."""
+        decls, stmts = [], []
+        scope = {}
+        for param, arg in zip(callee.params, node[2]):
+            if param[0] == 'array_param':
+                scope[param[2]] = arg[1]
+            else:
+                temp = self._fresh(param[2])
+                scope[param[2]] = temp
+                decls.append(('var_decl', param[1], temp))
+                stmts.append(('expr_stmt', ('assign', ('var', temp), arg)))
+        result = None
+        if callee.decl[1] != 'void':
+            result = self._fresh('result')
+            decls.append(('var_decl', callee.decl[1], result))
+        body = self._rename(callee.body, [scope], set(), result, bind=True)
+        # The body's locals are renamed apart, so they can share the parameters' block
+        return decls + body[1], stmts + body[2], result
+
+    # Callers
+
+    def _function(self, node):
+        self.caller = node[2]
+        params = [] if node[3] == 'void' else node[3]
+        self.scopes = [{param[2]: f'array_{param[1]}' if param[0] == 'array_param' else param[1]
+                        for param in params}]
+        self.depth = 0
+        body = self._statement(node[4])
+        self.scopes = []
+        return node if body is node[4] else node[:4] + (body,)
+
+    def _statement(self, node):
+        kind = node[0]
+        position = self.positions.get(id(node))
+        if position is not None:
+            self.line = position[1]
+        if kind == 'compound_stmt':
+            self.scopes.append({decl[2]: f'array_{decl[1]}' if decl[0] == 'array_decl' else decl[1]
+                                for decl in node[1]})
+            stmts = [self._statement(stmt) for stmt in node[2]]
+            self.scopes.pop()
+            if all(a is b for a, b in zip(stmts, node[2])):
+                return node
+            return self._rebuilt(node, ('compound_stmt', node[1], stmts))
+        if kind == 'while_stmt':
+            condition = self._expression(node[1])
+            for call in _calls(condition):
+                if id(call) not in self._decided:
+                    self._decide(call, self._prepare(call[1]), None)  # Evaluated on every iteration
+            self.depth += 1
+            body = self._statement(node[2])
+            self.depth -= 1
+            if condition is node[1] and body is node[2]:
+                return node
+            return self._rebuilt(node, ('while_stmt', condition, body))
+        if kind in ('expr_stmt', 'return_stmt', 'if_stmt', 'if_else_stmt') and node[1] is not None:
+            line = self.line
+            parts = [self._expression(node[1])]
+            for child in node[2:]:
+                parts.append(self._statement(child))
+            self.line = line
+            if not all(a is b for a, b in zip(parts, node[1:])):
+                node = self._rebuilt(node, (kind,) + tuple(parts))
+            return self._inline_leading(node)
+        return node
+
+    def _expression(self, node):
+        """Inline expression-form calls anywhere in an expression, innermost first."""
+        children = []
+        for child in node[1:]:
+            if isinstance(child, tuple):
+                child = self._expression(child)
+            elif isinstance(child, list):
+                child = [self._expression(item) for item in child]
+            children.append(child)
+        if any(a is not b for a, b in zip(children, node[1:])):
+            node = (node[0],) + tuple(children)
+        if node[0] != 'call':
+            return node
+        callee = self._prepare(node[1])
+        if callee.reason is not None:
+            self._decide(node, callee, None)
+            return node
+        inlined = self._expression_form(node, callee)
+        if inlined is None or not self._decide(node, callee, size(callee.expression)):
+            return node
+        return inlined
+
+    def _leading(self, node):
+        """Find the call evaluated before anything in the expression a call could observe."""
+        kind = node[0]
+        if kind == 'call':
+            for arg in node[2]:
+                if contains(arg, {'call'}):
+                    return self._leading(arg)
+                if not self._stable(arg) and contains(node[2], {'call'}):
+                    return None
+            return node
+        if kind == 'assign':
+            if contains(node[2], {'call'}) or node[1][0] == 'var':
+                return self._leading(node[2])
+            return self._leading(node[1][2]) if self._stable(node[2]) else None
+        if kind == 'array_access':
+            return self._leading(node[2])
+        if kind in ('relop', 'addop', 'mulop'):
+            if contains(node[2], {'call'}):
+                return self._leading(node[2])
+            return self._leading(node[3]) if self._stable(node[2]) else None
+        if kind in ('and', 'or'):
+            return self._leading(node[1])  # The right side may not run at all
+        return None
+
+    def _inline_leading(self, node):
+        """Inline calls evaluated first in a statement, one after another, in statement form."""
+        decls, stmts = [], []
+        scope = {}
+        self.scopes.append(scope)
+        while node is not None:
+            call = self._leading(node[1])
+            if call is None or id(call) in self._decided:
+                break
+            callee = self._prepare(call[1])
+            if callee.body is None or not self._decide(call, callee, callee.statement_cost):
+                break
+            call_decls, call_stmts, result = self._statement_form(call, callee)
+            decls.extend(call_decls)
+            stmts.extend(call_stmts)
+            for decl in call_decls:
+                scope[decl[2]] = decl[1]
+            if node[0] == 'expr_stmt' and node[1] is call:
+                node = None  # The value is discarded
+            else:
+                node = self._rebuilt(node, (node[0], _replace(node[1], call, ('var', result))) + node[2:])
+        # Calls that never came first in their statement
+        for call in _calls(node[1]) if node is not None else ():
+            if id(call) not in self._decided:
+                self._decide(call, self._prepare(call[1]), None)
+        self.scopes.pop()
+        if not stmts:
+            return node
+        return ('compound_stmt', decls, stmts + ([node] if node is not None else []))
+
+
+def _replace(node, old, new):
+    """Copy the path to one node, found by identity, replacing that node."""
+    if node is old:
+        return new
+    children = []
+    for child in node[1:]:
+        if isinstance(child, tuple):
+            child = _replace(child, old, new)
+        elif isinstance(child, list):
+            replaced = [_replace(item, old, new) for item in child]
+            child = child if all(a is b for a, b in zip(replaced, child)) else replaced
+        children.append(child)
+    if all(a is b for a, b in zip(children, node[1:])):
+        return node
+    return (node[0],) + tuple(children)
+
+
+def _calls(node):
+    if not isinstance(node, tuple):
+        return []
+    found = [node] if node[0] == 'call' else []
+    for child in node[1:]:
+        if isinstance(child, tuple):
+            found.extend(_calls(child))
+        elif isinstance(child, list):
+            for item in child:
+                found.extend(_calls(item))
+    return found
+
+
+def inline_functions(ast, positions=None, threshold=DEFAULT_THRESHOLD):
+    """Inline small non-recursive functions of a checked AST; returns (new AST, inliner)."""
+    inliner = Inliner(ast, positions, threshold)
+    return inliner.inline(), inliner
@@ -0,0 +1,289 @@
+# Top-level nodes that declare something defined elsewhere in the program
+DECLARATIONS_ONLY = ('fun_proto', 'extern_var_decl', 'extern_array_decl')
+
+
+class ExecutionError(Exception):
+    """Raised when a checked program fails at run time."""
+    pass
+
+
+class _Return(Exception):
+    """Unwinds the interpreter out of a function body on 'return'."""
+    def __init__(self, value):
+        self.value = value
+
+
+class Scope:
+    """Storage for the variables declared in one block scope."""
+    __slots__ = ('values', 'types')
+
+    def __init__(self):
+        self.values = {}
+        self.types = {}
+
+    def declare(self, name, type, value):
+        self.values[name] = value
+        self.types[name] = type
+
+
+def default_value(type):
+    """Get the zero value a freshly declared variable of a type holds."""
+    if type == 'float':
+        return 0.0
+    if type == 'char':
+        return '\0'
+    if type == 'boolean':
+        return False
+    return 0
+
+
+def coerce(type, value):
+    """Convert a value on assignment, widening int to float like C does."""
+    if type == 'float' and value.__class__ is int:
+        return float(value)
+    return value
+
+
+def truth(value):
+    """Test a condition like C does: zero, false and the char '\\0' are false."""
+    return value != '\0' if value.__class__ is str else bool(value)
+
+
+def int_divide(left, right):
+    """Integer division truncating toward zero like C."""
+    if right == 0:
+        raise ExecutionError("Division by zero")
+    quotient = left // right
+    if quotient < 0 and quotient * right != left:
+        quotient += 1
+    return quotient
+
+
+def out_of_bounds(name, index, size):
+    """Report an array access outside the declared size."""
+    raise ExecutionError(f"Array index {index} out of bounds for '{name}' of size {size}")
+
+
+class Interpreter:
+    """Tree-walking reference interpreter over the parser's AST.
+
+    Programs have no I/O, so the observable result of a run is the value
+    returned by the entry function plus the final contents of the globals.
+    """
+
+    def __init__(self, ast):
+        if ast is None:
+            raise ExecutionError("Cannot execute a program that failed to parse")
+        self.ast = ast
+        self.functions = {}
+        self.global_decls = []
+        self.global_scope = Scope()
+        self.scopes = []
+        self._statements = {}
+        self._expressions = {}
+        for decl in ast[1]:
+            if decl[0] == 'fun_decl':
+                self.functions[decl[2]] = decl
+            elif decl[0] in ('var_decl', 'array_decl'):
+                self.global_decls.append(decl)
+            elif decl[0] in DECLARATIONS_ONLY:
+                continue
+            else:
+                raise ExecutionError(f"Cannot execute node '{decl[0]}'")
+
+    @property
+    def globals(self):
+        """Current values of the global variables."""
+        return {name: list(value) if isinstance(value, list) else value
+                for name, value in self.global_scope.values.items()}
+
+    def run(self, entry='main', args=None):
+        """Run the program from a fresh global state and return the entry function's result."""
+        self.global_scope = Scope()
+        self.scopes = []
+        for decl in self.global_decls:
+            self._declare(self.global_scope, decl)
+        return self.call(entry, list(args or []))
+
+    def call(self, fun_name, args):
+        """Call a function with already evaluated arguments.
+
+        A function that reaches its end without a return gives None if it
+        is void and its type's zero value otherwise, like the native backend.
+        """
+        fun = self.functions.get(fun_name)
+        if fun is None:
+            raise ExecutionError(f"Function '{fun_name}' not declared")
+        fun_type, params, body = fun[1], fun[3], fun[4]
+        params = [] if params == 'void' else params
+        if len(params) != len(args):
+            raise ExecutionError(f"Wrong number of arguments for function '{fun_name}'")
+
+        frame = Scope()
+        for param, value in zip(params, args):
+            if param[0] == 'array_param':
+                frame.declare(param[2], f'array_{param[1]}', value)
+            else:
+                frame.declare(param[2], param[1], coerce(param[1], value))
+
+        saved_scopes = self.scopes
+        self.scopes = [frame]
+        try:
+            self.execute(body)
+        except _Return as ret:
+            return coerce(fun_type, ret.value)
+        finally:
+            self.scopes = saved_scopes
+        return None if fun_type == 'void' else default_value(fun_type)
+
+    # Storage
+
+    def _declare(self, scope, decl):
+        if decl[0] == 'array_decl':
+            scope.declare(decl[2], f'array_{decl[1]}', [default_value(decl[1])] * decl[3])
+        else:
+            scope.declare(decl[2], decl[1], default_value(decl[1]))
+
+    def _find_scope(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope.values:
+                return scope
+        if name in self.global_scope.values:
+            return self.global_scope
+        raise ExecutionError(f"Variable '{name}' not declared")
+
+    def _element(self, node):
+        """Resolve an array_access node to its list and checked index."""
+        array = self._find_scope(node[1]).values[node[1]]
+        index = self.evaluate(node[2])
+        if not 0 <= index < len(array):
+            out_of_bounds(node[1], index, len(array))
+        return array, index
+
+    # Statements
+
+    def execute(self, node):
+        kind = node[0]
+        method = self._statements.get(kind)
+        if method is None:
+            method = getattr(self, f'exec_{kind}', None)
+            if method is None:
+                raise ExecutionError(f"Cannot execute node '{kind}'")
+            self._statements[kind] = method
+        method(node)
+
+    def exec_compound_stmt(self, node):
+        scope = Scope()
+        for decl in node[1]:
+            self._declare(scope, decl)
+        self.scopes.append(scope)
+        try:
+            for stmt in node[2]:
+                self.execute(stmt)
+        finally:
+            self.scopes.pop()
+
+    def exec_expr_stmt(self, node):
+        self.evaluate(node[1])
+
+    def exec_empty_stmt(self, node):
+        pass
+
+    def exec_if_stmt(self, node):
+        if truth(self.evaluate(node[1])):
+            self.execute(node[2])
+
+    def exec_if_else_stmt(self, node):
+        if truth(self.evaluate(node[1])):
+            self.execute(node[2])
+        else:
+            self.execute(node[3])
+
+    def exec_while_stmt(self, node):
+        condition, body = node[1], node[2]
+        while truth(self.evaluate(condition)):
+            self.execute(body)
+
+    def exec_return_stmt(self, node):
+        raise _Return(None if node[1] is None else self.evaluate(node[1]))
+
+    # Expressions
+
+    def evaluate(self, node):
+        kind = node[0]
+        method = self._expressions.get(kind)
+        if method is None:
+            method = getattr(self, f'eval_{kind}', None)
+            if method is None:
+                raise ExecutionError(f"Cannot evaluate node '{kind}'")
+            self._expressions[kind] = method
+        return method(node)
+
+    def eval_number(self, node):
+        return node[1]
+
+    def eval_char(self, node):
+        return node[1]
+
+    def eval_boolean(self, node):
+        return node[1] == 'true'
+
+    def eval_var(self, node):
+        return self._find_scope(node[1]).values[node[1]]
+
+    def eval_array_access(self, node):
+        array, index = self._element(node)
+        return array[index]
+
+    def eval_assign(self, node):
+        target, value = node[1], self.evaluate(node[2])
+        if target[0] == 'array_access':
+            scope = self._find_scope(target[1])
+            array, index = self._element(target)
+            value = coerce(scope.types[target[1]][len('array_'):], value)
+            array[index] = value
+        else:
+            scope = self._find_scope(target[1])
+            value = coerce(scope.types[target[1]], value)
+            scope.values[target[1]] = value
+        return value
+
+    def eval_call(self, node):
+        fun = self.functions.get(node[1])
+        if fun is None:
+            raise ExecutionError(f"Function '{node[1]}' not declared")
+        return self.call(node[1], [self.evaluate(arg) for arg in node[2]])
+
+    def eval_or(self, node):
+        return truth(self.evaluate(node[1])) or truth(self.evaluate(node[2]))
+
+    def eval_and(self, node):
+        return truth(self.evaluate(node[1])) and truth(self.evaluate(node[2]))
+
+    def eval_relop(self, node):
+        op, left, right = node[1], self.evaluate(node[2]), self.evaluate(node[3])
+        if op == '<':
+            return left < right
+        if op == '<=':
+            return left <= right
+        if op == '>':
+            return left > right
+        if op == '>=':
+            return left >= right
+        if op == '==':
+            return left == right
+        return left != right
+
+    def eval_addop(self, node):
+        left, right = self.evaluate(node[2]), self.evaluate(node[3])
+        return left + right if node[1] == '+' else left - right
+
+    def eval_mulop(self, node):
+        left, right = self.evaluate(node[2]), self.evaluate(node[3])
+        if node[1] == '*':
+            return left * right
+        if left.__class__ is int and right.__class__ is int:
+            return int_divide(left, right)
+        if right == 0:
+            raise ExecutionError("Division by zero")
+        return left / right
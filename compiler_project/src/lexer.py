@@ -1,9 +1,46 @@
-from ply import lex
+import re
+import sys
+import zlib
+from array import array
+
+
+def rules_digest():
+    """Checksum of this file; the shipped src/lextab.py records the one it was built from."""
+    with open(__file__, 'rb') as file:
+        return f'{zlib.crc32(file.read()):08x}'
+
+
+def _current_lextab():
+    """Get the shipped lextab module, or None if it's missing or out of date."""
+    try:
+        from . import lextab
+    except ImportError:
+        return None
+    if getattr(lextab, '_rules_digest', None) != rules_digest():
+        return None
+    return lextab
+
 
 class Lexer:
     def __init__(self):
         self.last_token = None
-        self.lexer = lex.lex(module=self)
+        self._scan_rules = None
+
+    def __getattr__(self, name):
+        # The PLY lexer is only needed by input()/token() and the PLY parse
+        # path, so it (and ply.lex) is loaded on first use
+        if name == 'lexer':
+            self.lexer = self._build_ply_lexer()
+            return self.lexer
+        raise AttributeError(name)
+
+    def _build_ply_lexer(self):
+        from ply import lex
+        # Load the precomputed master regexes unless the rules changed since
+        # src/lextab.py was built (python -m src.build_tables); PLY then
+        # validates and builds them from the rules instead, without writing.
+        lextab = _current_lextab()
+        return lex.lex(module=self, optimize=lextab is not None, lextab=lextab)
 
     # Reserved words
     reserved = {
@@ -17,7 +54,8 @@ class Lexer:
         'char': 'CHAR',
         'boolean': 'BOOLEAN',
         'true': 'TRUE',
-        'false': 'FALSE'
+        'false': 'FALSE',
+        'extern': 'EXTERN'
     }
 
     # Token list
@@ -31,7 +69,6 @@ class Lexer:
         'LPAREN', 'RPAREN',
         'LBRACE', 'RBRACE',  # For compound statements
         'LBRACKET', 'RBRACKET',  # For array indices
-        'TRUE', 'FALSE'
     ] + list(reserved.values())
 
     # Simple tokens
@@ -75,6 +112,7 @@ class Lexer:
 
     def t_ID(self, t):
         r'[A-Za-z][A-Za-z0-9_]*'
+        t.value = sys.intern(t.value)  # Names are stored once across lexer, parser and symbol table
         t.type = self.reserved.get(t.value, 'ID')
         return t
 
@@ -97,16 +135,195 @@ class Lexer:
 
     # Input handling
     def input(self, data):
+        self.lexer.lineno = 1
         self.lexer.input(data)
 
     def token(self):
         self.last_token = self.lexer.token()
         return self.last_token
 
+    def tokenize(self, data, offset=0, line=1, errors=None):
+        """Lex all of data into a compact TokenBuffer.
+
+        Uses the same master regexes PLY builds from the rules above, but
+        records each token as four array entries instead of a LexToken.
+        When data is a slice of a larger source starting at `offset` on
+        `line`, recorded positions and lines are those of the whole source.
+        Illegal characters are appended to `errors` as (char, line) if given,
+        and printed otherwise.
+        """
+        if self._scan_rules is None:
+            self._scan_rules = self._build_scan_rules()
+        buffer = TokenBuffer(data)
+        types, starts, lengths, lines = buffer.types, buffer.starts, buffer.lengths, buffer.lines
+        ignore = self.t_ignore
+        reserved = {word: TOKEN_CODES[name] for word, name in self.reserved.items()}
+        id_code = TOKEN_CODES['ID']
+        pos, end = 0, len(data)
+
+        while pos < end:
+            if data[pos] in ignore:
+                pos += 1
+                continue
+            for regex, actions in self._scan_rules:
+                m = regex.match(data, pos)
+                if m:
+                    break
+            else:
+                if errors is None:
+                    print(f"Illegal character '{data[pos]}' at line {line}")
+                else:
+                    errors.append((data[pos], line))
+                pos += 1
+                continue
+
+            action, code = actions[m.lastindex]
+            next_pos = m.end()
+            if action == _EMIT:
+                types.append(code)
+                starts.append(pos + offset)
+                lengths.append(next_pos - pos)
+                lines.append(line)
+            elif action == _IDENTIFIER:
+                types.append(reserved.get(m.group(), id_code))
+                starts.append(pos + offset)
+                lengths.append(next_pos - pos)
+                lines.append(line)
+            elif action == _NEWLINE:
+                line += next_pos - pos
+            pos = next_pos
+        return buffer
+
+    def _build_scan_rules(self):
+        """Map each PLY master-regex group to a scanner action."""
+        lextab = _current_lextab()
+        if lextab is not None:
+            # Straight from the shipped table, without loading PLY
+            master = [(re.compile(pattern, lextab._lexreflags), index)
+                      for pattern, index in lextab._lexstatere['INITIAL']]
+        else:
+            master = [(regex, [entry and ((entry[0].__name__ if entry[0] else None), entry[1])
+                               for entry in index])
+                      for regex, index in self.lexer.lexre]
+
+        special = {'t_ID': _IDENTIFIER, 't_COMMENT': _SKIP, 't_newline': _NEWLINE}
+        rules = []
+        for regex, index in master:
+            actions = [None] * len(index)
+            for i, entry in enumerate(index):
+                if entry is None:
+                    continue
+                func_name, name = entry
+                if func_name in special:
+                    actions[i] = (special[func_name], None)
+                elif name:
+                    actions[i] = (_EMIT, TOKEN_CODES[name])
+                else:
+                    actions[i] = (_SKIP, None)
+            rules.append((regex, actions))
+        return rules
+
     def test(self, data):
         self.input(data)
         while True:
             tok = self.token()
             if not tok:
                 break
-            print(tok) 
\ No newline at end of file
+            print(tok) 
+
+# Scanner actions for Lexer.tokenize
+_EMIT, _IDENTIFIER, _NEWLINE, _SKIP = range(4)
+
+# Token type codes used by TokenBuffer
+TOKEN_NAMES = list(dict.fromkeys(Lexer.tokens))
+TOKEN_CODES = {name: code for code, name in enumerate(TOKEN_NAMES)}
+_NAME_TOKENS = frozenset(['ID'] + list(Lexer.reserved.values()))
+
+
+class BufferedToken:
+    """A token materialized from a TokenBuffer; quacks like a PLY LexToken."""
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+class TokenBuffer:
+    """Tokens stored as parallel array columns over the source text.
+
+    Each token costs a type code, start offset, length and line number;
+    values are decoded from the source slice only when asked for.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.types = array('B')
+        self.starts = array('I')
+        self.lengths = array('I')
+        self.lines = array('I')
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, i):
+        return TOKEN_NAMES[self.types[i]]
+
+    def text(self, i):
+        start = self.starts[i]
+        return self.data[start:start + self.lengths[i]]
+
+    def value(self, i):
+        """Decode a token's value the way the Lexer rules would."""
+        name = TOKEN_NAMES[self.types[i]]
+        text = self.text(i)
+        if name == 'NUMBER':
+            return int(text)
+        if name == 'FLOAT_NUM':
+            return float(text)
+        if name == 'CHAR_LITERAL':
+            return text[1:-1]
+        if name in _NAME_TOKENS:
+            return sys.intern(text)
+        return text
+
+    def token(self, i):
+        return BufferedToken(TOKEN_NAMES[self.types[i]], self.value(i), self.lines[i], self.starts[i])
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self.token(i)
+
+    def rows(self):
+        """Yield tokens as the dicts the web token table displays."""
+        for i in range(len(self.types)):
+            yield {
+                'type': TOKEN_NAMES[self.types[i]],
+                'value': self.value(i),
+                'line': self.lines[i],
+                'position': self.starts[i]
+            }
+
+    def stream(self):
+        """Get an object with a PLY-style token() method for yacc to pull from."""
+        return TokenStream(self)
+
+
+class TokenStream:
+    """Feeds a TokenBuffer to a PLY parser one token at a time."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.index = 0
+
+    def token(self):
+        if self.index >= len(self.buffer):
+            return None
+        token = self.buffer.token(self.index)
+        self.index += 1
+        return token
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ASSIGN', 'BOOLEAN', 'CHAR', 'CHAR_LITERAL', 'COMMA', 'DIVIDE', 'ELSE', 'EQ', 'EXTERN', 'FALSE', 'FLOAT', 'FLOAT_NUM', 'GE', 'GT', 'ID', 'IF', 'INT', 'LBRACE', 'LBRACKET', 'LE', 'LPAREN', 'LT', 'MINUS', 'NE', 'NUMBER', 'OR', 'PLUS', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'SEMICOLON', 'TIMES', 'TRUE', 'VOID', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_FLOAT_NUM>\\d*\\.\\d+)|(?P<t_NUMBER>\\d+)|(?P<t_CHAR_LITERAL>\\'.\\')|(?P<t_ID>[A-Za-z][A-Za-z0-9_]*)|(?P<t_COMMENT>//.*)|(?P<t_newline>\\n+)|(?P<t_OR>\\|\\|)|(?P<t_AND>&&)|(?P<t_EQ>==)|(?P<t_GE>>=)|(?P<t_LBRACE>\\{)|(?P<t_LBRACKET>\\[)|(?P<t_LE><=)|(?P<t_LPAREN>\\()|(?P<t_NE>!=)|(?P<t_PLUS>\\+)|(?P<t_RBRACE>\\})|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_ASSIGN>=)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_SEMICOLON>;)", [None, ('t_FLOAT_NUM', 'FLOAT_NUM'), ('t_NUMBER', 'NUMBER'), ('t_CHAR_LITERAL', 'CHAR_LITERAL'), ('t_ID', 'ID'), ('t_COMMENT', 'COMMENT'), ('t_newline', 'newline'), (None, 'OR'), (None, 'AND'), (None, 'EQ'), (None, 'GE'), (None, 'LBRACE'), (None, 'LBRACKET'), (None, 'LE'), (None, 'LPAREN'), (None, 'NE'), (None, 'PLUS'), (None, 'RBRACE'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'ASSIGN'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GT'), (None, 'LT'), (None, 'MINUS'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_rules_digest = '8f0c4103'
@@ -0,0 +1,495 @@
+"""
+Loop-invariant code motion and strength reduction for `while` loops.
+
+`while` is the only loop form, so every loop is a natural loop whose
+header is its condition. LoopOptimizer walks each function outermost loop
+first and rewrites the AST:
+
+- Invariant code motion: a subexpression whose operands aren't changed
+  anywhere in the loop (`n * 4`, `a[k]` with `k` and `a` unchanged) is
+  computed once into a new local before the loop. Expressions that can't
+  fail (`+`, `-`, `*`) are hoisted from anywhere in the loop. Expressions
+  that can (`/`, array reads) are hoisted only if every iteration evaluates
+  them before anything else that could fail; they go inside an
+  `if (condition)` guard so a loop that never runs doesn't evaluate them.
+- Strength reduction: for a basic induction variable (`i` whose only
+  assignment in the loop is an unconditional `i = i + c` or `i = i - c`),
+  each `i * k` with `k` invariant becomes a new local that is set before
+  the loop and stepped by `c * k` right after `i` is.
+
+A call in the loop may change any global, and any array passed to it, so
+those count as changed. New locals are named `_inv<n>` and `_ind<n>`, which
+source identifiers can't spell, and are declared in the function's
+outermost block. Each rewritten loop gets a LoopReport. Rebuilt nodes
+are added to `positions` with the position of the node they replace, so
+reports and the profiler still find their lines.
+
+    optimized, optimizer = optimize_loops(ast, positions)
+    print(optimizer.report())
+"""
+from .range_analysis import is_pure
+
+_FAULTING = ('array_access', 'call')
+
+
+def format_expr(node):
+    """Render an expression back to source form, for reports."""
+    kind = node[0]
+    if kind == 'number':
+        return repr(node[1])
+    if kind == 'char':
+        return repr(node[1])
+    if kind in ('boolean', 'var'):
+        return node[1]
+    if kind == 'array_access':
+        return f'{node[1]}[{format_expr(node[2])}]'
+    if kind == 'call':
+        return f"{node[1]}({', '.join(format_expr(arg) for arg in node[2])})"
+    if kind == 'assign':
+        return f'{format_expr(node[1])} = {format_expr(node[2])}'
+    if kind in ('and', 'or'):
+        return f"({format_expr(node[1])} {'&&' if kind == 'and' else '||'} {format_expr(node[2])})"
+    return f'({format_expr(node[2])} {node[1]} {format_expr(node[3])})'
+
+
+def may_fault(node):
+    """Whether evaluating an expression can raise at run time."""
+    kind = node[0]
+    if kind in _FAULTING or (kind == 'mulop' and node[1] == '/'):
+        return True
+    return any(may_fault(child) for child in node[1:] if isinstance(child, tuple))
+
+
+def contains(node, kinds):
+    """Whether a node, list of nodes or any node below them is of one of kinds."""
+    if isinstance(node, list):
+        return any(contains(item, kinds) for item in node)
+    if not isinstance(node, tuple):
+        return False
+    if node[0] in kinds:
+        return True
+    return any(contains(child, kinds) for child in node[1:] if isinstance(child, (tuple, list)))
+
+
+def _equal_to(node, replaced):
+    """Get the replacement of a structurally equal node from (node, replacement) pairs, or None."""
+    for other, replacement in replaced:
+        if other == node:
+            return replacement
+    return None
+
+
+class LoopReport:
+    """What was done to one `while` loop."""
+
+    def __init__(self, function, line, depth):
+        self.function = function
+        self.line = line
+        self.depth = depth
+        self.hoisted = []  # (temporary, expression source)
+        self.reduced = []  # (temporary, expression source, step source)
+        self.guarded = False
+
+    def __repr__(self):
+        return f"LoopReport({self.function}, line {self.line}, {len(self.hoisted)} hoisted, {len(self.reduced)} reduced)"
+
+
+class _LoopFacts:
+    """Names a loop changes, found by one walk over its condition and body."""
+
+    def __init__(self, node):
+        self.assigned = set()  # Scalars assigned, and every name declared inside the loop
+        self.declared = set()
+        self.written = set()  # Arrays stored into or passed to a call
+        self.has_call = False
+        self.updates = {}  # name -> number of assignments
+        self._walk(node)
+
+    def _walk(self, node):
+        if isinstance(node, list):
+            for item in node:
+                self._walk(item)
+            return
+        if not isinstance(node, tuple):
+            return
+        kind = node[0]
+        if kind in ('var_decl', 'array_decl'):
+            self.declared.add(node[2])
+            self.assigned.add(node[2])
+            self.written.add(node[2])
+            return
+        if kind == 'assign':
+            target = node[1]
+            if target[0] == 'var':
+                self.assigned.add(target[1])
+                self.updates[target[1]] = self.updates.get(target[1], 0) + 1
+            else:
+                self.written.add(target[1])
+        elif kind == 'call':
+            self.has_call = True
+            for arg in node[2]:
+                if arg[0] == 'var':
+                    self.written.add(arg[1])
+        for child in node[1:]:
+            if isinstance(child, (tuple, list)):
+                self._walk(child)
+
+
+class LoopOptimizer:
+    """Rewrites the `while` loops of a checked AST; see the module docstring."""
+
+    def __init__(self, ast, positions=None, hoist=True, reduce=True):
+        self.ast = ast
+        self.positions = positions or {}
+        self.hoist = hoist
+        self.reduce = reduce
+        self.loops = []
+        self.global_types = {}
+        for decl in ast[1]:
+            if decl[0] in ('var_decl', 'extern_var_decl'):
+                self.global_types[decl[2]] = decl[1]
+            elif decl[0] in ('array_decl', 'extern_array_decl'):
+                self.global_types[decl[2]] = f'array_{decl[1]}'
+        self.scopes = []
+        self.temporaries = []  # ('var_decl', type, name) for the current function
+        self.function = None
+        self.depth = 0
+        self._counter = 0
+
+    def optimize(self):
+        """Get the optimized copy of the AST; untouched subtrees are shared with the original."""
+        decls = []
+        for decl in self.ast[1]:
+            decls.append(self._function(decl) if decl[0] == 'fun_decl' else decl)
+        return (self.ast[0], decls)
+
+    def report(self):
+        """Format one line per optimized loop."""
+        out = []
+        for loop in self.loops:
+            where = f"{loop.function}:{loop.line}" if loop.line is not None else loop.function
+            out.append(f"loop at {where} (depth {loop.depth}){' guarded' if loop.guarded else ''}")
+            for temp, expr in loop.hoisted:
+                out.append(f"    hoisted {expr} into {temp}")
+            for temp, expr, step in loop.reduced:
+                out.append(f"    reduced {expr} to {temp} += {step}")
+        return '\n'.join(out)
+
+    # Scopes and types
+
+    def _function(self, node):
+        self.function = node[2]
+        self.temporaries = []
+        params = [] if node[3] == 'void' else node[3]
+        self.scopes = [{param[2]: f'array_{param[1]}' if param[0] == 'array_param' else param[1]
+                        for param in params}]
+        body = self._statement(node[4])
+        self.scopes = []
+        if not self.temporaries:
+            return node
+        body = ('compound_stmt', body[1] + self.temporaries, body[2])
+        return node[:4] + (body,)
+
+    def _rebuilt(self, old, new):
+        """Give a rebuilt node the source position of the node it replaces."""
+        position = self.positions.get(id(old))
+        if position is not None:
+            self.positions[id(new)] = position
+        return new
+
+    def _lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return self.global_types.get(name)
+
+    def _type(self, node):
+        kind = node[0]
+        if kind == 'number':
+            return 'int' if node[1].__class__ is int else 'float'
+        if kind == 'var':
+            return self._lookup(node[1])
+        if kind == 'array_access':
+            array_type = self._lookup(node[1]) or ''
+            return array_type[len('array_'):] if array_type.startswith('array_') else None
+        if kind in ('addop', 'mulop'):
+            left, right = self._type(node[2]), self._type(node[3])
+            if left in ('int', 'float') and right in ('int', 'float'):
+                return 'float' if 'float' in (left, right) else 'int'
+        return None
+
+    def _temporary(self, prefix, type):
+        self._counter += 1
+        name = f'_{prefix}{self._counter}'
+        self.temporaries.append(('var_decl', type, name))
+        self.scopes[0][name] = type
+        return name
+
+    # Statements
+
+    def _statement(self, node):
+        kind = node[0]
+        if kind == 'compound_stmt':
+            self.scopes.append({decl[2]: f'array_{decl[1]}' if decl[0] == 'array_decl' else decl[1]
+                                for decl in node[1]})
+            stmts = [self._statement(stmt) for stmt in node[2]]
+            self.scopes.pop()
+            if all(a is b for a, b in zip(stmts, node[2])):
+                return node
+            return self._rebuilt(node, ('compound_stmt', node[1], stmts))
+        if kind == 'if_stmt':
+            then = self._statement(node[2])
+            return node if then is node[2] else self._rebuilt(node, ('if_stmt', node[1], then))
+        if kind == 'if_else_stmt':
+            then, otherwise = self._statement(node[2]), self._statement(node[3])
+            if then is node[2] and otherwise is node[3]:
+                return node
+            return self._rebuilt(node, ('if_else_stmt', node[1], then, otherwise))
+        if kind == 'while_stmt':
+            return self._loop(node)
+        return node
+
+    def _loop(self, node):
+        report = LoopReport(self.function, self.positions.get(id(node), (None, None))[1], self.depth)
+        facts = _LoopFacts(node)
+        condition, body = node[1], node[2]
+        before, guarded_before = [], []
+
+        if self.hoist:
+            candidates = self._scan_loop(condition, body, facts)
+            replacements, hoisted = {}, []
+            for expr, faulting in candidates:
+                shared = _equal_to(expr, hoisted)
+                if shared is not None:
+                    replacements[id(expr)] = shared
+                    continue
+                temp = self._temporary('inv', self._type(expr))
+                replacements[id(expr)] = ('var', temp)
+                hoisted.append((expr, ('var', temp)))
+                assignment = ('expr_stmt', ('assign', ('var', temp), expr))
+                (guarded_before if faulting else before).append(assignment)
+                report.hoisted.append((temp, format_expr(expr)))
+            if replacements:
+                condition = self._replace(condition, replacements)
+                body = self._replace(body, replacements)
+
+        if self.reduce:
+            body, initial = self._reduce(body, facts, report)
+            # After the hoisted values, which a step may be computed from
+            (guarded_before if guarded_before else before).extend(initial)
+
+        changed = report.hoisted or report.reduced
+        if changed:
+            self.loops.append(report)  # Before the inner loops' reports
+        self.depth += 1
+        body = self._statement(body)
+        self.depth -= 1
+
+        if not changed:
+            return node if body is node[2] else self._rebuilt(node, ('while_stmt', condition, body))
+        loop = self._rebuilt(node, ('while_stmt', condition, body))
+        if guarded_before:
+            report.guarded = True
+            # The guard runs before the hoisted values exist, so it tests the original condition
+            loop = ('if_stmt', node[1], ('compound_stmt', [], guarded_before + [loop]))
+        return ('compound_stmt', [], before + [loop])
+
+    # Invariant code motion
+
+    def _invariant(self, node, facts):
+        kind = node[0]
+        if kind in ('number', 'char', 'boolean'):
+            return True
+        if kind == 'var':
+            name = node[1]
+            type = self._lookup(name)
+            return (type is not None and not type.startswith('array_') and name not in facts.assigned
+                    and not (facts.has_call and name in self.global_types))
+        if kind == 'array_access':
+            name = node[1]
+            if name in facts.written or name in facts.assigned or (facts.has_call and name in self.global_types):
+                return False
+            return self._invariant(node[2], facts)
+        if kind in ('addop', 'mulop'):
+            return self._invariant(node[2], facts) and self._invariant(node[3], facts)
+        return False
+
+    def _scan_loop(self, condition, body, facts):
+        """Collect the maximal invariant subexpressions worth hoisting, in evaluation order.
+
+        Returns (expression, may fault) pairs; expressions that may fault
+        are only returned when nothing that could fail is evaluated before
+        them in an iteration.
+        """
+        self._candidates = []
+        self._fault_seen = False
+        self._conditional = False
+        self._scan_expr(condition, facts)
+        if not is_pure(condition):
+            self._fault_seen = True  # Can't duplicate the condition into a guard
+        self._scan_stmt(body, facts)
+        return self._candidates
+
+    def _scan_stmt(self, node, facts):
+        kind = node[0]
+        if kind == 'compound_stmt':
+            for stmt in node[2]:
+                self._scan_stmt(stmt, facts)
+        elif kind == 'expr_stmt':
+            self._scan_expr(node[1], facts)
+        elif kind == 'return_stmt':
+            if node[1] is not None:
+                self._scan_expr(node[1], facts)
+            self._conditional = True  # Statements after it don't run on every iteration
+        elif kind in ('if_stmt', 'if_else_stmt', 'while_stmt'):
+            self._scan_expr(node[1], facts)
+            conditional = self._conditional
+            self._conditional = True
+            for branch in node[2:]:
+                self._scan_stmt(branch, facts)
+            self._conditional = conditional or contains(node[2:], ('return_stmt',))
+
+    def _scan_expr(self, node, facts):
+        kind = node[0]
+        if kind in ('addop', 'mulop', 'array_access') and self._invariant(node, facts) \
+                and self._type(node) in ('int', 'float'):
+            faulting = may_fault(node)
+            if not faulting or not (self._conditional or self._fault_seen):
+                self._candidates.append((node, faulting))
+                self._fault_seen = self._fault_seen or faulting
+                return
+            # Too early to evaluate as a whole, but parts of it may not fault
+        if kind in ('and', 'or'):
+            self._scan_expr(node[1], facts)
+            conditional = self._conditional
+            self._conditional = True
+            self._scan_expr(node[2], facts)
+            self._conditional = conditional
+        elif kind == 'assign':
+            self._scan_expr(node[2], facts)
+            if node[1][0] == 'array_access':
+                self._scan_expr(node[1][2], facts)
+                self._fault_seen = True
+        elif kind == 'array_access':
+            self._scan_expr(node[2], facts)
+            self._fault_seen = True
+        elif kind == 'call':
+            for arg in node[2]:
+                self._scan_expr(arg, facts)
+            self._fault_seen = True
+        elif kind in ('relop', 'addop', 'mulop'):
+            self._scan_expr(node[2], facts)
+            self._scan_expr(node[3], facts)
+            if kind == 'mulop' and node[1] == '/':
+                self._fault_seen = True
+
+    def _replace(self, node, replacements):
+        """Substitute the collected subexpressions; replacements maps id(node) -> replacement."""
+        if isinstance(node, list):
+            items = [self._replace(item, replacements) for item in node]
+            return node if all(a is b for a, b in zip(items, node)) else items
+        if not isinstance(node, tuple):
+            return node
+        if id(node) in replacements:
+            return replacements[id(node)]
+        if node[0] == 'assign' and node[1][0] == 'array_access':
+            # A store target stays an access; only its index is an expression
+            target = node[1]
+            index = self._replace(target[2], replacements)
+            value = self._replace(node[2], replacements)
+            if index is target[2] and value is node[2]:
+                return node
+            return ('assign', self._rebuilt(target, ('array_access', target[1], index)), value)
+        children = [self._replace(child, replacements) for child in node[1:]]
+        if all(a is b for a, b in zip(children, node[1:])):
+            return node
+        return self._rebuilt(node, (node[0],) + tuple(children))
+
+    # Strength reduction
+
+    def _induction_variables(self, body, facts):
+        """Find `name = name +/- c` statements at the top level of the body.
+
+        Returns {name: (statement index, signed step)} for int variables
+        assigned nowhere else in the loop.
+        """
+        if body[0] != 'compound_stmt':
+            return {}
+        found = {}
+        for k, stmt in enumerate(body[2]):
+            if stmt[0] != 'expr_stmt' or stmt[1][0] != 'assign':
+                continue
+            target, value = stmt[1][1], stmt[1][2]
+            if (target[0] == 'var' and value[0] == 'addop' and value[2] == target
+                    and value[3][0] == 'number' and value[3][1].__class__ is int):
+                name = target[1]
+                if (facts.updates.get(name) == 1 and self._lookup(name) == 'int'
+                        and name not in facts.declared and not (facts.has_call and name in self.global_types)):
+                    found[name] = (k, value[3][1] if value[1] == '+' else -value[3][1])
+        return found
+
+    def _reduce(self, body, facts, report):
+        """Reduce products of induction variables in the body (the condition is shared with the guard)."""
+        variables = self._induction_variables(body, facts)
+        if not variables:
+            return body, []
+        products = []
+        self._find_products(body, variables, facts, products)
+
+        replacements, reduced, initial, steps = {}, [], [], {}
+        for product, name, factor in products:
+            shared = _equal_to(product, reduced)
+            if shared is not None:
+                replacements[id(product)] = shared
+                continue
+            temp = self._temporary('ind', 'int')
+            replacements[id(product)] = ('var', temp)
+            reduced.append((product, ('var', temp)))
+            step = variables[name][1]
+            if factor[0] == 'number':
+                increment = ('number', step * factor[1])
+            elif step == 1:
+                increment = factor
+            else:
+                step_temp = self._temporary('inv', 'int')
+                initial.append(('expr_stmt', ('assign', ('var', step_temp), ('mulop', '*', ('number', step), factor))))
+                increment = ('var', step_temp)
+                report.hoisted.append((step_temp, format_expr(initial[-1][1][2])))
+            initial.append(('expr_stmt', ('assign', ('var', temp), product)))
+            update = ('expr_stmt', ('assign', ('var', temp), ('addop', '+', ('var', temp), increment)))
+            steps.setdefault(variables[name][0], []).append(update)
+            report.reduced.append((temp, format_expr(product), format_expr(increment)))
+        if not replacements:
+            return body, []
+
+        stmts = []
+        for k, stmt in enumerate(body[2]):
+            if k in steps:
+                stmts.append(stmt)  # The induction variable's own update stays unreplaced
+                stmts.extend(steps[k])
+            else:
+                stmts.append(self._replace(stmt, replacements))
+        return ('compound_stmt', body[1], stmts), initial
+
+    def _find_products(self, node, variables, facts, products):
+        if isinstance(node, list):
+            for item in node:
+                self._find_products(item, variables, facts, products)
+            return
+        if not isinstance(node, tuple):
+            return
+        if node[0] == 'mulop' and node[1] == '*':
+            for iv, factor in ((node[2], node[3]), (node[3], node[2])):
+                if (iv[0] == 'var' and iv[1] in variables and self._type(factor) == 'int'
+                        and factor[0] in ('number', 'var') and self._invariant(factor, facts)):
+                    products.append((node, iv[1], factor))
+                    return
+        for child in node[1:]:
+            if isinstance(child, (tuple, list)):
+                self._find_products(child, variables, facts, products)
+
+
+def optimize_loops(ast, positions=None, hoist=True, reduce=True):
+    """Optimize the while loops of a checked AST; returns (new AST, optimizer)."""
+    optimizer = LoopOptimizer(ast, positions, hoist, reduce)
+    return optimizer.optimize(), optimizer
@@ -0,0 +1,190 @@
+"""
+Table-driven LR parse loop over dense integer tables.
+
+PLY keeps its LALR tables as dicts of dicts keyed by state and token name
+and wraps every grammar symbol in an object. LRTables flattens the same
+tables into `array` rows indexed by state * columns + symbol code, and
+LRDriver runs the shift/reduce loop straight off a TokenBuffer's type
+codes, calling the Parser's p_* actions exactly as PLY would.
+
+The driver has no error recovery: on a syntax error it raises
+SyntaxErrorFound and the caller reparses with PLY, so diagnostics and the
+error productions behave exactly as before.
+"""
+from array import array
+
+from .lexer import TOKEN_NAMES
+
+# Action encoding: 0 is an error, s + 1 shifts to state s, -(p + 1) reduces
+# by production p. Production 0 is S' -> program, so -1 accepts.
+ERROR = 0
+ACCEPT = -1
+
+
+class SyntaxErrorFound(Exception):
+    """Raised by LRDriver where PLY would start error recovery."""
+    pass
+
+
+def _encode(action):
+    if action > 0:
+        return action + 1
+    if action < 0:
+        return action - 1
+    return ACCEPT
+
+
+class LRTables:
+    """Dense integer versions of a PLY LRParser's action and goto tables."""
+
+    def __init__(self, lr_parser):
+        states = len(lr_parser.action)
+        terminals = sorted({name for row in lr_parser.action.values() for name in row})
+        nonterminals = sorted({name for row in lr_parser.goto.values() for name in row})
+        self.columns = {name: col for col, name in enumerate(terminals)}
+        self.nonterminal_columns = {name: col for col, name in enumerate(nonterminals)}
+        self.width = len(terminals)
+        self.goto_width = len(nonterminals)
+        self.end_column = self.columns['$end']
+
+        self.action = array('i', [ERROR]) * (states * self.width)
+        for state, row in lr_parser.action.items():
+            for name, action in row.items():
+                self.action[state * self.width + self.columns[name]] = _encode(action)
+
+        # PLY reduces in these states without reading a token. Reading ahead
+        # from a TokenBuffer has no side effects, so the default action simply
+        # fills the whole row.
+        for state, action in lr_parser.defaulted_states.items():
+            row = state * self.width
+            self.action[row:row + self.width] = array('i', [_encode(action)]) * self.width
+
+        self.goto = array('i', [-1]) * (states * self.goto_width)
+        for state, row in lr_parser.goto.items():
+            for name, target in row.items():
+                self.goto[state * self.goto_width + self.nonterminal_columns[name]] = target
+
+        # Production p -> (p_* callable, goto column of its left side, right side length)
+        self.productions = [
+            (production.callable, self.nonterminal_columns.get(production.name, -1), production.len)
+            for production in lr_parser.productions
+        ]
+        self.production_names = [production.func for production in lr_parser.productions]
+
+        # Lexer token code -> action column (-1 for tokens the grammar never uses)
+        self.token_columns = array('i', [self.columns.get(name, -1) for name in TOKEN_NAMES])
+
+    @classmethod
+    def from_module(cls, module, actions):
+        """Load tables written by to_source(), binding p_* callables from actions."""
+        tables = cls.__new__(cls)
+        tables.width, tables.goto_width, tables.end_column = module.width, module.goto_width, module.end_column
+        tables.action = array('i', module.action)
+        tables.goto = array('i', module.goto)
+        tables.production_names = list(module.production_names)
+        tables.productions = [
+            (getattr(actions, name) if name else None, lhs, length)
+            for name, (lhs, length) in zip(module.production_names, module.productions)
+        ]
+        tables.token_columns = array('i', module.token_columns)
+        return tables
+
+    def to_source(self, digest):
+        """Render the tables as an importable module, stamped with the grammar digest."""
+        productions = [(lhs, length) for _, lhs, length in self.productions]
+        return (
+            "# Integer LR tables for LRDriver, generated by python -m src.build_tables. Don't edit!\n"
+            f"grammar_digest = {digest!r}\n"
+            f"width = {self.width}\n"
+            f"goto_width = {self.goto_width}\n"
+            f"end_column = {self.end_column}\n"
+            f"action = {tuple(self.action)!r}\n"
+            f"goto = {tuple(self.goto)!r}\n"
+            f"production_names = {tuple(self.production_names)!r}\n"
+            f"productions = {tuple(productions)!r}\n"
+            f"token_columns = {tuple(self.token_columns)!r}\n"
+        )
+
+
+class _Reduction(list):
+    """The `p` argument handed to p_* actions; mirrors PLY's YaccProduction.
+
+    A list of the right-hand side values (p[0] holds the result), so
+    indexing and len() run at list speed.
+    """
+    __slots__ = ('positions', 'buffer')
+
+    def lineno(self, n):
+        index = self.positions[n]
+        return self.buffer.lines[index] if index >= 0 else 0
+
+    def lexpos(self, n):
+        index = self.positions[n]
+        return self.buffer.starts[index] if index >= 0 else 0
+
+
+class LRDriver:
+    """Runs the LR parse loop for one grammar over TokenBuffers."""
+
+    def __init__(self, lr_parser=None, tables=None):
+        self.tables = tables if tables is not None else LRTables(lr_parser)
+
+    def parse(self, buffer):
+        """Parse a TokenBuffer and return the start symbol's value."""
+        tables = self.tables
+        action, goto = tables.action, tables.goto
+        width, goto_width = tables.width, tables.goto_width
+        productions = tables.productions
+        value_of = buffer.value
+
+        # Action column of every token, then $end
+        token_columns = tables.token_columns
+        columns = [token_columns[code] for code in buffer.types]
+        columns.append(tables.end_column)
+        if -1 in columns:
+            raise SyntaxErrorFound()
+
+        states = [0]
+        values = [None]
+        positions = [-1]
+        index = 0
+
+        while True:
+            act = action[states[-1] * width + columns[index]]
+
+            if act > 0:
+                states.append(act - 1)
+                values.append(value_of(index))
+                positions.append(index)
+                index += 1
+            elif act < ACCEPT:
+                callable, lhs, length = productions[-act - 1]
+                # Slot 0 of the slices is overwritten by the result / unused
+                if length == 1:
+                    reduction = _Reduction((None, values[-1]))
+                    reduction.positions = (-1, positions[-1])
+                    reduction.buffer = buffer
+                    callable(reduction)
+                    states[-1] = goto[states[-2] * goto_width + lhs]
+                    values[-1] = reduction[0]
+                    positions[-1] = -1
+                    continue
+                if length:
+                    reduction = _Reduction(values[-length - 1:])
+                    reduction.positions = positions[-length - 1:]
+                    del states[-length:]
+                    del values[-length:]
+                    del positions[-length:]
+                    reduction[0] = None
+                else:
+                    reduction = _Reduction((None,))
+                    reduction.positions = (-1,)
+                reduction.buffer = buffer
+                callable(reduction)
+                states.append(goto[states[-1] * goto_width + lhs])
+                values.append(reduction[0])
+                positions.append(-1)
+            elif act == ACCEPT:
+                return values[-1]
+            else:
+                raise SyntaxErrorFound()
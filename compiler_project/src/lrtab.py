@@ -0,0 +1,10 @@
+# Integer LR tables for LRDriver, generated by python -m src.build_tables. Don't edit!
+grammar_digest = 'da163d9f'
+width = 39
+goto_width = 34
+end_column = 0
+action = (0, 0, 0, 15, 14, 0, 0, 0, 0, 0, 10, 0, 12, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -2, 0, 0, 15, 14, 0, 0, 0, 0, 0, 10, 0, 12, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0, -4, 0, 0, -4, -4, 0, 0, 0, 0, 0, -4, 0, -4, 0, 0, 0, 0, 0, -4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -5, 0, 0, -5, -5, 0, 0, 0, 0, 0, -5, 0, -5, 0, 0, 0, 0, 0, -5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -5, 0, 0, -6, 0, 0, -6, -6, 0, 0, 0, 0, 0, -6, 0, -6, 0, 0, 0, 0, 0, -6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -6, 0, 0, -7, 0, 0, -7, -7, 0, 0, 0, 0, 0, -7, 0, -7, 0, 0, 0, 0, 0, -7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -7, 0, 0, -8, 0, 0, -8, -8, 0, 0, 0, 0, 0, -8, 0, -8, 0, 0, 0, 0, 0, -8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15, 14, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -15, -3, 0, 0, -3, -3, 0, 0, 0, 0, 0, -3, 0, -3, 0, 0, 0, 0, 0, -3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21, 0, 23, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 20, 0, 0, 0, 0, 22, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -22, 0, 0, -22, -22, 0, 0, 0, 0, 0, -22, 0, -22, 0, 0, 0, 0, 0, -22, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -22, 0, 0, -9, 0, 0, -9, -9, -9, 0, 0, 0, 0, -9, -9, -9, -9, 0, 0, -9, -9, -9, -9, 0, 0, -9, 0, 0, 0, -9, 0, 0, -9, 0, -9, 0, -9, 0, -9, -9, -9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -16, 0, 0, -16, -16, -16, 0, 0, 0, 0, -16, -16, -16, -16, 0, 0, -16, -16, -16, -16, 0, 0, -16, 0, 0, 0, -16, 0, 0, -16, 0, -16, 0, -16, 0, -16, -16, -16, 0, 0, 0, 0, 15, 14, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 29, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 0, 33, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 31, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 35, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 36, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -23, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -26, 0, 0, 0, 0, 0, 0, -19, 0, 0, -19, -19, 0, 0, 0, 0, 0, -19, 0, -19, 0, 0, 0, 0, 0, -19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 38, 0, 0, 0, 39, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15, 14, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 29, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -27, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -27, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 45, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 44, 0, 0, 0, 0, 0, 0, 0, 0, 15, 14, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 47, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 49, 0, 0, 0, 0, 0, 0, -10, 0, 0, -10, -10, -10, 0, 0, 0, 0, -10, -10, -10, -10, 0, 0, -10, -10, -10, -10, 0, 0, -10, 0, 0, 0, -10, 0, 0, -10, 0, -10, 0, -10, 0, -10, -10, -10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 50, 0, 0, 0, 0, 0, 0, 0, 0, -17, 0, 0, -17, -17, 0, 0, 0, 0, 0, -17, 0, -17, 0, 0, 0, 0, 0, -17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -17, 0, 0, -18, 0, 0, -18, -18, 0, 0, 0, 0, 0, -18, 0, -18, 0, 0, 0, 0, 0, -18, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -18, 0, 0, 0, 0, 0, -85, -85, -85, 0, 0, 0, 0, 0, -85, -85, -85, 0, 0, -85, -85, -85, -85, 0, 0, -85, 0, 0, 0, -85, 0, 0, -85, 0, -85, 0, -85, 0, -85, -85, -85, 0, 0, 0, 0, 0, 0, 0, -25, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -25, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 53, 0, 0, 0, 0, 0, -21, 0, 0, -21, -21, 0, 0, 0, 0, 0, -21, 0, -21, 0, 0, 0, 0, 0, -21, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -21, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 44, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -28, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -28, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15, 14, -85, 0, 0, 0, 0, 0, -85, 12, -85, 0, 0, -85, -85, 11, -85, 0, 0, -85, 0, 0, 0, -85, 0, 0, -85, 0, -85, 0, -85, 0, -85, 13, -85, 0, 0, 0, 0, -31, -31, -31, 0, 0, 0, 0, 0, -31, -31, -31, 0, 0, -31, -31, -31, -31, 0, 0, -31, 0, 0, 0, -31, 0, 0, -31, 0, -31, 0, -31, 0, -31, -31, -31, 0, -20, 0, 0, -20, -20, 0, 0, 0, 0, 0, -20, 0, -20, 0, 0, 0, 0, 0, -20, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -20, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 67, 0, 45, 0, 0, 68, 0, 0, 0, 80, 0, 0, 58, 0, 70, 0, 66, 0, 83, 0, 69, 0, 0, 0, 0, -30, -30, -30, 0, 0, 0, 0, 0, -30, -30, -30, 0, 0, -30, -30, -30, -30, 0, 0, -30, 0, 0, 0, -30, 0, 0, -30, 0, -30, 0, -30, 0, -30, -30, -30, 0, 0, 0, 0, 0, 0, -33, 0, 0, 0, 0, 0, -33, 0, -33, 0, 0, -33, -33, 0, -33, 0, 0, -33, 0, 0, 0, -33, 0, 0, -33, 0, -33, 0, -33, 0, -33, 0, -33, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 85, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -29, 0, 0, -29, -29, -29, 0, 0, -29, 0, -29, -29, -29, -29, 0, 0, -29, -29, -29, -29, 0, 0, -29, 0, 0, 0, -29, 0, 0, -29, 0, -29, 0, -29, 0, -29, -29, -29, 0, 0, 0, 0, 0, 0, -32, 0, 0, 0, 0, 0, -32, 0, -32, 0, 0, -32, -32, 0, -32, 0, 0, -32, 0, 0, 0, -32, 0, 0, -32, 0, -32, 0, -32, 0, -32, 0, -32, 0, 0, 0, 0, 0, 0, -34, 0, 0, -34, 0, 0, -34, 0, -34, 0, 0, -34, -34, 0, -34, 0, 0, -34, 0, 0, 0, -34, 0, 0, -34, 0, -34, 0, -34, 0, -34, 0, -34, 0, 0, 0, 0, 0, 0, -35, 0, 0, -35, 0, 0, -35, 0, -35, 0, 0, -35, -35, 0, -35, 0, 0, -35, 0, 0, 0, -35, 0, 0, -35, 0, -35, 0, -35, 0, -35, 0, -35, 0, 0, 0, 0, 0, 0, -36, 0, 0, -36, 0, 0, -36, 0, -36, 0, 0, -36, -36, 0, -36, 0, 0, -36, 0, 0, 0, -36, 0, 0, -36, 0, -36, 0, -36, 0, -36, 0, -36, 0, 0, 0, 0, 0, 0, -37, 0, 0, -37, 0, 0, -37, 0, -37, 0, 0, -37, -37, 0, -37, 0, 0, -37, 0, 0, 0, -37, 0, 0, -37, 0, -37, 0, -37, 0, -37, 0, -37, 0, 0, 0, 0, 0, 0, -38, 0, 0, -38, 0, 0, -38, 0, -38, 0, 0, -38, -38, 0, -38, 0, 0, -38, 0, 0, 0, -38, 0, 0, -38, 0, -38, 0, -38, 0, -38, 0, -38, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 86, 0, 0, 0, 0, 87, 0, 0, 0, 0, 0, -40, 0, 0, -40, 0, 0, -40, 0, -40, 0, 0, -40, -40, 0, -40, 0, 0, -40, 0, 0, 0, -40, 0, 0, -40, 0, -40, 0, -40, 0, -40, 0, -40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 88, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 90, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 91, 0, 83, 0, 0, 0, 0, -73, 93, 0, 0, 0, -73, -73, 0, -73, 0, 0, 0, 0, -73, -73, 0, 0, 0, 0, 0, -73, 0, -73, -73, -73, 0, -73, -73, 0, -73, 0, -73, -73, -73, 0, 0, 0, -73, 0, 0, 0, 0, 0, 0, -49, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 94, 0, 0, -49, 0, -49, -49, 0, 0, 0, 0, -49, 0, -50, -50, 0, 0, 0, -50, -50, 0, -50, 0, 0, 0, 0, -50, -50, 0, 0, 0, 0, 95, -50, 96, -50, -50, -50, 0, -50, -50, 0, -50, 0, -50, -50, -50, 0, 0, 0, -50, 0, 97, 0, 0, 0, 0, -53, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -53, 0, 0, -53, 0, -53, -53, 0, 0, 0, 0, -53, 0, -55, 0, 0, 0, 0, -55, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -55, 0, 0, -55, 0, -55, -55, 0, 0, 0, 0, -55, 0, -57, 0, 0, 0, 0, -57, 0, 0, 104, 0, 0, 0, 0, 103, 102, 0, 0, 0, 0, 0, 100, 0, 101, 107, 105, 0, -57, 106, 0, -57, 0, -57, -57, 0, 0, 0, 0, -57, 0, -65, 0, 0, 0, 0, -65, 110, 0, -65, 0, 0, 0, 0, -65, -65, 0, 0, 0, 0, 0, -65, 0, -65, -65, -65, 0, -65, -65, 0, -65, 0, -65, -65, 109, 0, 0, 0, -65, 0, -69, 0, 0, 0, 0, -69, -69, 0, -69, 0, 0, 0, 0, -69, -69, 0, 0, 0, 0, 0, -69, 0, -69, -69, -69, 0, -69, -69, 0, -69, 0, -69, -69, -69, 0, 0, 0, -69, 0, -74, 0, 0, 0, 0, -74, -74, 0, -74, 0, 0, 0, 0, -74, -74, 0, 0, 0, 0, 0, -74, 0, -74, -74, -74, 0, -74, -74, 0, -74, 0, -74, -74, -74, 0, 0, 0, -74, 0, -75, 0, 0, 0, 0, -75, -75, 0, -75, 0, 0, 0, 0, -75, -75, 0, 0, 0, 0, 0, -75, 0, -75, -75, -75, 0, -75, -75, 0, -75, 0, -75, -75, -75, 0, 0, 0, -75, 0, -76, 0, 0, 0, 0, -76, -76, 0, -76, 0, 0, 0, 0, -76, -76, 0, 0, 0, 0, 0, -76, 0, -76, -76, -76, 0, -76, -76, 0, -76, 0, -76, -76, -76, 0, 0, 0, -76, 0, -77, 0, 0, 0, 0, -77, -77, 0, -77, 0, 0, 0, 0, -77, -77, 0, 0, 0, 0, 0, -77, 0, -77, -77, -77, 0, -77, -77, 0, -77, 0, -77, -77, -77, 0, 0, 0, -77, 0, -78, 0, 0, 0, 0, -78, -78, 0, -78, 0, 0, 0, 0, -78, -78, 0, 0, 0, 0, 0, -78, 0, -78, -78, -78, 0, -78, -78, 0, -78, 0, -78, -78, -78, 0, 0, 0, -78, 0, -79, 0, 0, 0, 0, -79, -79, 0, -79, 0, 0, 0, 0, -79, -79, 0, 0, 0, 0, 0, -79, 0, -79, -79, -79, 0, -79, -79, 0, -79, 0, -79, -79, -79, 0, 0, 0, -79, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 20, 0, 0, 0, 0, 22, 0, 0, 0, 0, 0, -39, 0, 0, -39, 0, 0, -39, 0, -39, 0, 0, -39, -39, 0, -39, 0, 0, -39, 0, 0, 0, -39, 0, 0, -39, 0, -39, 0, -39, 0, -39, 0, -39, 0, 0, 0, 0, 0, 0, -41, 0, 0, -41, 0, 0, -41, 0, -41, 0, 0, -41, -41, 0, -41, 0, 0, -41, 0, 0, 0, -41, 0, 0, -41, 0, -41, 0, -41, 0, -41, 0, -41, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 112, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, -45, 0, 0, -45, 0, 0, -45, 0, -45, 0, 0, -45, -45, 0, -45, 0, 0, -45, 0, 0, 0, -45, 0, 0, -45, 0, -45, 0, -45, 0, -45, 0, -45, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 114, 0, 0, 0, 0, 115, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, -85, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, -58, 0, 0, 0, 0, 0, -58, 0, -58, 0, 0, -58, 0, 0, 0, 0, 0, -58, 0, 0, 0, -58, 0, 0, 0, 0, 0, 0, 0, 0, -58, 0, 0, 0, 0, 0, 0, 0, 0, -59, 0, 0, 0, 0, 0, -59, 0, -59, 0, 0, -59, 0, 0, 0, 0, 0, -59, 0, 0, 0, -59, 0, 0, 0, 0, 0, 0, 0, 0, -59, 0, 0, 0, 0, 0, 0, 0, 0, -60, 0, 0, 0, 0, 0, -60, 0, -60, 0, 0, -60, 0, 0, 0, 0, 0, -60, 0, 0, 0, -60, 0, 0, 0, 0, 0, 0, 0, 0, -60, 0, 0, 0, 0, 0, 0, 0, 0, -61, 0, 0, 0, 0, 0, -61, 0, -61, 0, 0, -61, 0, 0, 0, 0, 0, -61, 0, 0, 0, -61, 0, 0, 0, 0, 0, 0, 0, 0, -61, 0, 0, 0, 0, 0, 0, 0, 0, -62, 0, 0, 0, 0, 0, -62, 0, -62, 0, 0, -62, 0, 0, 0, 0, 0, -62, 0, 0, 0, -62, 0, 0, 0, 0, 0, 0, 0, 0, -62, 0, 0, 0, 0, 0, 0, 0, 0, -63, 0, 0, 0, 0, 0, -63, 0, -63, 0, 0, -63, 0, 0, 0, 0, 0, -63, 0, 0, 0, -63, 0, 0, 0, 0, 0, 0, 0, 0, -63, 0, 0, 0, 0, 0, 0, 0, 0, -66, 0, 0, 0, 0, 0, -66, 0, -66, 0, 0, -66, 0, 0, 0, 0, 0, -66, 0, 0, 0, -66, 0, 0, 0, 0, 0, 0, 0, 0, -66, 0, 0, 0, 0, 0, 0, 0, 0, -67, 0, 0, 0, 0, 0, -67, 0, -67, 0, 0, -67, 0, 0, 0, 0, 0, -67, 0, 0, 0, -67, 0, 0, 0, 0, 0, 0, 0, 0, -67, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, -70, 0, 0, 0, 0, 0, -70, 0, -70, 0, 0, -70, 0, 0, 0, 0, 0, -70, 0, 0, 0, -70, 0, 0, 0, 0, 0, 0, 0, 0, -70, 0, 0, 0, 0, 0, 0, 0, 0, -71, 0, 0, 0, 0, 0, -71, 0, -71, 0, 0, -71, 0, 0, 0, 0, 0, -71, 0, 0, 0, -71, 0, 0, 0, 0, 0, 0, 0, 0, -71, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 128, 0, 0, 0, 0, 0, 0, 0, -72, 0, 0, 0, 0, -72, -72, 0, -72, 0, 0, 0, 0, -72, -72, 0, 0, 0, 0, 0, -72, 0, -72, -72, -72, 0, -72, -72, 0, -72, 0, -72, -72, -72, 0, 0, 0, -72, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 129, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -46, 0, 0, -46, 0, 0, -46, 0, -46, 0, 0, -46, -46, 0, -46, 0, 0, -46, 0, 0, 0, -46, 0, 0, -46, 0, -46, 0, -46, 0, -46, 0, -46, 0, 0, 0, 0, 0, 0, -47, 0, 0, -47, 0, 0, -47, 0, -47, 0, 0, -47, -47, 0, -47, 0, 0, -47, 0, 0, 0, -47, 0, 0, -47, 0, -47, 0, -47, 0, -47, 0, -47, 0, 0, 0, 0, 0, 0, 0, -48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -48, 0, -48, -48, 0, 0, 0, 0, -48, 0, 97, 0, 0, 0, 0, -52, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -52, 0, 0, -52, 0, -52, -52, 0, 0, 0, 0, -52, 0, -73, 0, 0, 0, 0, -73, -73, 0, -73, 0, 0, 0, 0, -73, -73, 0, 0, 0, 0, 0, -73, 0, -73, -73, -73, 0, -73, -73, 0, -73, 0, -73, -73, -73, 0, 0, 0, -73, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 130, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 131, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 132, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -81, 0, 0, 0, 0, 0, 0, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, 0, 0, 0, 0, 0, 0, -84, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -84, 0, 0, 0, 0, 0, 0, 0, -54, 0, 0, 0, 0, -54, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -54, 0, 0, -54, 0, -54, -54, 0, 0, 0, 0, -54, 0, -56, 0, 0, 0, 0, -56, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 107, 0, 0, -56, 106, 0, -56, 0, -56, -56, 0, 0, 0, 0, -56, 0, -64, 0, 0, 0, 0, -64, 110, 0, -64, 0, 0, 0, 0, -64, -64, 0, 0, 0, 0, 0, -64, 0, -64, -64, -64, 0, -64, -64, 0, -64, 0, -64, -64, 109, 0, 0, 0, -64, 0, -68, 0, 0, 0, 0, -68, -68, 0, -68, 0, 0, 0, 0, -68, -68, 0, 0, 0, 0, 0, -68, 0, -68, -68, -68, 0, -68, -68, 0, -68, 0, -68, -68, -68, 0, 0, 0, -68, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 67, 0, 45, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 70, 0, 66, 0, 83, 0, 69, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 67, 0, 45, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 70, 0, 66, 0, 83, 0, 69, 0, 0, -51, -51, 0, 0, 0, -51, -51, 0, -51, 0, 0, 0, 0, -51, -51, 0, 0, 0, 0, 0, -51, 0, -51, -51, -51, 0, -51, -51, 0, -51, 0, -51, -51, -51, 0, 0, 0, -51, 0, -80, 0, 0, 0, 0, -80, -80, 0, -80, 0, 0, 0, 0, -80, -80, 0, 0, 0, 0, 0, -80, 0, -80, -80, -80, 0, -80, -80, 0, -80, 0, -80, -80, -80, 0, 0, 0, -80, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 0, 0, 0, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 83, 0, 0, 0, 0, 0, 0, 0, 0, -42, 0, 0, 136, 0, 0, -42, 0, -42, 0, 0, -42, -42, 0, -42, 0, 0, -42, 0, 0, 0, -42, 0, 0, -42, 0, -42, 0, -42, 0, -42, 0, -42, 0, 0, 0, 0, 0, 0, -44, 0, 0, -44, 0, 0, -44, 0, -44, 0, 0, -44, -44, 0, -44, 0, 0, -44, 0, 0, 0, -44, 0, 0, -44, 0, -44, 0, -44, 0, -44, 0, -44, 0, 0, 0, 0, 0, 0, 0, -83, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -83, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 0, 0, 0, 0, 84, 0, 81, 0, 0, 73, 67, 0, 45, 0, 0, 68, 0, 0, 0, 80, 0, 0, 0, 0, 70, 0, 66, 0, 83, 0, 69, 0, 0, 0, 0, 0, 0, -43, 0, 0, -43, 0, 0, -43, 0, -43, 0, 0, -43, -43, 0, -43, 0, 0, -43, 0, 0, 0, -43, 0, 0, -43, 0, -43, 0, -43, 0, -43, 0, -43, 0)
+goto = (-1, -1, -1, -1, -1, -1, -1, 3, 2, -1, -1, -1, 7, -1, 5, 6, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, 8, -1, 4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 15, -1, -1, -1, -1, 7, -1, 5, 6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 8, -1, 4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 18, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 17, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 29, 27, 26, -1, -1, -1, -1, -1, -1, -1, -1, 25, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 29, 27, 39, -1, -1, -1, -1, -1, -1, -1, -1, 25, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 42, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 45, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 25, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 51, -1, -1, -1, -1, -1, -1, -1, 50, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 55, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 53, -1, 56, -1, 54, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, 60, -1, -1, -1, 64, 59, -1, 77, -1, -1, 62, -1, 71, -1, -1, -1, -1, -1, -1, 63, 61, 74, 58, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, -1, -1, -1, -1, 88, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, -1, -1, -1, -1, 91, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 98, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 97, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 107, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, -1, -1, -1, -1, 110, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, -1, -1, -1, -1, 112, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, -1, -1, -1, -1, 115, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, 75, -1, 116, -1, -1, 78, -1, -1, -1, -1, -1, -1, -1, 77, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 117, -1, 75, -1, 73, -1, -1, 78, -1, -1, -1, -1, 118, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, 75, -1, 73, 120, 119, 78, -1, -1, -1, 121, 122, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, 75, -1, -1, -1, -1, 78, -1, -1, -1, -1, -1, -1, -1, 77, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 123, -1, -1, 76, -1, 117, -1, 124, -1, -1, -1, -1, 78, -1, -1, -1, -1, -1, -1, -1, 77, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 76, -1, 117, -1, -1, -1, -1, -1, -1, 78, -1, -1, -1, -1, -1, -1, -1, 77, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 125, -1, 117, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 78, -1, -1, -1, -1, -1, -1, -1, 126, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 117, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 98, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 107, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, 60, -1, -1, -1, 64, 59, -1, 77, -1, -1, 62, -1, 71, -1, -1, -1, -1, -1, -1, 63, 61, 74, 132, -1, 76, -1, 70, -1, 75, -1, 73, -1, -1, 78, 60, -1, -1, -1, 64, 59, -1, 77, -1, -1, 62, -1, 71, -1, -1, -1, -1, -1, -1, 63, 61, 74, 133, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, -1, -1, -1, -1, 134, -1, -1, 77, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, 73, -1, -1, 78, 60, -1, -1, -1, 64, 59, -1, 77, -1, -1, 62, -1, 71, -1, -1, -1, -1, -1, -1, 63, 61, 74, 136, -1, 76, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+production_names = (None, 'p_program', 'p_declaration_list', 'p_declaration_list', 'p_declaration', 'p_declaration', 'p_declaration', 'p_declaration', 'p_var_declaration', 'p_var_declaration', 'p_type_specifier', 'p_type_specifier', 'p_type_specifier', 'p_type_specifier', 'p_type_specifier', 'p_var_declaration_error', 'p_fun_declaration', 'p_fun_prototype', 'p_extern_declaration', 'p_extern_declaration', 'p_extern_declaration', 'p_extern_declaration', 'p_params', 'p_params', 'p_param_list', 'p_param_list', 'p_param', 'p_param', 'p_compound_stmt', 'p_local_declarations', 'p_local_declarations', 'p_statement_list', 'p_statement_list', 'p_statement', 'p_statement', 'p_statement', 'p_statement', 'p_statement', 'p_expression_stmt', 'p_expression_stmt', 'p_expression_stmt_error', 'p_selection_stmt', 'p_selection_stmt', 'p_iteration_stmt', 'p_return_stmt', 'p_return_stmt', 'p_return_stmt_error', 'p_expression', 'p_expression', 'p_var', 'p_var', 'p_logical_expression', 'p_logical_expression', 'p_and_expression', 'p_and_expression', 'p_simple_expression', 'p_simple_expression', 'p_relop', 'p_relop', 'p_relop', 'p_relop', 'p_relop', 'p_relop', 'p_additive_expression', 'p_additive_expression', 'p_addop', 'p_addop', 'p_term', 'p_term', 'p_mulop', 'p_mulop', 'p_factor', 'p_factor', 'p_factor', 'p_factor', 'p_factor', 'p_factor', 'p_factor', 'p_factor', 'p_call', 'p_args', 'p_args', 'p_arg_list', 'p_arg_list', 'p_empty')
+productions = ((-1, 1), (23, 1), (8, 2), (8, 1), (7, 1), (7, 1), (7, 1), (7, 1), (33, 3), (33, 6), (31, 1), (31, 1), (31, 1), (31, 1), (31, 1), (33, 3), (14, 6), (15, 6), (12, 4), (12, 7), (12, 6), (12, 2), (22, 1), (22, 1), (21, 3), (21, 1), (20, 2), (20, 4), (6, 4), (17, 2), (17, 1), (29, 2), (29, 1), (28, 1), (28, 1), (28, 1), (28, 1), (28, 1), (11, 2), (11, 1), (11, 2), (26, 5), (26, 7), (16, 5), (25, 2), (25, 3), (25, 3), (10, 3), (10, 1), (32, 1), (32, 4), (18, 3), (18, 1), (2, 3), (2, 1), (27, 3), (27, 1), (24, 1), (24, 1), (24, 1), (24, 1), (24, 1), (24, 1), (0, 3), (0, 1), (1, 1), (1, 1), (30, 3), (30, 1), (19, 1), (19, 1), (13, 3), (13, 1), (13, 1), (13, 1), (13, 1), (13, 1), (13, 1), (13, 1), (5, 4), (4, 1), (4, 1), (3, 3), (3, 1), (9, 0))
+token_columns = (16, 26, 13, 5, 28, 24, 34, 7, 23, 21, 15, 14, 9, 25, 1, 27, 2, 33, 6, 22, 32, 19, 29, 20, 30, 17, 8, 37, 31, 18, 12, 36, 4, 3, 35, 11, 10)
@@ -0,0 +1,481 @@
+"""
+Language Server Protocol server over stdio.
+
+Editors start one server for the session instead of posting the whole
+buffer to the web app on every change. The server keeps a warm
+CompileEngine and, per open document, its text and the last CompileResult
+that has an AST, so hover and go-to-definition answer from that document's
+SymbolTable and cross-reference index without compiling again (positions
+refer to the text that was analysed, which may be a few keystrokes old).
+
+Edits are analysed on a debounce timer: every change to a document moves
+its analysis `--debounce` seconds out, so a burst of keystrokes costs one
+compilation. An analysis overtaken by a newer edit stops at the next phase
+boundary and its diagnostics are never published. Diagnostics come from
+Parser.errors and SemanticAnalyzer.errors; syntax errors carry their line
+and position, while semantic errors point at the first occurrence of the
+name they quote, or at the first line.
+
+The keystroke-to-diagnostic latency of every change, from reading it to
+publishing diagnostics that include it, is recorded. While typing outpaces
+the debounce, that is mostly the rest of the burst, so the latency of the
+change each publication was analysed at, the one typed just before a pause,
+is recorded separately as the settled latency. The custom
+`compiler/latency` request returns both as percentiles with the analysis
+counters, and the server prints them to stderr when it exits.
+
+    python -m src.main lsp [--debounce 0.15] [--hash-cons]
+
+Changes may be full or incremental; positions count code points, which
+match the protocol's UTF-16 units for the ASCII this language is written in.
+"""
+import argparse
+import collections
+import json
+import re
+import sys
+import threading
+import time
+
+from .service import CompileCancelled, CompileEngine
+
+# JSON-RPC and LSP error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+SEVERITY_ERROR = 1
+SYNC_INCREMENTAL = 2
+
+_SYNTAX_ERROR = re.compile(r"^Syntax error at line \d+, position (\d+)(?:: Unexpected token '(.*)')?")
+_LINE = re.compile(r"line (\d+)(?:, position (\d+))?")
+_QUOTED_NAME = re.compile(r"'([A-Za-z_]\w*)'")
+
+
+class ProtocolError(Exception):
+    """Raised when the client sends a message without a valid header."""
+    pass
+
+
+# Documents and diagnostics
+
+def apply_change(text, change):
+    """Apply one TextDocumentContentChangeEvent to a document's text."""
+    if 'range' not in change:
+        return change['text']
+    start = _offset(text, change['range']['start'])
+    end = _offset(text, change['range']['end'])
+    return text[:start] + change['text'] + text[max(start, end):]
+
+
+def _offset(text, position):
+    offset = 0
+    for _ in range(position['line']):
+        newline = text.find('\n', offset)
+        if newline < 0:
+            return len(text)
+        offset = newline + 1
+    end = text.find('\n', offset)
+    return min(offset + position['character'], len(text) if end < 0 else end)
+
+
+def _range(lines, line, character=None, length=1):
+    """Range on a 0-based line: `length` characters from `character`, or the line without its indentation."""
+    line = max(0, min(line, len(lines) - 1))
+    text = lines[line].rstrip()
+    if character is None:
+        character = len(text) - len(text.lstrip())
+        end = len(text)
+    else:
+        character = min(character, len(text))
+        end = min(character + max(length, 1), len(text))
+    return {'start': {'line': line, 'character': character}, 'end': {'line': line, 'character': end}}
+
+
+def _syntax_range(text, lines, error):
+    match = _SYNTAX_ERROR.match(error)
+    if match:
+        # Syntax errors report the token's offset in the source, not its column
+        lexpos = min(int(match.group(1)), len(text))
+        line = text.count('\n', 0, lexpos)
+        return _range(lines, line, lexpos - text.rfind('\n', 0, lexpos) - 1, len(match.group(2) or ''))
+    if error == "Syntax error at EOF":
+        line = len(lines) - 1
+        while line > 0 and not lines[line].strip():
+            line -= 1
+        return _range(lines, line, len(lines[line].rstrip()))
+    match = _LINE.search(error)
+    if match is None:
+        return _range(lines, 0)
+    if match.group(2) is None:
+        return _range(lines, int(match.group(1)) - 1)
+    return _range(lines, int(match.group(1)) - 1, int(match.group(2)) - 1)  # Brace errors count columns from 1
+
+
+def _semantic_range(text, lines, error):
+    match = _QUOTED_NAME.search(error)
+    if match:
+        use = re.search(r'\b%s\b' % match.group(1), text)
+        if use:
+            start = use.start()
+            line = text.count('\n', 0, start)
+            return _range(lines, line, start - text.rfind('\n', 0, start) - 1, len(match.group(1)))
+    return _range(lines, 0)
+
+
+def diagnostics(text, result):
+    """Get the LSP Diagnostics for a CompileResult of text."""
+    lines = text.split('\n')
+    out = [{'range': _syntax_range(text, lines, error), 'severity': SEVERITY_ERROR,
+            'source': 'syntax', 'message': error}
+           for error in result.syntax_errors]
+    out.extend({'range': _semantic_range(text, lines, error), 'severity': SEVERITY_ERROR,
+                'source': 'semantic', 'message': error}
+               for error in result.semantic_errors)
+    return out
+
+
+def _percentiles(samples):
+    """Get p50, p90, p99 and max of latencies in seconds, in milliseconds."""
+    samples = sorted(samples)
+
+    def percentile(p):
+        if not samples:
+            return None
+        return round(samples[min(len(samples) - 1, int(p / 100 * len(samples)))] * 1000, 3)
+
+    return {'p50': percentile(50), 'p90': percentile(90), 'p99': percentile(99), 'max': percentile(100),
+            'samples': len(samples)}
+
+
+def _location_range(reference):
+    line, character = reference.line - 1, reference.column - 1
+    return {'start': {'line': line, 'character': character},
+            'end': {'line': line, 'character': character + reference.end - reference.start}}
+
+
+class Document:
+    """An open text document and what the server last learned about it."""
+
+    def __init__(self, uri, text, version):
+        self.uri = uri
+        self.text = text
+        self.version = version
+        self.open = True
+        self.due = None  # perf_counter time its debounced analysis starts, or None
+        self.edits = []  # (version, perf_counter time read) of changes not yet in published diagnostics
+        self.result = None  # Last CompileResult with an AST
+
+
+# Server
+
+class LanguageServer:
+    """Serves one LSP client over a pair of binary streams.
+
+    The calling thread reads messages and keeps the documents up to date;
+    analyses run on a worker thread that owns the CompileEngine.
+    """
+
+    def __init__(self, reader, writer, debounce=0.15, hash_cons=False, latency_window=4096):
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce
+        self.hash_cons = hash_cons
+        self.engine = None
+        self.documents = {}
+        self.lock = threading.Condition()  # Guards the documents and wakes the worker
+        self.write_lock = threading.Lock()
+        self.running = False
+        self.initialized = False
+        self.shutdown_requested = False
+        self.latencies = collections.deque(maxlen=latency_window)  # Every change
+        self.settled = collections.deque(maxlen=latency_window)  # The change each publication was analysed at
+        self.counters = collections.Counter()
+        self.requests = {
+            'initialize': self.initialize,
+            'shutdown': self.shutdown,
+            'textDocument/hover': self.hover,
+            'textDocument/definition': self.definition,
+            'compiler/latency': lambda params: self.metrics(),
+        }
+        self.notifications = {
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didClose': self.did_close,
+        }
+
+    # Transport
+
+    def read_message(self):
+        """Read one message, or return None at the end of the input."""
+        length = None
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                if length is not None:
+                    break
+                continue
+            name, _, value = line.decode('ascii').partition(':')
+            if name.strip().lower() == 'content-length':
+                try:
+                    length = int(value)
+                except ValueError:
+                    raise ProtocolError(f"Invalid Content-Length {value.strip()!r}")
+        body = self.reader.read(length)
+        if len(body) < length:
+            return None
+        return json.loads(body)
+
+    def send(self, message):
+        message['jsonrpc'] = '2.0'
+        body = json.dumps(message).encode('utf-8')
+        with self.write_lock:
+            self.writer.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+            self.writer.flush()
+
+    def notify(self, method, params):
+        self.send({'method': method, 'params': params})
+
+    def respond_error(self, request_id, code, message):
+        self.send({'id': request_id, 'error': {'code': code, 'message': message}})
+
+    # Main loop
+
+    def serve(self):
+        """Warm the engine and serve until `exit` or the end of the input; returns the exit code."""
+        self.engine = CompileEngine(self.hash_cons)
+        self.engine.compile('void main(void) { }')
+        self.running = True
+        worker = threading.Thread(target=self._analyze_loop, daemon=True)
+        worker.start()
+        try:
+            while True:
+                try:
+                    message = self.read_message()
+                except ProtocolError as e:
+                    print(f"lsp: {e}", file=sys.stderr)
+                    return 1
+                except ValueError:
+                    self.respond_error(None, PARSE_ERROR, "Message is not valid JSON")
+                    continue
+                if message is None or message.get('method') == 'exit':
+                    break
+                self.dispatch(message)
+        finally:
+            with self.lock:
+                self.running = False
+                self.lock.notify_all()
+            worker.join(1.0)
+            print(self.report(), file=sys.stderr)
+        return 0 if self.shutdown_requested else 1
+
+    def dispatch(self, message):
+        method = message.get('method')
+        params = message.get('params') or {}
+        if 'id' not in message:
+            handler = self.notifications.get(method)
+            if handler is not None and self.initialized:
+                try:
+                    handler(params)
+                except Exception as e:
+                    print(f"lsp: {method} failed: {e!r}", file=sys.stderr)
+            return  # Other notifications, $/cancelRequest included, are optional
+
+        request_id = message['id']
+        handler = self.requests.get(method)
+        if handler is None:
+            self.respond_error(request_id, METHOD_NOT_FOUND, f"Unknown method {method}")
+        elif not self.initialized and method != 'initialize':
+            self.respond_error(request_id, SERVER_NOT_INITIALIZED, "Server is not initialized")
+        elif self.shutdown_requested:
+            self.respond_error(request_id, INVALID_REQUEST, "Server is shutting down")
+        else:
+            try:
+                result = handler(params)
+            except Exception as e:
+                self.respond_error(request_id, INTERNAL_ERROR, f"{method} failed: {e!r}")
+            else:
+                self.send({'id': request_id, 'result': result})
+
+    # Requests and notifications
+
+    def initialize(self, params):
+        self.initialized = True
+        return {
+            'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': SYNC_INCREMENTAL},
+                'hoverProvider': True,
+                'definitionProvider': True,
+            },
+            'serverInfo': {'name': 'compiler-lsp'},
+        }
+
+    def shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def did_open(self, params):
+        item = params['textDocument']
+        document = Document(item['uri'], item['text'], item.get('version'))
+        with self.lock:
+            old = self.documents.get(document.uri)
+            if old is not None:
+                old.open = False
+            self.documents[document.uri] = document
+            document.due = time.perf_counter()  # Nothing to wait for on open
+            self.lock.notify_all()
+
+    def did_change(self, params):
+        received = time.perf_counter()
+        item = params['textDocument']
+        with self.lock:
+            document = self.documents.get(item['uri'])
+            if document is None:
+                return
+            text = document.text
+            for change in params['contentChanges']:
+                text = apply_change(text, change)
+            document.text = text
+            document.version = item.get('version')
+            document.edits.append((document.version, received))
+            document.due = received + self.debounce
+            self.counters['changes'] += 1
+            self.lock.notify_all()
+
+    def did_close(self, params):
+        uri = params['textDocument']['uri']
+        with self.lock:
+            document = self.documents.pop(uri, None)
+            if document is None:
+                return
+            document.open = False
+        self.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+
+    def _reference_at(self, params):
+        """Get the last result of a document and the Reference at the request's position."""
+        with self.lock:
+            document = self.documents.get(params['textDocument']['uri'])
+            result = document.result if document is not None else None
+        if result is None or result.xref is None:
+            return None, None
+        position = params['position']
+        return result, result.xref.symbol_at_line(position['line'] + 1, position['character'] + 1)
+
+    def hover(self, params):
+        result, reference = self._reference_at(params)
+        if reference is None:
+            return None
+        symbol = result.symbol_table.symbols.get(reference.key)
+        if symbol is None:
+            return None
+        size = f"[{symbol.size}]" if symbol.size is not None else ''
+        return {'contents': {'kind': 'plaintext', 'value': f"{symbol.kind} {symbol.type} {symbol.name}{size} ({symbol.scope})"},
+                'range': _location_range(reference)}
+
+    def definition(self, params):
+        result, reference = self._reference_at(params)
+        if reference is None:
+            return None
+        declaration = result.xref.definition(*reference.key)
+        if declaration is None:
+            return None
+        return {'uri': params['textDocument']['uri'], 'range': _location_range(declaration)}
+
+    # Analysis
+
+    def _next_due(self):
+        """Wait for the document whose analysis is due first; None once the server stops."""
+        while self.running:
+            now = time.perf_counter()
+            due = [document for document in self.documents.values() if document.due is not None]
+            if not due:
+                self.lock.wait()
+                continue
+            document = min(due, key=lambda document: document.due)
+            if document.due <= now:
+                document.due = None
+                return document
+            self.lock.wait(document.due - now)
+        return None
+
+    def _analyze_loop(self):
+        while True:
+            with self.lock:
+                document = self._next_due()
+                if document is None:
+                    return
+                text, version = document.text, document.version
+            self._analyze(document, text, version)
+
+    def _analyze(self, document, text, version):
+        def stale():
+            return document.version != version or not document.open
+
+        self.counters['analyses'] += 1
+        try:
+            result = self.engine.compile(text, cancelled=stale)
+        except CompileCancelled:
+            self.counters['cancelled'] += 1
+            return
+        except Exception as e:
+            self.counters['failed'] += 1
+            print(f"lsp: analysis of {document.uri} failed: {e!r}", file=sys.stderr)
+            return
+        with self.lock:
+            if stale():
+                self.counters['cancelled'] += 1  # Overtaken during the last phase
+                return
+            if result.ast:
+                document.result = result
+            # Versions only grow, so these diagnostics also cover edits whose own analysis was cancelled
+            edits = [edit for edit in document.edits if edit[0] <= version]
+            document.edits = [edit for edit in document.edits if edit[0] > version]
+        params = {'uri': document.uri, 'version': version, 'diagnostics': diagnostics(text, result)}
+        # Record first, so a client that asks for the latency right after these diagnostics sees them
+        published = time.perf_counter()
+        self.counters['published'] += 1
+        self.latencies.extend(published - received for _, received in edits)
+        if edits and edits[-1][0] == version:
+            self.settled.append(published - edits[-1][1])
+        self.notify('textDocument/publishDiagnostics', params)
+
+    # Metrics
+
+    def metrics(self):
+        """Get keystroke-to-diagnostic latency percentiles in milliseconds and the analysis counters."""
+        return {
+            'documents': len(self.documents),
+            'debounce_ms': self.debounce * 1000,
+            'counters': dict(self.counters),
+            'latency_ms': _percentiles(self.latencies),
+            'settled_ms': _percentiles(self.settled),
+        }
+
+    def report(self):
+        metrics = self.metrics()
+        out = [f"lsp: {', '.join(f'{name} {count}' for name, count in sorted(metrics['counters'].items())) or 'no analyses'}"]
+        for label, key in (('keystroke-to-diagnostic', 'latency_ms'), ('settled', 'settled_ms')):
+            latency = metrics[key]
+            if latency['samples']:
+                out.append(f"lsp: {label} p50 {latency['p50']}ms, p90 {latency['p90']}ms, p99 {latency['p99']}ms, "
+                           f"max {latency['max']}ms over {latency['samples']} changes")
+        return '\n'.join(out)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog='main.py lsp', description="Language server over stdio")
+    arg_parser.add_argument('--debounce', type=float, default=0.15, metavar='SECONDS',
+                            help="Quiet time after a change before it is analysed")
+    arg_parser.add_argument('--hash-cons', action='store_true', help="Share identical expression subtrees")
+    args = arg_parser.parse_args(argv)
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer, args.debounce, args.hash_cons)
+    return server.serve()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,49 +1,84 @@
 import sys
-from .lexer import Lexer
-from .parser import Parser
-from .semantic import SemanticAnalyzer
-from .symbol_table import SymbolTable
+
+# Each phase is imported right before it runs, so --tokens and --syntax
+# don't pay for loading the phases they skip.
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python main.py <input_file>")
+    if len(sys.argv) > 1 and sys.argv[1] == 'index':
+        from .symbol_index import main as index_main
+        index_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'check':
+        from .modules import main as check_main
+        sys.exit(check_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'run':
+        from .run import main as run_main
+        sys.exit(run_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'parse-profile':
+        from .parse_profiler import main as parse_profile_main
+        sys.exit(parse_profile_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'lsp':
+        from .lsp_server import main as lsp_main
+        sys.exit(lsp_main(sys.argv[2:]))
+
+    args = sys.argv[1:]
+    mode = None
+    if args and args[0] in ('--tokens', '--syntax'):
+        mode = args.pop(0)[2:]
+
+    if len(args) != 1:
+        print("Usage: python main.py [--tokens | --syntax] <input_file>")
+        print("       python main.py index {update,find,callers,callees} ...")
+        print("       python main.py check <module>... [--interfaces DIR]")
+        print("       python main.py run <input_file> [entry [args...]] [--profile] [--collapsed PATH] [--json PATH]")
+        print("                          [--fold] [--optimize-loops] [--inline] [--inline-threshold N]")
+        print("                          [--tail-calls] [--stack-machine]")
+        print("       python main.py parse-profile <input_file> [--repeat N] [--ply] [--hash-cons] [--limit N] [--json PATH]")
+        print("       python main.py lsp [--debounce SECONDS] [--hash-cons]")
         sys.exit(1)
 
     # Read input file
     try:
-        with open(sys.argv[1], 'r') as file:
+        with open(args[0], 'r') as file:
             input_text = file.read()
     except FileNotFoundError:
-        print(f"Error: File '{sys.argv[1]}' not found")
+        print(f"Error: File '{args[0]}' not found")
         sys.exit(1)
 
-    # Initialize components
-    symbol_table = SymbolTable()
-    lexer = Lexer()
-    parser = Parser()
-    semantic_analyzer = SemanticAnalyzer(symbol_table)
-
     # Lexical Analysis
     print("\n=== Lexical Analysis ===")
-    lexer.input(input_text)
-    while True:
-        token = lexer.token()
-        if not token:
-            break
+    if mode == 'tokens':
+        from .lexer import Lexer
+        lexer = Lexer()
+    else:
+        # The parser builds its own lexer; share it
+        from .parser import Parser
+        parser = Parser()
+        lexer = parser.lexer
+    tokens = lexer.tokenize(input_text)
+    for token in tokens:
         print(f"Token: {token.type}, Value: {token.value}, Line: {token.lineno}, Position: {token.lexpos}")
+    if mode == 'tokens':
+        return
 
     # Syntax Analysis
     print("\n=== Syntax Analysis ===")
-    ast = parser.parse(input_text)
+    ast = parser.parse(input_text, tokens)
     if not ast:
         print("Syntax analysis failed")
         sys.exit(1)
     print("Syntax analysis successful")
     print("Abstract Syntax Tree:")
     print_ast(ast)
+    if mode == 'syntax':
+        return
 
     # Semantic Analysis
     print("\n=== Semantic Analysis ===")
+    from .semantic import SemanticAnalyzer
+    from .symbol_table import SymbolTable
+    symbol_table = SymbolTable()
+    semantic_analyzer = SemanticAnalyzer(symbol_table)
     if semantic_analyzer.analyze(ast):
         print("Semantic analysis successful")
     else:
@@ -56,6 +91,11 @@ def main():
     print("\n=== Symbol Table ===")
     print_symbol_table(symbol_table)
 
+    # Frame Layout
+    print("\n=== Frame Layout ===")
+    from .frame_layout import layout_frames
+    print_frames(layout_frames(symbol_table))
+
 def print_ast(node, level=0):
     """Pretty print the AST."""
     indent = "  " * level
@@ -84,5 +124,12 @@ def print_symbol_table(symbol_table):
             if sym_scope == scope:
                 print(f"  {name}: {symbol.type}")
 
+def print_frames(frames):
+    """Pretty print per-function frame sizes and slot offsets."""
+    for function, frame in frames.items():
+        print(f"{function}: {frame.size} bytes")
+        for (name, scope), offset in frame.slots.items():
+            print(f"  {offset:>4}  {name} ({scope})")
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
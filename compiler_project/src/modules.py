@@ -0,0 +1,219 @@
+"""
+Separate compilation with per-module interface summaries.
+
+A module's interface is the part of its global scope other modules can
+see: the functions it defines (return type and the `params` recorded by
+the analyzer), its global variables and arrays, and the extern
+declarations and prototypes it expects someone else to define. Interfaces
+are small, so checking a program file by file only ever holds one AST plus
+every module's summary in memory.
+
+ModuleBuilder writes each summary once per source digest and reuses it
+until the source changes; dependents load the summary instead of
+re-parsing the source. Names a module uses but doesn't declare resolve
+through the other modules' summaries, and a final link step checks the
+summaries against each other.
+
+    python -m src.main check a.c b.c --interfaces build/
+"""
+import argparse
+import hashlib
+import marshal
+import os
+import struct
+import zlib
+
+from .artifact import source_digest
+
+# Header: magic, format version, payload CRC32, payload length
+MAGIC = b'CLCI'
+VERSION = 1
+_HEADER = struct.Struct('<4sHII')
+
+_EXPORTED_KINDS = ('function', 'variable', 'array')
+
+
+class InterfaceError(Exception):
+    """Raised when an interface file is corrupt or written by another format version."""
+    pass
+
+
+class ModuleInterface:
+    """The exported and extern globals of one module.
+
+    Both map a name to a (kind, type, params, size) tuple.
+    """
+
+    def __init__(self, module, digest, exports=None, externs=None):
+        self.module = module
+        self.digest = digest
+        self.exports = exports or {}
+        self.externs = externs or {}
+
+    def __repr__(self):
+        return f"ModuleInterface({self.module}, {len(self.exports)} exports, {len(self.externs)} externs)"
+
+
+def build_interface(module, digest, symbol_table):
+    """Summarize the global scope of an analyzed symbol table."""
+    interface = ModuleInterface(module, digest)
+    for (name, scope), symbol in symbol_table.symbols.items():
+        if scope != 'global' or symbol.kind not in _EXPORTED_KINDS:
+            continue
+        params = symbol.attributes['params'] if symbol.kind == 'function' else None
+        entry = (symbol.kind, symbol.type, params, symbol.size)
+        if symbol.attributes.get('extern'):
+            interface.externs[name] = entry
+        else:
+            interface.exports[name] = entry
+    return interface
+
+
+def merge_exports(interfaces):
+    """Merge module exports into the imports map a SymbolTable resolves names through.
+
+    Maps name -> (module, kind, type, params, size); a name exported by
+    several modules resolves to the first (link_errors reports the clash).
+    """
+    imports = {}
+    for interface in interfaces:
+        for name, entry in interface.exports.items():
+            if name not in imports:
+                imports[name] = (interface.module,) + entry
+    return imports
+
+
+def dumps(interface):
+    """Serialize an interface to bytes."""
+    payload = marshal.dumps((interface.module, interface.digest, interface.exports, interface.externs))
+    return _HEADER.pack(MAGIC, VERSION, zlib.crc32(payload), len(payload)) + payload
+
+
+def loads(data):
+    """Deserialize an interface written by dumps()."""
+    if len(data) < _HEADER.size:
+        raise InterfaceError("Interface is truncated")
+    magic, version, checksum, length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise InterfaceError("Not a module interface")
+    if version != VERSION:
+        raise InterfaceError(f"Unsupported interface version {version}, expected {VERSION}")
+    payload = memoryview(data)[_HEADER.size:]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise InterfaceError("Interface checksum mismatch")
+    return ModuleInterface(*marshal.loads(payload))
+
+
+def link_errors(interfaces):
+    """Check module interfaces against each other.
+
+    Reports globals defined by more than one module, and extern
+    declarations that no module defines or that disagree with the
+    definition.
+    """
+    errors = []
+    definitions = {}
+    for interface in interfaces:
+        for name in interface.exports:
+            if name in definitions:
+                errors.append(f"Multiple definitions of '{name}' in {definitions[name].module} and {interface.module}")
+            else:
+                definitions[name] = interface
+    for interface in interfaces:
+        for name, (kind, type, params, size) in interface.externs.items():
+            definition = definitions.get(name)
+            if definition is None:
+                errors.append(f"Undefined reference to '{name}' declared in {interface.module}")
+                continue
+            defined_kind, defined_type, defined_params, defined_size = definition.exports[name]
+            if (type != defined_type or params != defined_params
+                    or (size is not None and size != defined_size)):
+                errors.append(f"Declaration of '{name}' in {interface.module} conflicts with "
+                              f"its definition in {definition.module}")
+    return errors
+
+
+class ModuleBuilder:
+    """Checks a set of source files one module at a time.
+
+    Interfaces are cached as files in interface_dir, keyed by the module
+    path and validated against the source digest.
+    """
+
+    def __init__(self, interface_dir, engine=None):
+        self.interface_dir = interface_dir
+        os.makedirs(interface_dir, exist_ok=True)
+        self._engine = engine
+        self.parsed = 0  # Sources compiled to (re)build their interface
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from .service import CompileEngine
+            self._engine = CompileEngine()
+        return self._engine
+
+    def interface_path(self, module):
+        key = hashlib.sha1(os.path.abspath(module).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.interface_dir, f'{os.path.basename(module)}.{key}.iface')
+
+    def interface(self, module, source):
+        """Get the interface of a module, rebuilding it only if the source changed."""
+        digest = source_digest(source)
+        path = self.interface_path(module)
+        try:
+            with open(path, 'rb') as file:
+                interface = loads(file.read())
+            if interface.digest == digest:
+                return interface
+        except (OSError, InterfaceError, ValueError, EOFError, TypeError):
+            pass
+
+        self.parsed += 1
+        result = self.engine.compile(source)
+        interface = build_interface(module, digest, result.symbol_table)
+        with open(path, 'wb') as file:
+            file.write(dumps(interface))
+        return interface
+
+    def check(self, modules):
+        """Check every module against the others' interfaces.
+
+        Returns ({module: [errors]}, [link errors]).
+        """
+        interfaces = []
+        for module in modules:
+            with open(module, 'r') as file:
+                interfaces.append(self.interface(module, file.read()))
+
+        imports = merge_exports(interfaces)
+        diagnostics = {}
+        for module in modules:
+            with open(module, 'r') as file:
+                source = file.read()
+            result = self.engine.compile(source, imports, module)
+            diagnostics[module] = result.syntax_errors + result.semantic_errors
+        return diagnostics, link_errors(interfaces)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog='main.py check', description="Check modules separately")
+    arg_parser.add_argument('modules', nargs='+', help="Source files")
+    arg_parser.add_argument('--interfaces', default='.interfaces', help="Directory for interface summaries")
+    args = arg_parser.parse_args(argv)
+
+    builder = ModuleBuilder(args.interfaces)
+    diagnostics, link = builder.check(args.modules)
+    failed = bool(link)
+    for module, errors in diagnostics.items():
+        for error in errors:
+            print(f"{module}: {error}")
+        failed = failed or bool(errors)
+    for error in link:
+        print(f"link: {error}")
+    print(f"{len(args.modules)} modules checked, {builder.parsed} interfaces rebuilt")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+"""
+Parallel lexing for large sources.
+
+No token in this language spans a line break (comments are '//' to end of
+line, char literals are single-line), so a source can be cut at any
+newline and each piece lexed on its own. Pieces are lexed in a process
+pool into TokenBuffer columns with whole-source positions and lines, and
+the columns are concatenated in order.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .lexer import Lexer, TokenBuffer
+
+# Below this size the pool costs more than it saves
+MIN_PARALLEL_SIZE = 4 * 1024 * 1024
+
+_lexer = None
+
+
+def _lex_chunk(chunk, offset, line):
+    global _lexer
+    if _lexer is None:
+        _lexer = Lexer()
+    errors = []
+    buffer = _lexer.tokenize(chunk, offset, line, errors)
+    return buffer.types, buffer.starts, buffer.lengths, buffer.lines, errors
+
+
+def split_source(data, chunks):
+    """Split data into about `chunks` pieces that each end just after a newline.
+
+    Returns (piece, offset, first line) triples covering all of data.
+    """
+    target = max(1, len(data) // max(1, chunks))
+    pieces = []
+    start, line = 0, 1
+    while start < len(data):
+        end = data.find('\n', min(start + target, len(data)) - 1)
+        end = len(data) if end < 0 else end + 1
+        pieces.append((data[start:end], start, line))
+        line += data.count('\n', start, end)
+        start = end
+    return pieces
+
+
+def tokenize_parallel(data, workers=None, executor=None, min_size=MIN_PARALLEL_SIZE):
+    """Lex data into a TokenBuffer identical to Lexer().tokenize(data).
+
+    Small inputs are lexed serially. Pass an existing executor to reuse
+    warm worker processes across calls.
+    """
+    workers = workers or os.cpu_count() or 1
+    if len(data) < min_size or (workers == 1 and executor is None):
+        return Lexer().tokenize(data)
+
+    # A few chunks per worker keeps the pool busy when chunks lex unevenly
+    pieces = split_source(data, workers * 4)
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(workers)
+    try:
+        results = executor.map(_lex_chunk, *zip(*pieces))
+        buffer = TokenBuffer(data)
+        for types, starts, lengths, lines, errors in results:
+            buffer.types.extend(types)
+            buffer.starts.extend(starts)
+            buffer.lengths.extend(lengths)
+            buffer.lines.extend(lines)
+            for char, line in errors:
+                print(f"Illegal character '{char}' at line {line}")
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return buffer
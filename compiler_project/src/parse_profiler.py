@@ -0,0 +1,206 @@
+"""
+Grammar-level profiler for the Parser, and the `parse-profile` command.
+
+ProfilingParser parses exactly like Parser while it records, per p_*
+action, how many reductions ran it and the time spent in it, plus the
+tokens shifted, how often p_error started error recovery and how often the
+integer-table LRDriver gave up on a syntax error so PLY reparsed the input.
+Reductions of the `*_error` productions count as recoveries too. Time the
+parse spent outside the actions is the LR loop itself: table lookups,
+shifts and the stack (and, with --hash-cons, interning the nodes the
+actions build).
+
+Every p_* action is wrapped on the instance before the tables are bound,
+so both the LRDriver and PLY (which orders rules by `co_firstlineno`, kept
+from the wrapped method) call the counting versions.
+
+    python -m src.main parse-profile prog.c --repeat 20 --json profile.json
+"""
+import argparse
+import json
+import sys
+import time
+
+from .lr_driver import LRDriver, SyntaxErrorFound
+from .parser import Parser
+
+
+class RuleStats:
+    """Reductions and time in seconds for one p_* action."""
+    __slots__ = ('reductions', 'seconds')
+
+    def __init__(self):
+        self.reductions = 0
+        self.seconds = 0.0
+
+
+class ParseProfile:
+    """What a ProfilingParser recorded over one or more parses."""
+
+    def __init__(self):
+        self.rules = {}  # p_* name -> RuleStats
+        self.parses = 0
+        self.shifts = 0  # Tokens shifted; under PLY, tokens read (error recovery may discard some)
+        self.fallbacks = 0  # Parses the LRDriver handed to PLY for error recovery
+        self.seconds = 0.0
+
+    @property
+    def reductions(self):
+        return sum(stats.reductions for name, stats in self.rules.items() if name != 'p_error')
+
+    @property
+    def recoveries(self):
+        """Calls of p_error plus reductions of the `*_error` productions."""
+        return sum(stats.reductions for name, stats in self.rules.items() if name.endswith('_error'))
+
+    @property
+    def action_seconds(self):
+        return sum(stats.seconds for stats in self.rules.values())
+
+    def report(self, limit=None):
+        """Format the totals and the actions sorted by time spent in them."""
+        total = self.seconds or 1e-12
+        actions = self.action_seconds
+        out = [
+            f"parses {self.parses}, shifts {self.shifts}, reductions {self.reductions}, "
+            f"recoveries {self.recoveries}, driver fallbacks {self.fallbacks}",
+            f"total {self.seconds * 1000:.2f}ms: actions {actions * 1000:.2f}ms ({actions / total:.0%}), "
+            f"LR loop {(self.seconds - actions) * 1000:.2f}ms ({(self.seconds - actions) / total:.0%})",
+            '',
+            f"{'action':<28} {'reductions':>10} {'time':>10} {'per call':>9} {'share':>6}",
+        ]
+        ranked = sorted(((name, stats) for name, stats in self.rules.items() if stats.reductions),
+                        key=lambda item: (-item[1].seconds, item[0]))
+        for name, stats in ranked[:limit]:
+            out.append(f"{name:<28} {stats.reductions:>10} {stats.seconds * 1000:>8.2f}ms "
+                       f"{stats.seconds / stats.reductions * 1e6:>7.2f}us {stats.seconds / total:>6.1%}")
+        return '\n'.join(out)
+
+    def to_dict(self):
+        return {
+            'parses': self.parses,
+            'shifts': self.shifts,
+            'reductions': self.reductions,
+            'recoveries': self.recoveries,
+            'fallbacks': self.fallbacks,
+            'seconds': self.seconds,
+            'action_seconds': self.action_seconds,
+            'rules': {name: {'reductions': stats.reductions, 'seconds': stats.seconds}
+                      for name, stats in sorted(self.rules.items(), key=lambda item: -item[1].seconds)},
+        }
+
+
+class _CountingDriver:
+    """Stands in for the LRDriver to count its shifts and fallbacks."""
+
+    def __init__(self, driver, profile):
+        self.driver = driver
+        self.profile = profile
+
+    def parse(self, buffer):
+        try:
+            value = self.driver.parse(buffer)
+        except SyntaxErrorFound:
+            self.profile.fallbacks += 1
+            raise
+        self.profile.shifts += len(buffer.types)  # The driver shifts every token of an accepted input once
+        return value
+
+
+class _CountingPLY:
+    """Stands in for PLY's LRParser to count the tokens it reads."""
+
+    def __init__(self, parser, profile):
+        self.ply_parser = parser
+        self.profile = profile
+
+    def __getattr__(self, name):
+        return getattr(self.ply_parser, name)
+
+    def parse(self, input=None, lexer=None, **kwargs):
+        profile = self.profile
+        next_token = lexer.token
+
+        def token():
+            tok = next_token()
+            if tok is not None:
+                profile.shifts += 1
+            return tok
+        return self.ply_parser.parse(input, lexer=lexer, tokenfunc=token, **kwargs)
+
+
+class ProfilingParser(Parser):
+    """A Parser that records a ParseProfile as it parses."""
+
+    def __init__(self, hash_cons=False):
+        self.profile = ParseProfile()
+        for name in dir(Parser):
+            if name.startswith('p_'):
+                setattr(self, name, self._profiled(name, getattr(Parser, name).__get__(self)))
+        super().__init__(hash_cons)
+        if self.driver is None:
+            self.driver = LRDriver(self.parser)
+        self.driver = _CountingDriver(self.driver, self.profile)
+
+    def __getattr__(self, name):
+        if name == 'parser':
+            self.parser = _CountingPLY(super().__getattr__('parser'), self.profile)
+            return self.parser
+        return super().__getattr__(name)
+
+    def _profiled(self, name, action):
+        stats = self.profile.rules[name] = RuleStats()
+        clock = time.perf_counter
+
+        def profiled(p):
+            start = clock()
+            try:
+                return action(p)
+            finally:
+                stats.seconds += clock() - start
+                stats.reductions += 1
+        profiled.__name__ = name
+        profiled.__doc__ = action.__doc__
+        profiled.co_firstlineno = action.__code__.co_firstlineno  # PLY orders productions by it
+        return profiled
+
+    def parse(self, data, tokens=None):
+        start = time.perf_counter()
+        try:
+            return super().parse(data, tokens)
+        finally:
+            self.profile.seconds += time.perf_counter() - start
+            self.profile.parses += 1
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog='main.py parse-profile',
+                                         description="Profile the parser's grammar actions on a source file")
+    arg_parser.add_argument('source')
+    arg_parser.add_argument('--repeat', type=int, default=1, metavar='N', help="Parse the file N times")
+    arg_parser.add_argument('--ply', action='store_true',
+                            help="Parse with PLY and its lexer instead of the LRDriver over a TokenBuffer")
+    arg_parser.add_argument('--hash-cons', action='store_true', help="Share identical expression subtrees")
+    arg_parser.add_argument('--limit', type=int, metavar='N', help="Show only the N slowest actions")
+    arg_parser.add_argument('--json', metavar='PATH', help="Write the profile as JSON")
+    args = arg_parser.parse_args(argv)
+
+    with open(args.source, 'r') as file:
+        code = file.read()
+    parser = ProfilingParser(args.hash_cons)
+    parser.parser  # Load PLY's tables now, not inside the first parse that needs error recovery
+    tokens = None if args.ply else parser.lexer.tokenize(code)
+    for _ in range(args.repeat):
+        parser.parse(code, tokens)
+    for error in parser.errors:
+        print(f"{args.source}: {error}", file=sys.stderr)
+
+    print(parser.profile.report(args.limit))
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(parser.profile.to_dict(), file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
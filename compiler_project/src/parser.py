@@ -1,23 +1,124 @@
-from ply import yacc
+import sys
+import zlib
+
 from .lexer import Lexer
+from .lr_driver import LRDriver, LRTables, SyntaxErrorFound
 from .symbol_table import SymbolTable
+from .type_system import array_type, function_type
+
+# Expression nodes a hash-consing Parser shares between structurally identical occurrences
+INTERNED = frozenset(('var', 'array_access', 'assign', 'or', 'and', 'relop', 'addop', 'mulop',
+                      'number', 'char', 'boolean'))
+
+
+def grammar_digest():
+    """Checksum of the grammar and token rules; the shipped src/lrtab.py records the one it was built from."""
+    checksum = 0
+    for module in (__file__, sys.modules[Lexer.__module__].__file__):
+        with open(module, 'rb') as file:
+            checksum = zlib.crc32(file.read(), checksum)
+    return f'{checksum:08x}'
+
+
+def _current_lrtab():
+    """Get the shipped LRDriver tables, or None if they're missing or out of date."""
+    try:
+        from . import lrtab
+    except ImportError:
+        return None
+    if getattr(lrtab, 'grammar_digest', None) != grammar_digest():
+        return None
+    return lrtab
+
 
 class Parser:
-    def __init__(self):
+    """Builds the tuple AST, recording positions in a side table keyed by id(node).
+
+    With hash_cons=True, structurally identical expression subtrees (INTERNED
+    kinds: names, literals, operators, assignments; not calls) are built once
+    per parse and shared, which shrinks the AST of generated sources that
+    repeat `i = i + 1` thousands of times. The p_* actions build plain
+    tuples; each one is wrapped to intern the node it reduces to, so new
+    expression rules are covered too. A shared node has no single position,
+    so the positions of its occurrences are kept in source order in
+    `occurrences` (id(node) -> [(lexpos, line), ...]) instead.
+    """
+
+    def __init__(self, hash_cons=False):
         self.lexer = Lexer()
         self.tokens = self.lexer.tokens
-        self.parser = yacc.yacc(module=self)
         self.symbol_table = SymbolTable()
         self.ast = None
         self.errors = []
         self.current_line = 1
         self.brace_stack = []  
+        self.driver = None
+        self.positions = {}
+        self.hash_cons = hash_cons
+        self.interned = {}  # Key of a node's kind and children -> the shared node
+        self.occurrences = {}
+        if hash_cons:
+            # Before the actions are bound to the LRDriver or PLY
+            for name in dir(self):
+                if name.startswith('p_') and name != 'p_error':
+                    setattr(self, name, self._interning(getattr(self, name)))
+        lrtab = _current_lrtab()
+        if lrtab is not None:
+            self.driver = LRDriver(tables=LRTables.from_module(lrtab, self))
+
+    def __getattr__(self, name):
+        # PLY's parser is only needed for error recovery and untokenized
+        # input, so ply.yacc is loaded on first use
+        if name == 'parser':
+            from ply import yacc
+            # Tables come from the shipped src/parsetab.py (python -m src.build_tables);
+            # if the grammar changed they are rebuilt in memory, never written here.
+            self.parser = yacc.yacc(module=self, debug=False, write_tables=False)
+            return self.parser
+        raise AttributeError(name)
 
     def update_line_number(self, p):
         """Update current line number based on token."""
         if p and hasattr(p, 'lineno'):
             self.current_line = p.lineno
 
+    def record_position(self, node, p, n):
+        """Remember where the token at p[n] starts: a name-bearing node's identifier,
+        or the keyword (semicolon for expression statements) of a statement."""
+        if self.hash_cons and node[0] in INTERNED:
+            self.occurrences.setdefault(id(node), []).append((p.lexpos(n), p.lineno(n)))
+        else:
+            self.positions[id(node)] = (p.lexpos(n), p.lineno(n))
+
+    def intern(self, node):
+        """Get the shared node structurally identical to node; the first one built becomes it."""
+        # Children are already interned, so their identity stands for their structure;
+        # leaves carry their class so 1, 1.0 and True stay apart
+        key = tuple(id(part) if part.__class__ is tuple else (part.__class__, part) for part in node)
+        shared = self.interned.get(key)
+        if shared is None:
+            shared = self.interned[key] = node
+        return shared
+
+    def _interning(self, action):
+        """Wrap a p_* action so an INTERNED node it reduces to is replaced by the shared one."""
+        def interning(p):
+            action(p)
+            # A rule that passes its only child up returns an already shared node
+            node = p[0]
+            if node.__class__ is tuple and node[0] in INTERNED and not (len(p) > 1 and node is p[1]):
+                shared = self.intern(node)
+                if shared is not node:
+                    p[0] = shared
+                    # Positions the action recorded for its own node belong to the shared one
+                    occurrences = self.occurrences.pop(id(node), None)
+                    if occurrences:
+                        self.occurrences.setdefault(id(shared), []).extend(occurrences)
+        interning.__name__ = action.__name__
+        interning.__doc__ = action.__doc__
+        interning.co_firstlineno = getattr(action, 'co_firstlineno', action.__code__.co_firstlineno)  # PLY orders productions by it
+        return interning
+
     def check_braces(self, data):
         """Check if braces are properly matched in the code."""
         self.brace_stack = []
@@ -57,7 +158,9 @@ class Parser:
 
     def p_declaration(self, p):
         '''declaration : var_declaration
-                      | fun_declaration'''
+                      | fun_declaration
+                      | fun_prototype
+                      | extern_declaration'''
         p[0] = p[1]
 
     # Variable declarations
@@ -67,12 +170,14 @@ class Parser:
         try:
             if len(p) == 4:
                 p[0] = ('var_decl', p[1], p[2])
+                self.record_position(p[0], p, 2)
                 # Add variable to current scope
                 self.symbol_table.insert(p[2], p[1], p.lineno(2), 'variable')
             else:
                 p[0] = ('array_decl', p[1], p[2], p[4])
+                self.record_position(p[0], p, 2)
                 # Add array to current scope
-                self.symbol_table.insert(p[2], f'array_{p[1]}', p.lineno(2), 'array', size=p[4])
+                self.symbol_table.insert(p[2], array_type(p[1]).name, p.lineno(2), 'array', size=p[4])
         except Exception as e:
             self.errors.append(f"Error at line {p.lineno(2)}: {str(e)}")
 
@@ -95,10 +200,33 @@ class Parser:
         '''fun_declaration : type_specifier ID LPAREN params RPAREN compound_stmt'''
         try:
             p[0] = ('fun_decl', p[1], p[2], p[4], p[6])
-            self.symbol_table.insert(p[2], f'function_{p[1]}', p.lineno(2))
+            self.record_position(p[0], p, 2)
+            self.symbol_table.insert(p[2], function_type(p[1]).name, p.lineno(2))
         except Exception as e:
             self.errors.append(f"Error at line {p.lineno(2)}: {str(e)}")
 
+    # Declarations of things defined later or in another module. These are
+    # not inserted into the parser's symbol table, so a later definition
+    # doesn't count as a redeclaration.
+    def p_fun_prototype(self, p):
+        '''fun_prototype : type_specifier ID LPAREN params RPAREN SEMICOLON'''
+        p[0] = ('fun_proto', p[1], p[2], p[4])
+        self.record_position(p[0], p, 2)
+
+    def p_extern_declaration(self, p):
+        '''extern_declaration : EXTERN type_specifier ID SEMICOLON
+                             | EXTERN type_specifier ID LBRACKET NUMBER RBRACKET SEMICOLON
+                             | EXTERN type_specifier ID LBRACKET RBRACKET SEMICOLON
+                             | EXTERN fun_prototype'''
+        if len(p) == 3:
+            p[0] = p[2]
+            return
+        if len(p) == 5:
+            p[0] = ('extern_var_decl', p[2], p[3])
+        else:
+            p[0] = ('extern_array_decl', p[2], p[3], p[5] if len(p) == 8 else None)
+        self.record_position(p[0], p, 3)
+
     def p_params(self, p):
         '''params : param_list
                  | VOID'''
@@ -119,6 +247,7 @@ class Parser:
             p[0] = ('param', p[1], p[2])
         else:
             p[0] = ('array_param', p[1], p[2])
+        self.record_position(p[0], p, 2)
 
     # Statements
     def p_compound_stmt(self, p):
@@ -162,6 +291,7 @@ class Parser:
                          | SEMICOLON'''
         if len(p) == 3:
             p[0] = ('expr_stmt', p[1])
+            self.record_position(p[0], p, 2)
         else:
             p[0] = ('empty_stmt',)
 
@@ -178,10 +308,12 @@ class Parser:
             p[0] = ('if_stmt', p[3], p[5])
         else:
             p[0] = ('if_else_stmt', p[3], p[5], p[7])
+        self.record_position(p[0], p, 1)
 
     def p_iteration_stmt(self, p):
         '''iteration_stmt : WHILE LPAREN expression RPAREN statement'''
         p[0] = ('while_stmt', p[3], p[5])
+        self.record_position(p[0], p, 1)
 
     def p_return_stmt(self, p):
         '''return_stmt : RETURN SEMICOLON
@@ -190,6 +322,7 @@ class Parser:
             p[0] = ('return_stmt', None)
         else:
             p[0] = ('return_stmt', p[2])
+        self.record_position(p[0], p, 1)
 
     # Error handling for missing semicolon in return statement
     def p_return_stmt_error(self, p):
@@ -213,6 +346,7 @@ class Parser:
             p[0] = ('var', p[1])
         else:
             p[0] = ('array_access', p[1], p[3])
+        self.record_position(p[0], p, 1)
 
     def p_logical_expression(self, p):
         '''logical_expression : logical_expression OR and_expression
@@ -297,6 +431,7 @@ class Parser:
     def p_call(self, p):
         '''call : ID LPAREN args RPAREN'''
         p[0] = ('call', p[1], p[3])
+        self.record_position(p[0], p, 1)
 
     def p_args(self, p):
         '''args : arg_list
@@ -321,12 +456,36 @@ class Parser:
         else:
             self.errors.append("Syntax error at EOF")
 
-    def parse(self, data):
-        self.errors = []  # Reset errors before parsing
-        self.lexer.input(data)
+    def reset(self):
+        """Reset per-parse state so a warm Parser can be reused."""
+        self.errors = []
+        self.ast = None
+        self.current_line = 1
+        self.symbol_table = SymbolTable()
+        self.positions = {}
+        self.interned = {}
+        self.occurrences = {}
+
+    def parse(self, data, tokens=None):
+        """Parse source text, optionally from a TokenBuffer already lexed from it.
+
+        With a TokenBuffer the integer-table LRDriver runs the parse; inputs
+        with syntax errors are reparsed by PLY for its error recovery.
+        """
+        self.reset()
         
         # Check braces before parsing
         if not self.check_braces(data):
             return None
             
-        return self.parser.parse(data) 
+        if tokens is not None:
+            if self.driver is None:
+                self.driver = LRDriver(self.parser)
+            try:
+                return self.driver.parse(tokens)
+            except SyntaxErrorFound:
+                self.reset()
+                return self.parser.parse(lexer=tokens.stream())
+        # Pass our own lexer; PLY otherwise falls back to the last lexer built in the process
+        self.lexer.input(data)
+        return self.parser.parse(data, lexer=self.lexer.lexer) 
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AND ASSIGN BOOLEAN CHAR CHAR_LITERAL COMMA DIVIDE ELSE EQ FALSE FALSE FLOAT FLOAT_NUM GE GT ID IF INT LBRACE LBRACKET LE LPAREN LT MINUS NE NUMBER OR PLUS RBRACE RBRACKET RETURN RPAREN SEMICOLON TIMES TRUE TRUE VOID WHILEprogram : declaration_listdeclaration_list : declaration_list declaration\n                          | declarationdeclaration : var_declaration\n                      | fun_declarationvar_declaration : type_specifier ID SEMICOLON\n                         | type_specifier ID LBRACKET NUMBER RBRACKET SEMICOLONtype_specifier : INT\n                        | FLOAT\n                        | VOID\n                        | CHAR\n                        | BOOLEANvar_declaration : type_specifier ID errorfun_declaration : type_specifier ID LPAREN params RPAREN compound_stmtparams : param_list\n                 | VOIDparam_list : param_list COMMA param\n                     | paramparam : type_specifier ID\n                | type_specifier ID LBRACKET RBRACKETcompound_stmt : LBRACE local_declarations statement_list RBRACElocal_declarations : local_declarations var_declaration\n                            | emptystatement_list : statement_list statement\n                        | emptystatement : expression_stmt\n                    | compound_stmt\n                    | selection_stmt\n                    | iteration_stmt\n                    | return_stmtexpression_stmt : expression SEMICOLON\n                         | SEMICOLONexpression_stmt : expression errorselection_stmt : IF LPAREN expression RPAREN statement\n                        | IF LPAREN expression RPAREN statement ELSE statementiteration_stmt : WHILE LPAREN expression RPAREN statementreturn_stmt : RETURN SEMICOLON\n                      | RETURN expression SEMICOLONreturn_stmt : RETURN expression errorexpression : var ASSIGN expression\n                     | logical_expressionvar : ID\n              | ID LBRACKET expression RBRACKETlogical_expression : logical_expression OR and_expression\n                            | and_expressionand_expression : and_expression AND simple_expression\n                        | simple_expressionsimple_expression : additive_expression relop additive_expression\n                           | additive_expressionrelop : LE\n                | LT\n                | GT\n                | GE\n                | EQ\n                | NEadditive_expression : additive_expression addop term\n                             | termaddop : PLUS\n                | MINUSterm : term mulop factor\n                | factormulop : TIMES\n                | DIVIDEfactor : LPAREN expression RPAREN\n                 | var\n                 | call\n                 | NUMBER\n                 | FLOAT_NUM\n                 | CHAR_LITERAL\n                 | TRUE\n                 | FALSEcall : ID LPAREN args RPARENargs : arg_list\n               | emptyarg_list : arg_list COMMA expression\n                   | expressionempty :'
+_lr_signature = 'AND ASSIGN BOOLEAN CHAR CHAR_LITERAL COMMA DIVIDE ELSE EQ EXTERN FALSE FLOAT FLOAT_NUM GE GT ID IF INT LBRACE LBRACKET LE LPAREN LT MINUS NE NUMBER OR PLUS RBRACE RBRACKET RETURN RPAREN SEMICOLON TIMES TRUE VOID WHILEprogram : declaration_listdeclaration_list : declaration_list declaration\n                          | declarationdeclaration : var_declaration\n                      | fun_declaration\n                      | fun_prototype\n                      | extern_declarationvar_declaration : type_specifier ID SEMICOLON\n                         | type_specifier ID LBRACKET NUMBER RBRACKET SEMICOLONtype_specifier : INT\n                        | FLOAT\n                        | VOID\n                        | CHAR\n                        | BOOLEANvar_declaration : type_specifier ID errorfun_declaration : type_specifier ID LPAREN params RPAREN compound_stmtfun_prototype : type_specifier ID LPAREN params RPAREN SEMICOLONextern_declaration : EXTERN type_specifier ID SEMICOLON\n                             | EXTERN type_specifier ID LBRACKET NUMBER RBRACKET SEMICOLON\n                             | EXTERN type_specifier ID LBRACKET RBRACKET SEMICOLON\n                             | EXTERN fun_prototypeparams : param_list\n                 | VOIDparam_list : param_list COMMA param\n                     | paramparam : type_specifier ID\n                | type_specifier ID LBRACKET RBRACKETcompound_stmt : LBRACE local_declarations statement_list RBRACElocal_declarations : local_declarations var_declaration\n                            | emptystatement_list : statement_list statement\n                        | emptystatement : expression_stmt\n                    | compound_stmt\n                    | selection_stmt\n                    | iteration_stmt\n                    | return_stmtexpression_stmt : expression SEMICOLON\n                         | SEMICOLONexpression_stmt : expression errorselection_stmt : IF LPAREN expression RPAREN statement\n                        | IF LPAREN expression RPAREN statement ELSE statementiteration_stmt : WHILE LPAREN expression RPAREN statementreturn_stmt : RETURN SEMICOLON\n                      | RETURN expression SEMICOLONreturn_stmt : RETURN expression errorexpression : var ASSIGN expression\n                     | logical_expressionvar : ID\n              | ID LBRACKET expression RBRACKETlogical_expression : logical_expression OR and_expression\n                            | and_expressionand_expression : and_expression AND simple_expression\n                        | simple_expressionsimple_expression : additive_expression relop additive_expression\n                           | additive_expressionrelop : LE\n                | LT\n                | GT\n                | GE\n                | EQ\n                | NEadditive_expression : additive_expression addop term\n                             | termaddop : PLUS\n                | MINUSterm : term mulop factor\n                | factormulop : TIMES\n                | DIVIDEfactor : LPAREN expression RPAREN\n                 | var\n                 | call\n                 | NUMBER\n                 | FLOAT_NUM\n                 | CHAR_LITERAL\n                 | TRUE\n                 | FALSEcall : ID LPAREN args RPARENargs : arg_list\n               | emptyarg_list : arg_list COMMA expression\n                   | expressionempty :'
     
-_lr_action_items = {'INT':([0,2,3,4,5,12,14,16,17,27,28,30,31,34,35,37,40,],[7,7,-3,-4,-5,-2,-6,-13,7,7,-7,-14,-77,7,-23,-22,-21,]),'FLOAT':([0,2,3,4,5,12,14,16,17,27,28,30,31,34,35,37,40,],[8,8,-3,-4,-5,-2,-6,-13,8,8,-7,-14,-77,8,-23,-22,-21,]),'VOID':([0,2,3,4,5,12,14,16,17,27,28,30,31,34,35,37,40,],[9,9,-3,-4,-5,-2,-6,-13,22,9,-7,-14,-77,9,-23,-22,-21,]),'CHAR':([0,2,3,4,5,12,14,16,17,27,28,30,31,34,35,37,40,],[10,10,-3,-4,-5,-2,-6,-13,10,10,-7,-14,-77,10,-23,-22,-21,]),'BOOLEAN':([0,2,3,4,5,12,14,16,17,27,28,30,31,34,35,37,40,],[11,11,-3,-4,-5,-2,-6,-13,11,11,-7,-14,-77,11,-23,-22,-21,]),'$end':([1,2,3,4,5,12,14,16,28,30,40,],[0,-1,-3,-4,-5,-2,-6,-13,-7,-14,-21,]),'ID':([6,7,8,9,10,11,14,16,19,22,28,31,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,52,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,110,111,114,115,116,118,119,],[13,-8,-9,-10,-11,-12,-6,-13,25,-10,-7,-77,-77,-23,55,-22,-25,67,-21,-24,-26,-27,-28,-29,-30,-32,55,55,-31,-33,55,55,-37,55,55,55,55,55,55,55,-50,-51,-52,-53,-54,-55,-58,-59,55,-62,-63,-38,-39,55,55,55,-34,-36,55,-35,]),'SEMICOLON':([13,14,16,24,28,31,34,35,36,37,38,40,41,42,43,44,45,46,47,48,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,74,94,96,97,98,99,100,106,107,108,109,110,111,112,113,115,116,118,119,],[14,-6,-13,28,-7,-77,-77,-23,48,-22,-25,-21,-24,-26,-27,-28,-29,-30,68,-32,73,-65,-41,-42,-45,-47,-49,-57,-61,-66,-67,-68,-69,-70,-71,14,-31,-33,-37,96,-64,-38,-39,-40,-44,-65,-46,-48,-56,-60,48,48,-43,-72,-34,-36,48,-35,]),'LBRACKET':([13,25,55,67,],[15,29,77,15,]),'error':([13,47,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,74,94,98,99,100,106,107,108,109,112,113,],[16,69,-65,-41,-42,-45,-47,-49,-57,-61,-66,-67,-68,-69,-70,-71,16,97,-64,-40,-44,-65,-46,-48,-56,-60,-43,-72,]),'LPAREN':([13,14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,49,50,51,52,55,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,110,111,114,115,116,118,119,],[17,-6,-13,-7,-77,-77,-23,50,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,70,50,72,50,78,-31,-33,50,50,-37,50,50,50,50,50,50,50,-50,-51,-52,-53,-54,-55,-58,-59,50,-62,-63,-38,-39,50,50,50,-34,-36,50,-35,]),'RBRACE':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,68,69,73,96,97,115,116,119,],[-6,-13,-7,-77,-77,-23,40,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,-31,-33,-37,-38,-39,-34,-36,-35,]),'LBRACE':([14,16,26,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,68,69,73,96,97,110,111,115,116,118,119,],[-6,-13,31,-7,-77,-77,-23,31,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,-31,-33,-37,-38,-39,31,31,-34,-36,31,-35,]),'IF':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,68,69,73,96,97,110,111,115,116,118,119,],[-6,-13,-7,-77,-77,-23,49,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,-31,-33,-37,-38,-39,49,49,-34,-36,49,-35,]),'WHILE':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,68,69,73,96,97,110,111,115,116,118,119,],[-6,-13,-7,-77,-77,-23,51,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,-31,-33,-37,-38,-39,51,51,-34,-36,51,-35,]),'RETURN':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,68,69,73,96,97,110,111,115,116,118,119,],[-6,-13,-7,-77,-77,-23,52,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,-31,-33,-37,-38,-39,52,52,-34,-36,52,-35,]),'NUMBER':([14,15,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,50,52,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,110,111,114,115,116,118,119,],[-6,18,-13,-7,-77,-77,-23,62,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,62,62,-31,-33,62,62,-37,62,62,62,62,62,62,62,-50,-51,-52,-53,-54,-55,-58,-59,62,-62,-63,-38,-39,62,62,62,-34,-36,62,-35,]),'FLOAT_NUM':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,50,52,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,110,111,114,115,116,118,119,],[-6,-13,-7,-77,-77,-23,63,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,63,63,-31,-33,63,63,-37,63,63,63,63,63,63,63,-50,-51,-52,-53,-54,-55,-58,-59,63,-62,-63,-38,-39,63,63,63,-34,-36,63,-35,]),'CHAR_LITERAL':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,50,52,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,110,111,114,115,116,118,119,],[-6,-13,-7,-77,-77,-23,64,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,64,64,-31,-33,64,64,-37,64,64,64,64,64,64,64,-50,-51,-52,-53,-54,-55,-58,-59,64,-62,-63,-38,-39,64,64,64,-34,-36,64,-35,]),'TRUE':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,50,52,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,110,111,114,115,116,118,119,],[-6,-13,-7,-77,-77,-23,65,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,65,65,-31,-33,65,65,-37,65,65,65,65,65,65,65,-50,-51,-52,-53,-54,-55,-58,-59,65,-62,-63,-38,-39,65,65,65,-34,-36,65,-35,]),'FALSE':([14,16,28,31,34,35,36,37,38,40,41,42,43,44,45,46,48,50,52,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,110,111,114,115,116,118,119,],[-6,-13,-7,-77,-77,-23,66,-22,-25,-21,-24,-26,-27,-28,-29,-30,-32,66,66,-31,-33,66,66,-37,66,66,66,66,66,66,66,-50,-51,-52,-53,-54,-55,-58,-59,66,-62,-63,-38,-39,66,66,66,-34,-36,66,-35,]),'RBRACKET':([18,29,53,54,55,56,57,58,59,60,61,62,63,64,65,66,94,98,99,100,101,106,107,108,109,112,113,],[24,33,-65,-41,-42,-45,-47,-49,-57,-61,-66,-67,-68,-69,-70,-71,-64,-40,-44,-65,112,-46,-48,-56,-60,-43,-72,]),'RPAREN':([20,21,22,23,25,32,33,53,54,55,56,57,58,59,60,61,62,63,64,65,66,71,78,93,94,95,98,99,100,102,103,104,105,106,107,108,109,112,113,117,],[26,-15,-16,-18,-19,-17,-20,-65,-41,-42,-45,-47,-49,-57,-61,-66,-67,-68,-69,-70,-71,94,-77,110,-64,111,-40,-44,-65,113,-73,-74,-76,-46,-48,-56,-60,-43,-72,-75,]),'COMMA':([21,23,25,32,33,53,54,55,56,57,58,59,60,61,62,63,64,65,66,94,98,99,100,103,105,106,107,108,109,112,113,117,],[27,-18,-19,-17,-20,-65,-41,-42,-45,-47,-49,-57,-61,-66,-67,-68,-69,-70,-71,-64,-40,-44,-65,114,-76,-46,-48,-56,-60,-43,-72,-75,]),'ELSE':([40,42,43,44,45,46,48,68,69,73,96,97,115,116,119,],[-21,-26,-27,-28,-29,-30,-32,-31,-33,-37,-38,-39,118,-36,-35,]),'ASSIGN':([53,55,112,],[75,-42,-43,]),'TIMES':([53,55,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,91,-61,-66,-67,-68,-69,-70,-71,-64,-65,91,-60,-43,-72,]),'DIVIDE':([53,55,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,92,-61,-66,-67,-68,-69,-70,-71,-64,-65,92,-60,-43,-72,]),'LE':([53,55,58,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,82,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,-56,-60,-43,-72,]),'LT':([53,55,58,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,83,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,-56,-60,-43,-72,]),'GT':([53,55,58,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,84,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,-56,-60,-43,-72,]),'GE':([53,55,58,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,85,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,-56,-60,-43,-72,]),'EQ':([53,55,58,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,86,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,-56,-60,-43,-72,]),'NE':([53,55,58,59,60,61,62,63,64,65,66,94,100,108,109,112,113,],[-65,-42,87,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,-56,-60,-43,-72,]),'PLUS':([53,55,58,59,60,61,62,63,64,65,66,94,100,107,108,109,112,113,],[-65,-42,88,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,88,-56,-60,-43,-72,]),'MINUS':([53,55,58,59,60,61,62,63,64,65,66,94,100,107,108,109,112,113,],[-65,-42,89,-57,-61,-66,-67,-68,-69,-70,-71,-64,-65,89,-56,-60,-43,-72,]),'AND':([53,55,56,57,58,59,60,61,62,63,64,65,66,94,99,100,106,107,108,109,112,113,],[-65,-42,79,-47,-49,-57,-61,-66,-67,-68,-69,-70,-71,-64,79,-65,-46,-48,-56,-60,-43,-72,]),'OR':([53,54,55,56,57,58,59,60,61,62,63,64,65,66,94,99,100,106,107,108,109,112,113,],[-65,76,-42,-45,-47,-49,-57,-61,-66,-67,-68,-69,-70,-71,-64,-44,-65,-46,-48,-56,-60,-43,-72,]),}
+_lr_action_items = {'EXTERN':([0,2,3,4,5,6,7,15,18,19,21,30,40,42,43,47,52,57,],[9,9,-3,-4,-5,-6,-7,-2,-21,-8,-15,-18,-9,-16,-17,-20,-19,-28,]),'INT':([0,2,3,4,5,6,7,9,15,18,19,21,22,30,32,36,40,42,43,44,47,50,51,52,54,57,],[10,10,-3,-4,-5,-6,-7,10,-2,-21,-8,-15,10,-18,10,10,-9,-16,-17,-84,-20,10,-30,-19,-29,-28,]),'FLOAT':([0,2,3,4,5,6,7,9,15,18,19,21,22,30,32,36,40,42,43,44,47,50,51,52,54,57,],[11,11,-3,-4,-5,-6,-7,11,-2,-21,-8,-15,11,-18,11,11,-9,-16,-17,-84,-20,11,-30,-19,-29,-28,]),'VOID':([0,2,3,4,5,6,7,9,15,18,19,21,22,30,32,36,40,42,43,44,47,50,51,52,54,57,],[12,12,-3,-4,-5,-6,-7,12,-2,-21,-8,-15,28,-18,28,12,-9,-16,-17,-84,-20,12,-30,-19,-29,-28,]),'CHAR':([0,2,3,4,5,6,7,9,15,18,19,21,22,30,32,36,40,42,43,44,47,50,51,52,54,57,],[13,13,-3,-4,-5,-6,-7,13,-2,-21,-8,-15,13,-18,13,13,-9,-16,-17,-84,-20,13,-30,-19,-29,-28,]),'BOOLEAN':([0,2,3,4,5,6,7,9,15,18,19,21,22,30,32,36,40,42,43,44,47,50,51,52,54,57,],[14,14,-3,-4,-5,-6,-7,14,-2,-21,-8,-15,14,-18,14,14,-9,-16,-17,-84,-20,14,-30,-19,-29,-28,]),'$end':([1,2,3,4,5,6,7,15,18,19,21,30,40,42,43,47,52,57,],[0,-1,-3,-4,-5,-6,-7,-2,-21,-8,-15,-18,-9,-16,-17,-20,-19,-28,]),'ID':([8,10,11,12,13,14,17,19,21,25,28,40,44,50,51,53,54,55,56,57,58,59,60,61,62,63,65,67,69,85,86,87,89,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,114,127,128,131,132,133,135,136,],[16,-10,-11,-12,-13,-14,23,-8,-15,34,-12,-9,-84,-84,-30,72,-29,-32,84,-28,-31,-33,-34,-35,-36,-37,-39,72,72,-38,-40,72,72,-44,72,72,72,72,72,72,72,-57,-58,-59,-60,-61,-62,-65,-66,72,-69,-70,-45,-46,72,72,72,-41,-43,72,-42,]),'SEMICOLON':([16,19,21,23,33,35,38,40,44,46,48,50,51,53,54,55,57,58,59,60,61,62,63,64,65,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,90,91,111,113,114,115,116,117,123,124,125,126,127,128,129,130,132,133,135,136,],[19,-8,-15,30,40,43,47,-9,-84,52,43,-84,-30,65,-29,-32,-28,-31,-33,-34,-35,-36,-37,85,-39,90,-72,-48,-49,-52,-54,-56,-64,-68,-73,-74,-75,-76,-77,-78,19,-38,-40,-44,113,-71,-45,-46,-47,-51,-72,-53,-55,-63,-67,65,65,-50,-79,-41,-43,65,-42,]),'LBRACKET':([16,23,34,72,84,],[20,31,41,94,20,]),'error':([16,64,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,91,111,115,116,117,123,124,125,126,129,130,],[21,86,-72,-48,-49,-52,-54,-56,-64,-68,-73,-74,-75,-76,-77,-78,21,114,-71,-47,-51,-72,-53,-55,-63,-67,-50,-79,]),'LPAREN':([16,19,21,23,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,66,67,68,69,72,85,86,87,89,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,114,127,128,131,132,133,135,136,],[22,-8,-15,32,-9,-84,-84,-30,67,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,87,67,89,67,95,-38,-40,67,67,-44,67,67,67,67,67,67,67,-57,-58,-59,-60,-61,-62,-65,-66,67,-69,-70,-45,-46,67,67,67,-41,-43,67,-42,]),'RBRACE':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,85,86,90,113,114,132,133,136,],[-8,-15,-9,-84,-84,-30,57,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,-38,-40,-44,-45,-46,-41,-43,-42,]),'LBRACE':([19,21,35,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,85,86,90,113,114,127,128,132,133,135,136,],[-8,-15,44,-9,-84,-84,-30,44,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,-38,-40,-44,-45,-46,44,44,-41,-43,44,-42,]),'IF':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,85,86,90,113,114,127,128,132,133,135,136,],[-8,-15,-9,-84,-84,-30,66,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,-38,-40,-44,-45,-46,66,66,-41,-43,66,-42,]),'WHILE':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,85,86,90,113,114,127,128,132,133,135,136,],[-8,-15,-9,-84,-84,-30,68,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,-38,-40,-44,-45,-46,68,68,-41,-43,68,-42,]),'RETURN':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,85,86,90,113,114,127,128,132,133,135,136,],[-8,-15,-9,-84,-84,-30,69,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,-38,-40,-44,-45,-46,69,69,-41,-43,69,-42,]),'NUMBER':([19,20,21,31,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,67,69,85,86,87,89,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,114,127,128,131,132,133,135,136,],[-8,24,-15,37,-9,-84,-84,-30,79,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,79,79,-38,-40,79,79,-44,79,79,79,79,79,79,79,-57,-58,-59,-60,-61,-62,-65,-66,79,-69,-70,-45,-46,79,79,79,-41,-43,79,-42,]),'FLOAT_NUM':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,67,69,85,86,87,89,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,114,127,128,131,132,133,135,136,],[-8,-15,-9,-84,-84,-30,80,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,80,80,-38,-40,80,80,-44,80,80,80,80,80,80,80,-57,-58,-59,-60,-61,-62,-65,-66,80,-69,-70,-45,-46,80,80,80,-41,-43,80,-42,]),'CHAR_LITERAL':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,67,69,85,86,87,89,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,114,127,128,131,132,133,135,136,],[-8,-15,-9,-84,-84,-30,81,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,81,81,-38,-40,81,81,-44,81,81,81,81,81,81,81,-57,-58,-59,-60,-61,-62,-65,-66,81,-69,-70,-45,-46,81,81,81,-41,-43,81,-42,]),'TRUE':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,67,69,85,86,87,89,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,114,127,128,131,132,133,135,136,],[-8,-15,-9,-84,-84,-30,82,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,82,82,-38,-40,82,82,-44,82,82,82,82,82,82,82,-57,-58,-59,-60,-61,-62,-65,-66,82,-69,-70,-45,-46,82,82,82,-41,-43,82,-42,]),'FALSE':([19,21,40,44,50,51,53,54,55,57,58,59,60,61,62,63,65,67,69,85,86,87,89,90,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,114,127,128,131,132,133,135,136,],[-8,-15,-9,-84,-84,-30,83,-29,-32,-28,-31,-33,-34,-35,-36,-37,-39,83,83,-38,-40,83,83,-44,83,83,83,83,83,83,83,-57,-58,-59,-60,-61,-62,-65,-66,83,-69,-70,-45,-46,83,83,83,-41,-43,83,-42,]),'RBRACKET':([24,31,37,41,70,71,72,73,74,75,76,77,78,79,80,81,82,83,111,115,116,117,118,123,124,125,126,129,130,],[33,38,46,49,-72,-48,-49,-52,-54,-56,-64,-68,-73,-74,-75,-76,-77,-78,-71,-47,-51,-72,129,-53,-55,-63,-67,-50,-79,]),'RPAREN':([26,27,28,29,34,39,45,49,70,71,72,73,74,75,76,77,78,79,80,81,82,83,88,95,110,111,112,115,116,117,119,120,121,122,123,124,125,126,129,130,134,],[35,-22,-23,-25,-26,48,-24,-27,-72,-48,-49,-52,-54,-56,-64,-68,-73,-74,-75,-76,-77,-78,111,-84,127,-71,128,-47,-51,-72,130,-80,-81,-83,-53,-55,-63,-67,-50,-79,-82,]),'COMMA':([27,29,34,45,49,70,71,72,73,74,75,76,77,78,79,80,81,82,83,111,115,116,117,120,122,123,124,125,126,129,130,134,],[36,-25,-26,-24,-27,-72,-48,-49,-52,-54,-56,-64,-68,-73,-74,-75,-76,-77,-78,-71,-47,-51,-72,131,-83,-53,-55,-63,-67,-50,-79,-82,]),'ELSE':([57,59,60,61,62,63,65,85,86,90,113,114,132,133,136,],[-28,-33,-34,-35,-36,-37,-39,-38,-40,-44,-45,-46,135,-43,-42,]),'ASSIGN':([70,72,129,],[92,-49,-50,]),'TIMES':([70,72,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,108,-68,-73,-74,-75,-76,-77,-78,-71,-72,108,-67,-50,-79,]),'DIVIDE':([70,72,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,109,-68,-73,-74,-75,-76,-77,-78,-71,-72,109,-67,-50,-79,]),'LE':([70,72,75,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,99,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,-63,-67,-50,-79,]),'LT':([70,72,75,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,100,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,-63,-67,-50,-79,]),'GT':([70,72,75,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,101,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,-63,-67,-50,-79,]),'GE':([70,72,75,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,102,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,-63,-67,-50,-79,]),'EQ':([70,72,75,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,103,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,-63,-67,-50,-79,]),'NE':([70,72,75,76,77,78,79,80,81,82,83,111,117,125,126,129,130,],[-72,-49,104,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,-63,-67,-50,-79,]),'PLUS':([70,72,75,76,77,78,79,80,81,82,83,111,117,124,125,126,129,130,],[-72,-49,105,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,105,-63,-67,-50,-79,]),'MINUS':([70,72,75,76,77,78,79,80,81,82,83,111,117,124,125,126,129,130,],[-72,-49,106,-64,-68,-73,-74,-75,-76,-77,-78,-71,-72,106,-63,-67,-50,-79,]),'AND':([70,72,73,74,75,76,77,78,79,80,81,82,83,111,116,117,123,124,125,126,129,130,],[-72,-49,96,-54,-56,-64,-68,-73,-74,-75,-76,-77,-78,-71,96,-72,-53,-55,-63,-67,-50,-79,]),'OR':([70,71,72,73,74,75,76,77,78,79,80,81,82,83,111,116,117,123,124,125,126,129,130,],[-72,93,-49,-52,-54,-56,-64,-68,-73,-74,-75,-76,-77,-78,-71,-51,-72,-53,-55,-63,-67,-50,-79,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'declaration_list':([0,],[2,]),'declaration':([0,2,],[3,12,]),'var_declaration':([0,2,34,],[4,4,37,]),'fun_declaration':([0,2,],[5,5,]),'type_specifier':([0,2,17,27,34,],[6,6,19,19,39,]),'params':([17,],[20,]),'param_list':([17,],[21,]),'param':([17,27,],[23,32,]),'compound_stmt':([26,36,110,111,118,],[30,43,43,43,43,]),'local_declarations':([31,],[34,]),'empty':([31,34,78,],[35,38,104,]),'statement_list':([34,],[36,]),'statement':([36,110,111,118,],[41,115,116,119,]),'expression_stmt':([36,110,111,118,],[42,42,42,42,]),'selection_stmt':([36,110,111,118,],[44,44,44,44,]),'iteration_stmt':([36,110,111,118,],[45,45,45,45,]),'return_stmt':([36,110,111,118,],[46,46,46,46,]),'expression':([36,50,52,70,72,75,77,78,110,111,114,118,],[47,71,74,93,95,98,101,105,47,47,117,47,]),'var':([36,50,52,70,72,75,76,77,78,79,80,81,90,110,111,114,118,],[53,53,53,53,53,53,100,53,53,100,100,100,100,53,53,53,53,]),'logical_expression':([36,50,52,70,72,75,77,78,110,111,114,118,],[54,54,54,54,54,54,54,54,54,54,54,54,]),'and_expression':([36,50,52,70,72,75,76,77,78,110,111,114,118,],[56,56,56,56,56,56,99,56,56,56,56,56,56,]),'simple_expression':([36,50,52,70,72,75,76,77,78,79,110,111,114,118,],[57,57,57,57,57,57,57,57,57,106,57,57,57,57,]),'additive_expression':([36,50,52,70,72,75,76,77,78,79,80,110,111,114,118,],[58,58,58,58,58,58,58,58,58,58,107,58,58,58,58,]),'term':([36,50,52,70,72,75,76,77,78,79,80,81,110,111,114,118,],[59,59,59,59,59,59,59,59,59,59,59,108,59,59,59,59,]),'factor':([36,50,52,70,72,75,76,77,78,79,80,81,90,110,111,114,118,],[60,60,60,60,60,60,60,60,60,60,60,60,109,60,60,60,60,]),'call':([36,50,52,70,72,75,76,77,78,79,80,81,90,110,111,114,118,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'relop':([58,],[80,]),'addop':([58,107,],[81,81,]),'mulop':([59,108,],[90,90,]),'args':([78,],[102,]),'arg_list':([78,],[103,]),}
+_lr_goto_items = {'program':([0,],[1,]),'declaration_list':([0,],[2,]),'declaration':([0,2,],[3,15,]),'var_declaration':([0,2,50,],[4,4,54,]),'fun_declaration':([0,2,],[5,5,]),'fun_prototype':([0,2,9,],[6,6,18,]),'extern_declaration':([0,2,],[7,7,]),'type_specifier':([0,2,9,22,32,36,50,],[8,8,17,25,25,25,56,]),'params':([22,32,],[26,39,]),'param_list':([22,32,],[27,27,]),'param':([22,32,36,],[29,29,45,]),'compound_stmt':([35,53,127,128,135,],[42,60,60,60,60,]),'local_declarations':([44,],[50,]),'empty':([44,50,95,],[51,55,121,]),'statement_list':([50,],[53,]),'statement':([53,127,128,135,],[58,132,133,136,]),'expression_stmt':([53,127,128,135,],[59,59,59,59,]),'selection_stmt':([53,127,128,135,],[61,61,61,61,]),'iteration_stmt':([53,127,128,135,],[62,62,62,62,]),'return_stmt':([53,127,128,135,],[63,63,63,63,]),'expression':([53,67,69,87,89,92,94,95,127,128,131,135,],[64,88,91,110,112,115,118,122,64,64,134,64,]),'var':([53,67,69,87,89,92,93,94,95,96,97,98,107,127,128,131,135,],[70,70,70,70,70,70,117,70,70,117,117,117,117,70,70,70,70,]),'logical_expression':([53,67,69,87,89,92,94,95,127,128,131,135,],[71,71,71,71,71,71,71,71,71,71,71,71,]),'and_expression':([53,67,69,87,89,92,93,94,95,127,128,131,135,],[73,73,73,73,73,73,116,73,73,73,73,73,73,]),'simple_expression':([53,67,69,87,89,92,93,94,95,96,127,128,131,135,],[74,74,74,74,74,74,74,74,74,123,74,74,74,74,]),'additive_expression':([53,67,69,87,89,92,93,94,95,96,97,127,128,131,135,],[75,75,75,75,75,75,75,75,75,75,124,75,75,75,75,]),'term':([53,67,69,87,89,92,93,94,95,96,97,98,127,128,131,135,],[76,76,76,76,76,76,76,76,76,76,76,125,76,76,76,76,]),'factor':([53,67,69,87,89,92,93,94,95,96,97,98,107,127,128,131,135,],[77,77,77,77,77,77,77,77,77,77,77,77,126,77,77,77,77,]),'call':([53,67,69,87,89,92,93,94,95,96,97,98,107,127,128,131,135,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'relop':([75,],[97,]),'addop':([75,124,],[98,98,]),'mulop':([76,125,],[107,107,]),'args':([95,],[119,]),'arg_list':([95,],[120,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,81 +27,88 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> declaration_list','program',1,'p_program','parser.py',22),
-  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','parser.py',27),
-  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser.py',28),
-  ('declaration -> var_declaration','declaration',1,'p_declaration','parser.py',35),
-  ('declaration -> fun_declaration','declaration',1,'p_declaration','parser.py',36),
-  ('var_declaration -> type_specifier ID SEMICOLON','var_declaration',3,'p_var_declaration','parser.py',41),
-  ('var_declaration -> type_specifier ID LBRACKET NUMBER RBRACKET SEMICOLON','var_declaration',6,'p_var_declaration','parser.py',42),
-  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser.py',56),
-  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser.py',57),
-  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser.py',58),
-  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser.py',59),
-  ('type_specifier -> BOOLEAN','type_specifier',1,'p_type_specifier','parser.py',60),
-  ('var_declaration -> type_specifier ID error','var_declaration',3,'p_var_declaration_error','parser.py',65),
-  ('fun_declaration -> type_specifier ID LPAREN params RPAREN compound_stmt','fun_declaration',6,'p_fun_declaration','parser.py',71),
-  ('params -> param_list','params',1,'p_params','parser.py',79),
-  ('params -> VOID','params',1,'p_params','parser.py',80),
-  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','parser.py',84),
-  ('param_list -> param','param_list',1,'p_param_list','parser.py',85),
-  ('param -> type_specifier ID','param',2,'p_param','parser.py',92),
-  ('param -> type_specifier ID LBRACKET RBRACKET','param',4,'p_param','parser.py',93),
-  ('compound_stmt -> LBRACE local_declarations statement_list RBRACE','compound_stmt',4,'p_compound_stmt','parser.py',101),
-  ('local_declarations -> local_declarations var_declaration','local_declarations',2,'p_local_declarations','parser.py',107),
-  ('local_declarations -> empty','local_declarations',1,'p_local_declarations','parser.py',108),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',118),
-  ('statement_list -> empty','statement_list',1,'p_statement_list','parser.py',119),
-  ('statement -> expression_stmt','statement',1,'p_statement','parser.py',129),
-  ('statement -> compound_stmt','statement',1,'p_statement','parser.py',130),
-  ('statement -> selection_stmt','statement',1,'p_statement','parser.py',131),
-  ('statement -> iteration_stmt','statement',1,'p_statement','parser.py',132),
-  ('statement -> return_stmt','statement',1,'p_statement','parser.py',133),
-  ('expression_stmt -> expression SEMICOLON','expression_stmt',2,'p_expression_stmt','parser.py',137),
-  ('expression_stmt -> SEMICOLON','expression_stmt',1,'p_expression_stmt','parser.py',138),
-  ('expression_stmt -> expression error','expression_stmt',2,'p_expression_stmt_error','parser.py',146),
-  ('selection_stmt -> IF LPAREN expression RPAREN statement','selection_stmt',5,'p_selection_stmt','parser.py',151),
-  ('selection_stmt -> IF LPAREN expression RPAREN statement ELSE statement','selection_stmt',7,'p_selection_stmt','parser.py',152),
-  ('iteration_stmt -> WHILE LPAREN expression RPAREN statement','iteration_stmt',5,'p_iteration_stmt','parser.py',159),
-  ('return_stmt -> RETURN SEMICOLON','return_stmt',2,'p_return_stmt','parser.py',163),
-  ('return_stmt -> RETURN expression SEMICOLON','return_stmt',3,'p_return_stmt','parser.py',164),
-  ('return_stmt -> RETURN expression error','return_stmt',3,'p_return_stmt_error','parser.py',172),
-  ('expression -> var ASSIGN expression','expression',3,'p_expression','parser.py',178),
-  ('expression -> logical_expression','expression',1,'p_expression','parser.py',179),
-  ('var -> ID','var',1,'p_var','parser.py',186),
-  ('var -> ID LBRACKET expression RBRACKET','var',4,'p_var','parser.py',187),
-  ('logical_expression -> logical_expression OR and_expression','logical_expression',3,'p_logical_expression','parser.py',194),
-  ('logical_expression -> and_expression','logical_expression',1,'p_logical_expression','parser.py',195),
-  ('and_expression -> and_expression AND simple_expression','and_expression',3,'p_and_expression','parser.py',202),
-  ('and_expression -> simple_expression','and_expression',1,'p_and_expression','parser.py',203),
-  ('simple_expression -> additive_expression relop additive_expression','simple_expression',3,'p_simple_expression','parser.py',210),
-  ('simple_expression -> additive_expression','simple_expression',1,'p_simple_expression','parser.py',211),
-  ('relop -> LE','relop',1,'p_relop','parser.py',218),
-  ('relop -> LT','relop',1,'p_relop','parser.py',219),
-  ('relop -> GT','relop',1,'p_relop','parser.py',220),
-  ('relop -> GE','relop',1,'p_relop','parser.py',221),
-  ('relop -> EQ','relop',1,'p_relop','parser.py',222),
-  ('relop -> NE','relop',1,'p_relop','parser.py',223),
-  ('additive_expression -> additive_expression addop term','additive_expression',3,'p_additive_expression','parser.py',227),
-  ('additive_expression -> term','additive_expression',1,'p_additive_expression','parser.py',228),
-  ('addop -> PLUS','addop',1,'p_addop','parser.py',235),
-  ('addop -> MINUS','addop',1,'p_addop','parser.py',236),
-  ('term -> term mulop factor','term',3,'p_term','parser.py',240),
-  ('term -> factor','term',1,'p_term','parser.py',241),
-  ('mulop -> TIMES','mulop',1,'p_mulop','parser.py',248),
-  ('mulop -> DIVIDE','mulop',1,'p_mulop','parser.py',249),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',253),
-  ('factor -> var','factor',1,'p_factor','parser.py',254),
-  ('factor -> call','factor',1,'p_factor','parser.py',255),
-  ('factor -> NUMBER','factor',1,'p_factor','parser.py',256),
-  ('factor -> FLOAT_NUM','factor',1,'p_factor','parser.py',257),
-  ('factor -> CHAR_LITERAL','factor',1,'p_factor','parser.py',258),
-  ('factor -> TRUE','factor',1,'p_factor','parser.py',259),
-  ('factor -> FALSE','factor',1,'p_factor','parser.py',260),
-  ('call -> ID LPAREN args RPAREN','call',4,'p_call','parser.py',274),
-  ('args -> arg_list','args',1,'p_args','parser.py',278),
-  ('args -> empty','args',1,'p_args','parser.py',279),
-  ('arg_list -> arg_list COMMA expression','arg_list',3,'p_arg_list','parser.py',283),
-  ('arg_list -> expression','arg_list',1,'p_arg_list','parser.py',284),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',291),
+  ('program -> declaration_list','program',1,'p_program','parser.py',147),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','parser.py',152),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser.py',153),
+  ('declaration -> var_declaration','declaration',1,'p_declaration','parser.py',160),
+  ('declaration -> fun_declaration','declaration',1,'p_declaration','parser.py',161),
+  ('declaration -> fun_prototype','declaration',1,'p_declaration','parser.py',162),
+  ('declaration -> extern_declaration','declaration',1,'p_declaration','parser.py',163),
+  ('var_declaration -> type_specifier ID SEMICOLON','var_declaration',3,'p_var_declaration','parser.py',168),
+  ('var_declaration -> type_specifier ID LBRACKET NUMBER RBRACKET SEMICOLON','var_declaration',6,'p_var_declaration','parser.py',169),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser.py',185),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser.py',186),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser.py',187),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser.py',188),
+  ('type_specifier -> BOOLEAN','type_specifier',1,'p_type_specifier','parser.py',189),
+  ('var_declaration -> type_specifier ID error','var_declaration',3,'p_var_declaration_error','parser.py',194),
+  ('fun_declaration -> type_specifier ID LPAREN params RPAREN compound_stmt','fun_declaration',6,'p_fun_declaration','parser.py',200),
+  ('fun_prototype -> type_specifier ID LPAREN params RPAREN SEMICOLON','fun_prototype',6,'p_fun_prototype','parser.py',212),
+  ('extern_declaration -> EXTERN type_specifier ID SEMICOLON','extern_declaration',4,'p_extern_declaration','parser.py',217),
+  ('extern_declaration -> EXTERN type_specifier ID LBRACKET NUMBER RBRACKET SEMICOLON','extern_declaration',7,'p_extern_declaration','parser.py',218),
+  ('extern_declaration -> EXTERN type_specifier ID LBRACKET RBRACKET SEMICOLON','extern_declaration',6,'p_extern_declaration','parser.py',219),
+  ('extern_declaration -> EXTERN fun_prototype','extern_declaration',2,'p_extern_declaration','parser.py',220),
+  ('params -> param_list','params',1,'p_params','parser.py',231),
+  ('params -> VOID','params',1,'p_params','parser.py',232),
+  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','parser.py',236),
+  ('param_list -> param','param_list',1,'p_param_list','parser.py',237),
+  ('param -> type_specifier ID','param',2,'p_param','parser.py',244),
+  ('param -> type_specifier ID LBRACKET RBRACKET','param',4,'p_param','parser.py',245),
+  ('compound_stmt -> LBRACE local_declarations statement_list RBRACE','compound_stmt',4,'p_compound_stmt','parser.py',254),
+  ('local_declarations -> local_declarations var_declaration','local_declarations',2,'p_local_declarations','parser.py',260),
+  ('local_declarations -> empty','local_declarations',1,'p_local_declarations','parser.py',261),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',271),
+  ('statement_list -> empty','statement_list',1,'p_statement_list','parser.py',272),
+  ('statement -> expression_stmt','statement',1,'p_statement','parser.py',282),
+  ('statement -> compound_stmt','statement',1,'p_statement','parser.py',283),
+  ('statement -> selection_stmt','statement',1,'p_statement','parser.py',284),
+  ('statement -> iteration_stmt','statement',1,'p_statement','parser.py',285),
+  ('statement -> return_stmt','statement',1,'p_statement','parser.py',286),
+  ('expression_stmt -> expression SEMICOLON','expression_stmt',2,'p_expression_stmt','parser.py',290),
+  ('expression_stmt -> SEMICOLON','expression_stmt',1,'p_expression_stmt','parser.py',291),
+  ('expression_stmt -> expression error','expression_stmt',2,'p_expression_stmt_error','parser.py',300),
+  ('selection_stmt -> IF LPAREN expression RPAREN statement','selection_stmt',5,'p_selection_stmt','parser.py',305),
+  ('selection_stmt -> IF LPAREN expression RPAREN statement ELSE statement','selection_stmt',7,'p_selection_stmt','parser.py',306),
+  ('iteration_stmt -> WHILE LPAREN expression RPAREN statement','iteration_stmt',5,'p_iteration_stmt','parser.py',314),
+  ('return_stmt -> RETURN SEMICOLON','return_stmt',2,'p_return_stmt','parser.py',319),
+  ('return_stmt -> RETURN expression SEMICOLON','return_stmt',3,'p_return_stmt','parser.py',320),
+  ('return_stmt -> RETURN expression error','return_stmt',3,'p_return_stmt_error','parser.py',329),
+  ('expression -> var ASSIGN expression','expression',3,'p_expression','parser.py',335),
+  ('expression -> logical_expression','expression',1,'p_expression','parser.py',336),
+  ('var -> ID','var',1,'p_var','parser.py',343),
+  ('var -> ID LBRACKET expression RBRACKET','var',4,'p_var','parser.py',344),
+  ('logical_expression -> logical_expression OR and_expression','logical_expression',3,'p_logical_expression','parser.py',352),
+  ('logical_expression -> and_expression','logical_expression',1,'p_logical_expression','parser.py',353),
+  ('and_expression -> and_expression AND simple_expression','and_expression',3,'p_and_expression','parser.py',360),
+  ('and_expression -> simple_expression','and_expression',1,'p_and_expression','parser.py',361),
+  ('simple_expression -> additive_expression relop additive_expression','simple_expression',3,'p_simple_expression','parser.py',368),
+  ('simple_expression -> additive_expression','simple_expression',1,'p_simple_expression','parser.py',369),
+  ('relop -> LE','relop',1,'p_relop','parser.py',376),
+  ('relop -> LT','relop',1,'p_relop','parser.py',377),
+  ('relop -> GT','relop',1,'p_relop','parser.py',378),
+  ('relop -> GE','relop',1,'p_relop','parser.py',379),
+  ('relop -> EQ','relop',1,'p_relop','parser.py',380),
+  ('relop -> NE','relop',1,'p_relop','parser.py',381),
+  ('additive_expression -> additive_expression addop term','additive_expression',3,'p_additive_expression','parser.py',385),
+  ('additive_expression -> term','additive_expression',1,'p_additive_expression','parser.py',386),
+  ('addop -> PLUS','addop',1,'p_addop','parser.py',393),
+  ('addop -> MINUS','addop',1,'p_addop','parser.py',394),
+  ('term -> term mulop factor','term',3,'p_term','parser.py',398),
+  ('term -> factor','term',1,'p_term','parser.py',399),
+  ('mulop -> TIMES','mulop',1,'p_mulop','parser.py',406),
+  ('mulop -> DIVIDE','mulop',1,'p_mulop','parser.py',407),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',411),
+  ('factor -> var','factor',1,'p_factor','parser.py',412),
+  ('factor -> call','factor',1,'p_factor','parser.py',413),
+  ('factor -> NUMBER','factor',1,'p_factor','parser.py',414),
+  ('factor -> FLOAT_NUM','factor',1,'p_factor','parser.py',415),
+  ('factor -> CHAR_LITERAL','factor',1,'p_factor','parser.py',416),
+  ('factor -> TRUE','factor',1,'p_factor','parser.py',417),
+  ('factor -> FALSE','factor',1,'p_factor','parser.py',418),
+  ('call -> ID LPAREN args RPAREN','call',4,'p_call','parser.py',432),
+  ('args -> arg_list','args',1,'p_args','parser.py',437),
+  ('args -> empty','args',1,'p_args','parser.py',438),
+  ('arg_list -> arg_list COMMA expression','arg_list',3,'p_arg_list','parser.py',442),
+  ('arg_list -> expression','arg_list',1,'p_arg_list','parser.py',443),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',450),
 ]
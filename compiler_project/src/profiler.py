@@ -0,0 +1,125 @@
+"""
+Execution profiler for the reference interpreter.
+
+ProfilingInterpreter runs a program exactly like Interpreter while it
+records, per function, the number of calls and the inclusive and exclusive
+time, and per source line the number of statements executed and of `while`
+iterations. Lines come from the positions the Parser records for
+statements. Exclusive time is also kept per call stack, so the profile can
+be written in the collapsed-stack format flamegraph tools read
+(`main;sum;add 1234`, one stack per line, in microseconds).
+
+    python -m src.main run examples/test.c main --profile
+    python -m src.main run prog.c run 3000 --collapsed out.folded
+"""
+import time
+
+from .interpreter import Interpreter, truth
+
+
+class FunctionStats:
+    """Call count and times in seconds for one function."""
+    __slots__ = ('calls', 'inclusive', 'exclusive')
+
+    def __init__(self):
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+
+
+class Profile:
+    """What a ProfilingInterpreter recorded over one or more runs."""
+
+    def __init__(self):
+        self.functions = {}
+        self.lines = {}  # line -> statements executed on it
+        self.loops = {}  # line of the while statement -> iterations
+        self.stacks = {}  # (outermost, ..., innermost) -> exclusive seconds
+
+    def report(self, limit=10):
+        """Format the hottest functions, lines and loops as text."""
+        out = [f"{'function':<20} {'calls':>9} {'inclusive':>11} {'exclusive':>11}"]
+        for name, stats in sorted(self.functions.items(), key=lambda item: -item[1].exclusive):
+            out.append(f"{name:<20} {stats.calls:>9} {stats.inclusive * 1000:>9.2f}ms {stats.exclusive * 1000:>9.2f}ms")
+        out.append('')
+        out.append(f"{'line':>6} {'hits':>10}")
+        for line, hits in sorted(self.lines.items(), key=lambda item: -item[1])[:limit]:
+            out.append(f"{line:>6} {hits:>10}")
+        if self.loops:
+            out.append('')
+            out.append(f"{'loop at':>7} {'iterations':>10}")
+            for line, iterations in sorted(self.loops.items(), key=lambda item: -item[1])[:limit]:
+                out.append(f"{line:>7} {iterations:>10}")
+        return '\n'.join(out)
+
+    def collapsed(self):
+        """Get the profile as collapsed stacks weighted by exclusive microseconds."""
+        return ''.join(f"{';'.join(stack)} {round(seconds * 1e6)}\n"
+                       for stack, seconds in sorted(self.stacks.items()) if round(seconds * 1e6) > 0)
+
+    def to_dict(self):
+        return {
+            'functions': {name: {'calls': stats.calls, 'inclusive': stats.inclusive, 'exclusive': stats.exclusive}
+                          for name, stats in self.functions.items()},
+            'lines': self.lines,
+            'loops': self.loops,
+        }
+
+
+class ProfilingInterpreter(Interpreter):
+    """An Interpreter that records a Profile as it runs.
+
+    `positions` is the Parser's id(node) -> (lexpos, line) map for the AST;
+    statements without a position are timed but not counted per line.
+    """
+
+    def __init__(self, ast, positions=None):
+        super().__init__(ast)
+        self.positions = positions or {}
+        self.profile = Profile()
+        self._frames = []  # [name, start, time spent in callees] per active call
+        self._active = {}  # name -> active calls, so recursion counts inclusive time once
+
+    def call(self, fun_name, args):
+        profile = self.profile
+        stats = profile.functions.get(fun_name)
+        if stats is None:
+            stats = profile.functions[fun_name] = FunctionStats()
+        stats.calls += 1
+        self._active[fun_name] = self._active.get(fun_name, 0) + 1
+        frame = [fun_name, time.perf_counter(), 0.0]
+        self._frames.append(frame)
+        try:
+            return super().call(fun_name, args)
+        finally:
+            elapsed = time.perf_counter() - frame[1]
+            self._frames.pop()
+            self._active[fun_name] -= 1
+            if not self._active[fun_name]:
+                stats.inclusive += elapsed
+            exclusive = elapsed - frame[2]
+            stats.exclusive += exclusive
+            stack = tuple(active[0] for active in self._frames) + (fun_name,)
+            profile.stacks[stack] = profile.stacks.get(stack, 0.0) + exclusive
+            if self._frames:
+                self._frames[-1][2] += elapsed
+
+    def execute(self, node):
+        position = self.positions.get(id(node))
+        if position is not None:
+            lines = self.profile.lines
+            lines[position[1]] = lines.get(position[1], 0) + 1
+        super().execute(node)
+
+    def exec_while_stmt(self, node):
+        condition, body = node[1], node[2]
+        position = self.positions.get(id(node))
+        iterations = 0
+        try:
+            while truth(self.evaluate(condition)):
+                iterations += 1
+                self.execute(body)
+        finally:
+            if position is not None:
+                loops = self.profile.loops
+                loops[position[1]] = loops.get(position[1], 0) + iterations
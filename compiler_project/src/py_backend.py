@@ -0,0 +1,381 @@
+import functools
+from array import array
+
+from .interpreter import DECLARATIONS_ONLY, ExecutionError, int_divide, out_of_bounds, truth
+
+# Helpers the generated code calls; user identifiers can't start with '_',
+# so these never collide with names from the source program.
+def _div(left, right):
+    if left.__class__ is int and right.__class__ is int:
+        return int_divide(left, right)
+    return left / right
+
+def _store(value, target, index):
+    target[index] = value
+    return value
+
+RUNTIME = {
+    '_idiv': int_divide,
+    '_div': _div,
+    '_oob': out_of_bounds,
+    '_store': _store,
+    '_float': float,
+    '_bool': bool,
+    '_truth': truth,
+    '_len': len,
+    '_array': array,
+}
+
+_DEFAULTS = {'int': '0', 'float': '0.0', 'char': "'\\x00'", 'boolean': 'False'}
+
+
+class PythonCodeGenerator:
+    """Translate a checked AST into Python source.
+
+    Functions become `f_<name>`, globals `g_<name>` and locals `v_<name>`
+    (suffixed when an inner block shadows an outer name), so the generated
+    names never clash with Python keywords or builtins. `int` division
+    truncates toward zero, float arrays are stored as `array('d')` and all
+    other arrays as lists. Accesses whose node id is in `safe_accesses`
+    (see range_analysis) are indexed without a bounds check. With
+    `vectorize`, element-wise loops (see vectorize) try NumPy first and
+    int arrays are stored as `array('q')` for it, so an int array element
+    holds 64 bits like the native backend's.
+    """
+
+    def __init__(self, safe_accesses=None, vectorize=False):
+        self.safe_accesses = safe_accesses or set()
+        self.vectorize = vectorize
+        self.vector_loops = []
+        self.lines = []
+        self.functions = {}
+        self.global_scope = {}
+        self.scopes = []
+        self.used_names = set()
+        self.assigned_globals = set()
+        self.fun_type = None
+
+    def generate(self, ast):
+        """Generate the Python source for a program AST."""
+        if ast is None:
+            raise ExecutionError("Cannot execute a program that failed to parse")
+        self.lines = []
+        self.functions = {}
+        self.global_scope = {}
+        self.vector_loops = []
+
+        for decl in ast[1]:
+            if decl[0] == 'fun_decl':
+                params = [] if decl[3] == 'void' else decl[3]
+                self.functions[decl[2]] = (decl[1], params)
+
+        for decl in ast[1]:
+            if decl[0] == 'fun_decl':
+                self._function(decl)
+            elif decl[0] in ('var_decl', 'array_decl'):
+                py_name = f'g_{decl[2]}'
+                self.global_scope[decl[2]] = (py_name, self._decl_type(decl), self._decl_size(decl), True)
+                self.lines.append(f'{py_name} = {self._initial_value(decl)}')
+            elif decl[0] in DECLARATIONS_ONLY:
+                continue
+            else:
+                raise ExecutionError(f"Cannot execute node '{decl[0]}'")
+        return '\n'.join(self.lines) + '\n'
+
+    # Declarations
+
+    def _decl_type(self, decl):
+        return f'array_{decl[1]}' if decl[0] == 'array_decl' else decl[1]
+
+    def _decl_size(self, decl):
+        return decl[3] if decl[0] == 'array_decl' else None
+
+    def _initial_value(self, decl):
+        if decl[0] == 'array_decl':
+            if decl[1] == 'float':
+                return f"_array('d', [0.0]) * {decl[3]}"
+            if decl[1] == 'int' and self.vectorize:
+                return f"_array('q', [0]) * {decl[3]}"
+            return f'[{_DEFAULTS.get(decl[1], "0")}] * {decl[3]}'
+        return _DEFAULTS.get(decl[1], '0')
+
+    def _declare_local(self, name, type, size=None):
+        py_name = f'v_{name}'
+        counter = 1
+        while py_name in self.used_names:
+            counter += 1
+            py_name = f'v_{name}_{counter}'
+        self.used_names.add(py_name)
+        self.scopes[-1][name] = (py_name, type, size, False)
+        return py_name
+
+    def _resolve(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        if name in self.global_scope:
+            return self.global_scope[name]
+        raise ExecutionError(f"Variable '{name}' not declared")
+
+    def _function(self, node):
+        fun_type, fun_name, params, body = node[1], node[2], node[3], node[4]
+        self.scopes = [{}]
+        self.used_names = set()
+        self.assigned_globals = set()
+        self.fun_type = fun_type
+
+        param_names = []
+        for param in self.functions[fun_name][1]:
+            if param[0] == 'array_param':
+                param_names.append(self._declare_local(param[2], f'array_{param[1]}'))
+            else:
+                param_names.append(self._declare_local(param[2], param[1]))
+
+        body_lines = []
+        self._compound(body, body_lines, 1)
+        if fun_type != 'void':
+            self._emit(body_lines, 1, f'return {_DEFAULTS[fun_type]}')  # Reached only by falling off the end
+
+        self.lines.append(f"def f_{fun_name}({', '.join(param_names)}):")
+        if self.assigned_globals:
+            self.lines.append(f"    global {', '.join(sorted(self.assigned_globals))}")
+        self.lines.extend(body_lines or ['    pass'])
+        self.lines.append('')
+        self.scopes = []
+
+    # Statements
+
+    def _emit(self, out, level, text):
+        out.append('    ' * level + text)
+
+    def _compound(self, node, out, level):
+        self.scopes.append({})
+        start = len(out)
+        for decl in node[1]:
+            py_name = self._declare_local(decl[2], self._decl_type(decl), self._decl_size(decl))
+            self._emit(out, level, f'{py_name} = {self._initial_value(decl)}')
+        for stmt in node[2]:
+            self._statement(stmt, out, level)
+        if len(out) == start:
+            self._emit(out, level, 'pass')
+        self.scopes.pop()
+
+    def _statement(self, node, out, level):
+        kind = node[0]
+        if kind == 'compound_stmt':
+            self._compound(node, out, level)
+        elif kind == 'expr_stmt':
+            expr = node[1]
+            if expr[0] == 'assign':
+                py_name, index_code, value_code, _ = self._assignment(expr)
+                if index_code is not None:
+                    py_name = f'{py_name}[{index_code}]'
+                self._emit(out, level, f'{py_name} = {value_code}')
+            else:
+                self._emit(out, level, self._expression(expr)[0])
+        elif kind == 'empty_stmt':
+            self._emit(out, level, 'pass')
+        elif kind == 'if_stmt':
+            self._emit(out, level, f'if {self._condition(node[1])[0]}:')
+            self._statement(node[2], out, level + 1)
+        elif kind == 'if_else_stmt':
+            self._emit(out, level, f'if {self._condition(node[1])[0]}:')
+            self._statement(node[2], out, level + 1)
+            self._emit(out, level, 'else:')
+            self._statement(node[3], out, level + 1)
+        elif kind == 'while_stmt':
+            loop = self._vector_loop(node) if self.vectorize else None
+            if loop is not None:
+                self._emit(out, level, self._vector_call(loop, node))
+                self._emit(out, level, 'if _vr is None:')
+                level += 1
+            self._emit(out, level, f'while {self._condition(node[1])[0]}:')
+            self._statement(node[2], out, level + 1)
+            if loop is not None:
+                targets = [self._resolve(name)[0] for name in [loop.index] + loop.reductions]
+                self._emit(out, level - 1, 'else:')
+                self._emit(out, level, f"{', '.join(targets)}, = _vr")
+        elif kind == 'return_stmt':
+            if node[1] is None:
+                self._emit(out, level, 'return None')
+            else:
+                code, expr_type = self._expression(node[1])
+                self._emit(out, level, f'return {self._coerce(self.fun_type, code, expr_type)}')
+        else:
+            raise ExecutionError(f"Cannot execute node '{kind}'")
+
+    def _vector_loop(self, node):
+        from .vectorize import recognize_loop
+
+        def lookup(name):
+            try:
+                return self._resolve(name)[1]
+            except ExecutionError:
+                return None
+
+        loop = recognize_loop(node, lookup)
+        if loop is not None:
+            self.vector_loops.append(loop)
+        return loop
+
+    def _vector_call(self, loop, node):
+        arrays = ''.join(f'{self._resolve(name)[0]}, ' for name in loop.arrays)
+        scalars = ''.join(f'{self._resolve(name)[0]}, ' for name in loop.scalars)
+        start = self._resolve(loop.index)[0]
+        bound = self._expression(node[1][3])[0]
+        return f'_vr = _vec[{len(self.vector_loops) - 1}].run({start}, {bound}, ({arrays}), ({scalars}))'
+
+    # Expressions
+
+    def _coerce(self, target_type, code, expr_type):
+        if target_type == 'float' and expr_type != 'float':
+            return repr(float(code)) if code.isdigit() else f'_float({code})'
+        return code
+
+    def _condition(self, node):
+        """Return the (code, type) pair for an expression tested as a condition.
+
+        Python counts every one-character string as true; a char is false
+        when it is '\\0', like in C.
+        """
+        code, expr_type = self._expression(node)
+        if expr_type == 'char':
+            return f"({code} != '\\x00')", 'boolean'
+        if expr_type is None:
+            return f'_truth({code})', 'boolean'
+        return code, expr_type
+
+    def _element(self, node):
+        """Return the (array, checked index, array type) code of an array_access node."""
+        py_name, array_type, size, _ = self._resolve(node[1])
+        index = node[2]
+        if index[0] == 'number' and index[1].__class__ is int and size is not None and 0 <= index[1] < size:
+            return py_name, str(index[1]), array_type
+        index_code = self._expression(index)[0]
+        if id(node) in self.safe_accesses:
+            return py_name, index_code, array_type
+        size_code = str(size) if size is not None else f'_len({py_name})'
+        check = f"_t if 0 <= (_t := {index_code}) < {size_code} else _oob('{node[1]}', _t, {size_code})"
+        return py_name, check, array_type
+
+    def _assignment(self, node):
+        """Return the (target, index, value, type) code of an assignment.
+
+        `index` is None unless the target is an array element.
+        """
+        target, value = node[1], node[2]
+        value_code, value_type = self._expression(value)
+        if target[0] == 'array_access':
+            py_name, index_code, array_type = self._element(target)
+            element_type = array_type[len('array_'):]
+            return py_name, index_code, self._coerce(element_type, value_code, value_type), element_type
+        py_name, var_type, _, is_global = self._resolve(target[1])
+        if is_global:
+            self.assigned_globals.add(py_name)
+        return py_name, None, self._coerce(var_type, value_code, value_type), var_type
+
+    def _expression(self, node):
+        """Return the (code, type) pair for an expression."""
+        kind = node[0]
+        if kind == 'number':
+            return repr(node[1]), 'int' if node[1].__class__ is int else 'float'
+        if kind == 'char':
+            return repr(node[1]), 'char'
+        if kind == 'boolean':
+            return ('True' if node[1] == 'true' else 'False'), 'boolean'
+        if kind == 'var':
+            py_name, var_type, _, _ = self._resolve(node[1])
+            return py_name, var_type
+        if kind == 'array_access':
+            py_name, index_code, array_type = self._element(node)
+            return f'{py_name}[{index_code}]', array_type[len('array_'):]
+        if kind == 'assign':
+            py_name, index_code, value_code, target_type = self._assignment(node)
+            if index_code is None:
+                return f'({py_name} := {value_code})', target_type
+            return f'_store({value_code}, {py_name}, {index_code})', target_type
+        if kind == 'call':
+            if node[1] not in self.functions:
+                raise ExecutionError(f"Function '{node[1]}' not declared")
+            fun_type, params = self.functions[node[1]]
+            if len(params) != len(node[2]):
+                raise ExecutionError(f"Wrong number of arguments for function '{node[1]}'")
+            args = []
+            for param, arg in zip(params, node[2]):
+                code, arg_type = self._expression(arg)
+                args.append(code if param[0] == 'array_param' else self._coerce(param[1], code, arg_type))
+            return f"f_{node[1]}({', '.join(args)})", fun_type
+        if kind in ('and', 'or'):
+            left, left_type = self._condition(node[1])
+            right, right_type = self._condition(node[2])
+            code = f'({left} {kind} {right})'
+            if left_type != 'boolean' or right_type != 'boolean':
+                code = f'_bool{code}'
+            return code, 'boolean'
+        if kind == 'relop':
+            left = self._expression(node[2])[0]
+            right = self._expression(node[3])[0]
+            return f'({left} {node[1]} {right})', 'boolean'
+        if kind in ('addop', 'mulop'):
+            left, left_type = self._expression(node[2])
+            right, right_type = self._expression(node[3])
+            if left_type in ('int', 'float') and right_type in ('int', 'float'):
+                result_type = 'float' if 'float' in (left_type, right_type) else 'int'
+            else:
+                result_type = None
+            if node[1] == '/':
+                if result_type == 'int':
+                    return f'_idiv({left}, {right})', result_type
+                if result_type is None:
+                    return f'_div({left}, {right})', result_type
+            return f'({left} {node[1]} {right})', result_type
+        raise ExecutionError(f"Cannot evaluate node '{kind}'")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_source(source):
+    return compile(source, '<c-like program>', 'exec')
+
+
+class CompiledProgram:
+    """A program translated to Python and compiled once to a code object."""
+
+    def __init__(self, source, functions, vector_loops=()):
+        self.source = source
+        self.code = _compile_source(source)
+        self.functions = functions
+        self.vector_loops = list(vector_loops)
+        self.namespace = {}
+
+    @property
+    def globals(self):
+        """Current values of the global variables."""
+        return {name[2:]: list(value) if isinstance(value, (list, array)) else value
+                for name, value in self.namespace.items() if name.startswith('g_')}
+
+    def run(self, entry='main', args=None):
+        """Run the program from a fresh global state and return the entry function's result."""
+        if entry not in self.functions:
+            raise ExecutionError(f"Function '{entry}' not declared")
+        args = list(args or [])
+        params = self.functions[entry][1]
+        if len(params) != len(args):
+            raise ExecutionError(f"Wrong number of arguments for function '{entry}'")
+        args = [float(arg) if param[0] == 'param' and param[1] == 'float' else arg
+                for param, arg in zip(params, args)]
+
+        self.namespace = dict(RUNTIME, _vec=self.vector_loops)
+        exec(self.code, self.namespace)
+        try:
+            return self.namespace[f'f_{entry}'](*args)
+        except ZeroDivisionError:
+            raise ExecutionError("Division by zero") from None
+        except OverflowError:
+            raise ExecutionError("Value out of range for a 64-bit array element") from None
+
+
+def compile_program(ast, safe_accesses=None, vectorize=False):
+    """Translate a checked AST into a runnable CompiledProgram."""
+    generator = PythonCodeGenerator(safe_accesses, vectorize)
+    source = generator.generate(ast)
+    return CompiledProgram(source, generator.functions, generator.vector_loops)
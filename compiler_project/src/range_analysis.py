@@ -0,0 +1,348 @@
+"""
+Interval analysis of integer variables to check array indices statically.
+
+Each function is analyzed on its own by abstract interpretation: every
+`int` variable holds an interval, locals start at [0, 0] like the
+interpreter's zero-initialized storage, and parameters and globals start
+unbounded. Conditions of `if` and `while` statements narrow the intervals
+of the variables they compare; loops iterate to a fixpoint with widening
+followed by one narrowing pass. Calls may change any global, so globals go
+back to unbounded after each call.
+
+Every reachable `array_access` into an array of known size ends up in one
+of three groups: provably in bounds (its node id is added to `safe`, so
+backends can index without a check), provably out of bounds on every
+execution (an error), or unknown (checked at run time as before). The intervals of call
+arguments are kept as well, so an argument whose interval is a single
+value is known to be that constant.
+
+A hash-consing Parser shares one node between identical accesses, so their
+intervals are joined per array: the node is safe only if every occurrence
+is, and an error only if all of them together are out of bounds.
+"""
+from math import inf
+
+TOP = (-inf, inf)
+BOOLEAN = (0, 1)
+MAX_WIDENINGS = 32  # Widening reaches a fixpoint well before this; it only guards against a bug
+
+_NEGATED = {'<': '>=', '<=': '>', '>': '<=', '>=': '<', '==': '!=', '!=': '=='}
+_SWAPPED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '==': '==', '!=': '!='}
+
+
+def join(a, b):
+    return (min(a[0], b[0]), max(a[1], b[1]))
+
+
+def _multiply(x, y):
+    # 0 * inf is 0 here: a variable that is 0 stays 0 whatever it is multiplied by
+    return 0 if x == 0 or y == 0 else x * y
+
+
+def _divide(x, y):
+    """Divide two bounds truncating toward zero, like int_divide."""
+    if y in (inf, -inf):
+        return 0
+    if x in (inf, -inf):
+        return x if y > 0 else -x
+    quotient = abs(x) // abs(y)
+    return quotient if (x < 0) == (y < 0) else -quotient
+
+
+def interval_op(op, a, b):
+    """Apply an arithmetic operator to two intervals."""
+    if op == '+':
+        return (a[0] + b[0], a[1] + b[1])
+    if op == '-':
+        return (a[0] - b[1], a[1] - b[0])
+    if op == '*':
+        corners = [_multiply(x, y) for x in a for y in b]
+    else:
+        if b[0] <= 0 <= b[1]:
+            return TOP
+        corners = [_divide(x, y) for x in a for y in b]
+    return (min(corners), max(corners))
+
+
+def is_pure(expr):
+    """Whether evaluating an expression can't change any variable (no assignment or call)."""
+    kind = expr[0]
+    if kind in ('assign', 'call'):
+        return False
+    if kind == 'array_access':
+        return is_pure(expr[2])
+    if kind in ('and', 'or'):
+        return is_pure(expr[1]) and is_pure(expr[2])
+    if kind in ('relop', 'addop', 'mulop'):
+        return is_pure(expr[2]) and is_pure(expr[3])
+    return True
+
+
+def _join_envs(a, b):
+    """Join two abstract states; None is unreachable and a missing key is unbounded."""
+    if a is None:
+        return None if b is None else dict(b)
+    if b is None:
+        return dict(a)
+    return {key: join(value, b[key]) for key, value in a.items() if key in b}
+
+
+def _includes(a, b):
+    """Whether state b already covers state a."""
+    if a is None:
+        return True
+    if b is None:
+        return False
+    return all(key in a and b[key][0] <= a[key][0] and a[key][1] <= b[key][1] for key in b)
+
+
+def _widen(old, new):
+    """Keep each bound of old that new stays within and push the others to infinity."""
+    if old is None:
+        return new
+    widened = {}
+    for key, value in new.items():
+        if key in old:  # A key missing from old is unbounded already
+            previous = old[key]
+            widened[key] = (previous[0] if value[0] >= previous[0] else -inf,
+                            previous[1] if value[1] <= previous[1] else inf)
+    return widened
+
+
+class RangeAnalyzer:
+    """Checks array indices against declared sizes for a semantically checked AST."""
+
+    def __init__(self):
+        self.errors = []
+        self.safe = set()  # id() of array_access nodes proven in bounds
+        self.checked = 0  # Reachable accesses into arrays of known size
+        self.global_scope = {}
+        self.scopes = []
+        self.sizes = {}
+        self.ranges = {}  # (id(node), array key) -> (node, size, function, index interval joined over all visits)
+        self.arguments = {}  # id(call node) -> argument intervals joined over all visits
+        self.current_function = None
+        self._keys = 0
+
+    def analyze(self, ast):
+        """Analyze every function; returns True if no access is provably out of bounds."""
+        for decl in ast[1]:
+            if decl[0] == 'var_decl' and decl[1] == 'int':
+                self.global_scope[decl[2]] = f'g:{decl[2]}'
+            elif decl[0] in ('array_decl', 'extern_array_decl'):
+                key = f'g:{decl[2]}'
+                self.global_scope[decl[2]] = key
+                if decl[3] is not None:
+                    self.sizes[key] = decl[3]
+            elif decl[0] == 'var_decl':
+                self.global_scope[decl[2]] = None  # Not an int; never tracked
+        for decl in ast[1]:
+            if decl[0] == 'fun_decl':
+                self._function(decl)
+
+        unsafe = set()
+        for node, size, function, (low, high) in self.ranges.values():
+            self.checked += 1
+            if 0 <= low and high < size:
+                self.safe.add(id(node))
+                continue
+            unsafe.add(id(node))  # A node shared by a hash-consing Parser is only safe if it is everywhere
+            if high < 0 or low >= size:
+                index = low if low == high else f"range [{low}, {high}]"
+                self.errors.append(f"Array index {index} out of bounds for '{node[1]}' of size {size} "
+                                   f"in function '{function}'")
+        self.safe -= unsafe
+        return len(self.errors) == 0
+
+    # Scopes
+
+    def _declare(self, name, tracked, size=None):
+        self._keys += 1
+        key = f'{name}#{self._keys}' if tracked or size is not None else None
+        self.scopes[-1][name] = key
+        if size is not None:
+            self.sizes[key] = size
+        return key
+
+    def _key(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return self.global_scope.get(name)
+
+    def _function(self, node):
+        self.current_function = node[2]
+        self.scopes = [{}]
+        params = [] if node[3] == 'void' else node[3]
+        for param in params:
+            # Parameters start unbounded, which is what a missing key means
+            self._declare(param[2], param[0] == 'param' and param[1] == 'int')
+        self._statement(node[4], {})
+        self.scopes = []
+        self.current_function = None
+
+    # Statements
+
+    def _statement(self, node, env):
+        """Transfer a state through a statement; returns None once no path gets past it."""
+        if env is None:
+            return None
+        kind = node[0]
+        if kind == 'compound_stmt':
+            self.scopes.append({})
+            for decl in node[1]:
+                if decl[0] == 'array_decl':
+                    self._declare(decl[2], False, decl[3])
+                else:
+                    key = self._declare(decl[2], decl[1] == 'int')
+                    if key is not None:
+                        env[key] = (0, 0)
+            for stmt in node[2]:
+                env = self._statement(stmt, env)
+                if env is None:
+                    break
+            for key in self.scopes.pop().values():
+                if env is not None and key in env:
+                    del env[key]
+            return env
+        if kind == 'expr_stmt':
+            self._evaluate(node[1], env)
+            return env
+        if kind == 'if_stmt':
+            then_env, else_env = self._condition(node[1], env)
+            return _join_envs(self._statement(node[2], then_env), else_env)
+        if kind == 'if_else_stmt':
+            then_env, else_env = self._condition(node[1], env)
+            return _join_envs(self._statement(node[2], then_env), self._statement(node[3], else_env))
+        if kind == 'while_stmt':
+            return self._loop(node, env)
+        if kind == 'return_stmt':
+            if node[1] is not None:
+                self._evaluate(node[1], env)
+            return None
+        return env
+
+    def _loop(self, node, env):
+        condition, body = node[1], node[2]
+        head = dict(env)
+        for _ in range(MAX_WIDENINGS):
+            body_env, _ = self._condition(condition, dict(head))
+            after = _join_envs(env, self._statement(body, body_env))
+            if _includes(after, head):
+                break
+            head = _widen(head, after)
+        else:
+            head = {}  # Every variable unbounded is always a fixpoint
+        # One narrowing pass recovers the bounds widening threw away, e.g. i == n on exit
+        body_env, _ = self._condition(condition, dict(head))
+        head = _join_envs(env, self._statement(body, body_env))
+        return self._condition(condition, head)[1]
+
+    # Expressions
+
+    def _evaluate(self, node, env):
+        """Get the interval of an expression, applying its side effects to env."""
+        kind = node[0]
+        if kind == 'number':
+            return (node[1], node[1]) if node[1].__class__ is int else TOP
+        if kind == 'var':
+            key = self._key(node[1])
+            return env.get(key, TOP)
+        if kind == 'array_access':
+            index = self._evaluate(node[2], env)
+            array = self._key(node[1])
+            size = self.sizes.get(array)
+            if size is not None:
+                entry = self.ranges.get((id(node), array))
+                if entry is not None:
+                    index = join(entry[3], index)
+                self.ranges[(id(node), array)] = (node, size, self.current_function, index)
+            return TOP
+        if kind == 'assign':
+            value = self._evaluate(node[2], env)
+            target = node[1]
+            if target[0] == 'array_access':
+                self._evaluate(target, env)
+                return value
+            key = self._key(target[1])
+            if key is not None and key not in self.sizes:
+                env[key] = value
+            return value
+        if kind == 'call':
+            values = [self._evaluate(arg, env) for arg in node[2]]
+            previous = self.arguments.get(id(node))
+            if previous is not None:
+                values = [join(a, b) for a, b in zip(previous, values)]
+            self.arguments[id(node)] = values
+            for key in [key for key in env if key.startswith('g:')]:
+                del env[key]
+            return TOP
+        if kind in ('and', 'or', 'relop'):
+            true_env, false_env = self._condition(node, env)
+            joined = _join_envs(true_env, false_env)
+            if joined is not None:
+                env.clear()
+                env.update(joined)
+            return BOOLEAN
+        if kind in ('addop', 'mulop'):
+            left = self._evaluate(node[2], env)
+            right = self._evaluate(node[3], env)
+            return interval_op(node[1], left, right)
+        return TOP
+
+    def _condition(self, node, env):
+        """Split a state into the states where a condition is true and where it is false."""
+        kind = node[0]
+        if kind == 'and':
+            true_env, false_env = self._condition(node[1], env)
+            if true_env is None:
+                return None, false_env
+            right_true, right_false = self._condition(node[2], true_env)
+            return right_true, _join_envs(false_env, right_false)
+        if kind == 'or':
+            true_env, false_env = self._condition(node[1], env)
+            if false_env is None:
+                return true_env, None
+            right_true, right_false = self._condition(node[2], false_env)
+            return _join_envs(true_env, right_true), right_false
+        if kind == 'boolean':
+            return (env, None) if node[1] == 'true' else (None, env)
+        if kind != 'relop':
+            self._evaluate(node, env)
+            return env, dict(env)
+
+        op, left, right = node[1], node[2], node[3]
+        pure = is_pure(left) and is_pure(right)
+        left_range = self._evaluate(left, env)
+        right_range = self._evaluate(right, env)
+        if not pure:
+            return env, dict(env)
+        true_env = self._refine(dict(env), op, left, left_range, right, right_range)
+        false_env = self._refine(dict(env), _NEGATED[op], left, left_range, right, right_range)
+        return true_env, false_env
+
+    def _refine(self, env, op, left, left_range, right, right_range):
+        """Narrow the variables on either side of `left op right` assuming it holds."""
+        for node, own, op, other in ((left, left_range, op, right_range),
+                                     (right, right_range, _SWAPPED[op], left_range)):
+            key = self._key(node[1]) if node[0] == 'var' else None
+            if key is None or key in self.sizes:
+                continue
+            low, high = env.get(key, own)
+            if op == '<':
+                high = min(high, other[1] - 1)
+            elif op == '<=':
+                high = min(high, other[1])
+            elif op == '>':
+                low = max(low, other[0] + 1)
+            elif op == '>=':
+                low = max(low, other[0])
+            elif op == '==':
+                low, high = max(low, other[0]), min(high, other[1])
+            elif other[0] == other[1]:
+                low = low + 1 if low == other[0] else low
+                high = high - 1 if high == other[0] else high
+            if low > high:
+                return None
+            env[key] = (low, high)
+        return env
@@ -0,0 +1,117 @@
+"""
+The `run` command: compile a program, apply the optimization passes asked
+for and run it on the reference interpreter, on the stack machine with
+--stack-machine, or on ProfilingInterpreter (see profiler) when a profile
+is asked for.
+
+    python -m src.main run examples/test.c main --profile
+    python -m src.main run prog.c run 3000 --inline --tail-calls --stack-machine
+"""
+import argparse
+import json
+import sys
+
+from .interpreter import ExecutionError, Interpreter
+
+
+def _argument(text):
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    if len(text) == 1:
+        return text
+    return {'true': True, 'false': False}.get(text, text)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog='main.py run', description="Run a program with the interpreter")
+    arg_parser.add_argument('source')
+    arg_parser.add_argument('entry', nargs='?', default='main')
+    arg_parser.add_argument('args', nargs='*', help="Arguments for the entry function")
+    arg_parser.add_argument('--profile', action='store_true', help="Print a profile after the run")
+    arg_parser.add_argument('--collapsed', metavar='PATH', help="Write collapsed stacks for flamegraph tools")
+    arg_parser.add_argument('--json', metavar='PATH', help="Write the profile as JSON")
+    arg_parser.add_argument('--inline', action='store_true', help="Inline small functions before running")
+    arg_parser.add_argument('--inline-threshold', type=int, metavar='N',
+                            help="Largest callee to inline, in AST nodes (implies --inline)")
+    arg_parser.add_argument('--fold', action='store_true', help="Evaluate constant pure calls before running")
+    arg_parser.add_argument('--optimize-loops', action='store_true',
+                            help="Hoist loop invariants and reduce induction products before running")
+    arg_parser.add_argument('--tail-calls', action='store_true', help="Turn self tail calls into loops before running")
+    arg_parser.add_argument('--stack-machine', action='store_true',
+                            help="Run on the stack machine, which keeps calls off the Python stack")
+    args = arg_parser.parse_args(argv)
+    profiling = args.profile or args.collapsed or args.json
+    if profiling and args.stack_machine:
+        arg_parser.error("profiling needs the interpreter, not --stack-machine")
+
+    from .service import CompileEngine
+    with open(args.source, 'r') as file:
+        code = file.read()
+    engine = CompileEngine()
+    result = engine.compile(code)
+    errors = result.syntax_errors + result.semantic_errors
+    if errors or not result.ast:
+        for error in errors or ["Syntax analysis failed"]:
+            print(f"{args.source}: {error}", file=sys.stderr)
+        return 1
+
+    ast = result.ast
+    if args.inline or args.inline_threshold is not None:
+        from .inliner import DEFAULT_THRESHOLD, inline_functions
+        threshold = DEFAULT_THRESHOLD if args.inline_threshold is None else args.inline_threshold
+        ast, inliner = inline_functions(ast, engine.parser.positions, threshold)
+        if inliner.decisions:
+            print(inliner.report())
+    if args.fold:
+        from .const_eval import fold_pure_calls
+        ast, folder = fold_pure_calls(ast)
+        for name, fold_args, value in folder.folds:
+            print(f"folded {name}({', '.join(map(repr, fold_args))}) = {value!r}")
+    if args.optimize_loops:
+        from .loop_opt import optimize_loops
+        ast, optimizer = optimize_loops(ast, engine.parser.positions)
+        if optimizer.loops:
+            print(optimizer.report())
+    if args.tail_calls:
+        from .tail_calls import eliminate_tail_calls
+        ast, eliminator = eliminate_tail_calls(ast, engine.parser.positions)
+        if eliminator.looped or eliminator.kept:
+            print(eliminator.report())
+
+    if profiling:
+        from .profiler import ProfilingInterpreter
+        interpreter = ProfilingInterpreter(ast, engine.parser.positions)
+    elif args.stack_machine:
+        from .stack_machine import StackMachine
+        interpreter = StackMachine(ast)
+    else:
+        interpreter = Interpreter(ast)
+    try:
+        value = interpreter.run(args.entry, [_argument(arg) for arg in args.args])
+    except ExecutionError as e:
+        print(f"{args.source}: {e}", file=sys.stderr)
+        return 2
+    except RecursionError:
+        print(f"{args.source}: Recursion too deep", file=sys.stderr)
+        return 2
+    print(f"result: {value!r}")
+    for name, global_value in interpreter.globals.items():
+        print(f"{name} = {global_value!r}")
+
+    if args.profile:
+        print()
+        print(interpreter.profile.report())
+    if args.collapsed:
+        with open(args.collapsed, 'w') as file:
+            file.write(interpreter.profile.collapsed())
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(interpreter.profile.to_dict(), file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,34 @@
+from .type_system import (ARRAY, BASE_TYPES, FUNCTION, arithmetic_result, array_type,
+                          function_type, get_type, is_assignable, is_numeric_pair)
+
 class SemanticAnalyzer:
-    def __init__(self, symbol_table):
+    def __init__(self, symbol_table, xref=None):
         self.symbol_table = symbol_table
         self.errors = []
         self.current_function = None
+        self.xref = xref  # Optional CrossReferenceIndex to record names into
+        self.calls = []  # (caller, callee, line) for every call site, recorded alongside xref
+        self.safe_accesses = set()  # id() of array_access nodes proven in bounds
+        self.types = {}  # (id(expression), scope) -> its type, for expressions typed without errors
 
     def analyze(self, ast):
         """Analyze the AST for semantic correctness."""
         if ast is None:
             return False
+        self.types = {}
         self.visit(ast)
+        if not self.errors:
+            self._check_bounds(ast)
         return len(self.errors) == 0
 
+    def _check_bounds(self, ast):
+        """Check array indices against declared sizes once the program is well typed."""
+        from .range_analysis import RangeAnalyzer
+        bounds = RangeAnalyzer()
+        bounds.analyze(ast)
+        self.errors.extend(bounds.errors)
+        self.safe_accesses = bounds.safe
+
     def visit(self, node):
         if isinstance(node, tuple):
             method_name = f'visit_{node[0]}'
@@ -35,10 +53,13 @@ class SemanticAnalyzer:
         var_type, var_name = node[1], node[2]
         if not self.is_valid_type(var_type):
             self.errors.append(f"Invalid type '{var_type}' for variable '{var_name}'")
+        elif self._complete_extern(node, var_name, var_type):
+            return
         else:
             # Add variable to current scope
             try:
                 self.symbol_table.insert(var_name, var_type, kind='variable')
+                self._record_definition(node, var_name)
             except Exception as e:
                 self.errors.append(str(e))
 
@@ -46,12 +67,14 @@ class SemanticAnalyzer:
         """Handle function declarations."""
         fun_type, fun_name, params, body = node[1], node[2], node[3], node[4]
         
-        # Add function to symbol table
-        try:
-            self.symbol_table.insert(fun_name, f'function_{fun_type}', kind='function')
-        except Exception as e:
-            self.errors.append(str(e))
-            return
+        # Add function to symbol table, unless a prototype already did
+        if not self._complete_extern(node, fun_name, function_type(fun_type).name, self._param_types(params)):
+            try:
+                self.symbol_table.insert(fun_name, function_type(fun_type).name, kind='function')
+                self._record_definition(node, fun_name)
+            except Exception as e:
+                self.errors.append(str(e))
+                return
             
         # Enter function scope
         self.current_function = fun_name
@@ -65,6 +88,7 @@ class SemanticAnalyzer:
                 param_types.append(param_type)
                 try:
                     self.symbol_table.insert(param_name, param_type, kind='parameter')
+                    self._record_definition(param, param_name)
                 except Exception as e:
                     self.errors.append(str(e))
         
@@ -78,6 +102,63 @@ class SemanticAnalyzer:
         self.symbol_table.exit_scope()
         self.current_function = None
 
+    def visit_fun_proto(self, node):
+        """Handle function prototypes."""
+        fun_type, fun_name, params = node[1], node[2], node[3]
+        self._declare_extern(node, fun_name, function_type(fun_type).name, 'function',
+                             params=self._param_types(params))
+
+    def visit_extern_var_decl(self, node):
+        """Handle extern variable declarations."""
+        var_type, var_name = node[1], node[2]
+        if not self.is_valid_type(var_type):
+            self.errors.append(f"Invalid type '{var_type}' for variable '{var_name}'")
+            return
+        self._declare_extern(node, var_name, var_type, 'variable')
+
+    def visit_extern_array_decl(self, node):
+        """Handle extern array declarations; the size may be left to the definition."""
+        element_type, array_name, size = node[1], node[2], node[3]
+        self._declare_extern(node, array_name, array_type(element_type).name, 'array', size=size)
+
+    def _param_types(self, params):
+        return [] if params == 'void' else [param[1] for param in params]
+
+    def _declare_extern(self, node, name, type_name, kind, params=None, size=None):
+        """Declare a symbol defined elsewhere, or check a repeated declaration against the first."""
+        symbol = self.symbol_table.lookup(name, current_scope_only=True)
+        if symbol is not None:
+            if symbol.type != type_name or (params is not None and symbol.attributes['params'] != params):
+                self.errors.append(f"Conflicting declaration of '{name}'")
+            if self.xref is not None:
+                self.xref.record(node, symbol)
+            return
+        self.symbol_table.insert(name, type_name, kind=kind, size=size)
+        symbol = self.symbol_table.lookup(name, current_scope_only=True)
+        symbol.attributes['extern'] = True
+        if params is not None:
+            symbol.attributes['params'] = params
+        if size is not None:
+            self.symbol_table.update_symbol(name, size=size)
+        self._record_definition(node, name)
+
+    def _complete_extern(self, node, name, type_name, params=None):
+        """Turn an earlier extern declaration of name into this definition.
+
+        Returns False if name wasn't declared extern in the current scope.
+        """
+        symbol = self.symbol_table.lookup(name, current_scope_only=True)
+        if symbol is None or not symbol.attributes.get('extern'):
+            return False
+        if symbol.type != type_name or (params is not None and symbol.attributes['params'] != params):
+            self.errors.append(f"Definition of '{name}' conflicts with its declaration")
+        symbol.attributes['extern'] = False
+        if self.xref is not None:
+            reference = self.xref.record(node, symbol, is_definition=True)
+            if reference is not None:
+                symbol.line_no = reference.line
+        return True
+
     def visit_compound_stmt(self, node):
         """Handle compound statements."""
         local_decls, stmt_list = node[1], node[2]
@@ -114,15 +195,22 @@ class SemanticAnalyzer:
                 if expr_type and not self.are_types_compatible(var_symbol.type, expr_type):
                     self.errors.append(f"Type mismatch: cannot assign {expr_type} to {var_symbol.type}")
 
+    def visit_expr_stmt(self, node):
+        """Handle expression statements."""
+        self._record_references(node[1])
+        self.visit(node[1])
+
     def visit_if_stmt(self, node):
         """Handle if statements."""
         condition, then_stmt = node[1], node[2]
+        self._record_references(condition)
         self.visit(condition)
         self.visit(then_stmt)
 
     def visit_if_else_stmt(self, node):
         """Handle if-else statements."""
         condition, then_stmt, else_stmt = node[1], node[2], node[3]
+        self._record_references(condition)
         self.visit(condition)
         self.visit(then_stmt)
         self.visit(else_stmt)
@@ -130,6 +218,7 @@ class SemanticAnalyzer:
     def visit_while_stmt(self, node):
         """Handle while statements."""
         condition, body = node[1], node[2]
+        self._record_references(condition)
         self.visit(condition)
         self.visit(body)
 
@@ -140,7 +229,8 @@ class SemanticAnalyzer:
             return
 
         expr = node[1]
-        fun_type = self.symbol_table.lookup(self.current_function).type.replace('function_', '')
+        self._record_references(expr)
+        fun_type = get_type(self.symbol_table.lookup(self.current_function).type).base
         
         if fun_type == 'void':
             if expr:
@@ -158,8 +248,61 @@ class SemanticAnalyzer:
             elif not self.are_types_compatible(fun_type, expr_type):
                 self.errors.append(f"Return type mismatch: expected {fun_type}, got {expr_type}")
 
+    def _record_definition(self, node, name):
+        """Record a declaration just inserted into the current scope."""
+        if self.xref is not None:
+            symbol = self.symbol_table.lookup(name, current_scope_only=True)
+            reference = self.xref.record(node, symbol, is_definition=True)
+            if reference is not None and symbol.line_no is None:
+                symbol.line_no = reference.line
+
+    def _record_references(self, expr):
+        """Record every name used in an expression against the symbol it resolves to here."""
+        if self.xref is None or not isinstance(expr, tuple):
+            return
+        kind = expr[0]
+        if kind in ('var', 'array_access', 'call'):
+            symbol = self.symbol_table.lookup(expr[1])
+            reference = self.xref.record(expr, symbol)
+            if reference is not None:
+                self.symbol_table._add_reference(symbol, reference.line)
+            if kind == 'array_access':
+                self._record_references(expr[2])
+            elif kind == 'call':
+                # Unresolved callees are kept too; they may live in another file
+                position = self.xref.positions.get(id(expr))
+                self.calls.append((self.current_function, expr[1], position[1] if position else None))
+                for arg in expr[2]:
+                    self._record_references(arg)
+        elif kind == 'assign':
+            self._record_references(expr[1])
+            self._record_references(expr[2])
+        elif kind in ('and', 'or'):
+            self._record_references(expr[1])
+            self._record_references(expr[2])
+        elif kind in ('relop', 'addop', 'mulop'):
+            self._record_references(expr[2])
+            self._record_references(expr[3])
+
     def get_expr_type(self, node):
-        """Get the type of an expression."""
+        """Get the type of an expression.
+
+        Names resolve the same way everywhere in one scope, so the type is
+        cached per (node, scope); with a hash-consing Parser every repeat of
+        an expression is the same node and is typed once per scope. Types
+        whose computation reported errors aren't cached, so each occurrence
+        still reports them.
+        """
+        key = (id(node), self.symbol_table.current_scope)
+        if key in self.types:
+            return self.types[key]
+        errors = len(self.errors)
+        type = self._expr_type(node)
+        if len(self.errors) == errors:
+            self.types[key] = type
+        return type
+
+    def _expr_type(self, node):
         if isinstance(node, tuple):
             if node[0] == 'number':
                 return 'int' if isinstance(node[1], int) else 'float'
@@ -170,13 +313,15 @@ class SemanticAnalyzer:
             elif node[0] == 'var':
                 var_symbol = self.symbol_table.lookup(node[1])
                 return var_symbol.type if var_symbol else None
+            elif node[0] == 'array_access':
+                return self.visit_array_access(node)
             elif node[0] == 'call':
                 fun_symbol = self.symbol_table.lookup(node[1])
-                return fun_symbol.type.replace('function_', '') if fun_symbol else None
+                return get_type(fun_symbol.type).base if fun_symbol else None
             elif node[0] == 'relop':
                 left_type = self.get_expr_type(node[2])
                 right_type = self.get_expr_type(node[3])
-                if left_type in ('int', 'float') and right_type in ('int', 'float'):
+                if is_numeric_pair(get_type(left_type), get_type(right_type)):
                     return 'boolean'
                 else:
                     self.errors.append(f"Invalid operands for comparison: {left_type} and {right_type}")
@@ -192,8 +337,9 @@ class SemanticAnalyzer:
             elif node[0] in ('mulop', 'addop'):
                 left_type = self.get_expr_type(node[2])
                 right_type = self.get_expr_type(node[3])
-                if left_type in ('int', 'float') and right_type in ('int', 'float'):
-                    return 'float' if 'float' in (left_type, right_type) else 'int'
+                result_type = arithmetic_result(get_type(left_type), get_type(right_type))
+                if result_type:
+                    return result_type.name
                 else:
                     self.errors.append(f"Invalid operands for {node[1]}: {left_type} and {right_type}")
                     return None
@@ -201,15 +347,11 @@ class SemanticAnalyzer:
 
     def is_valid_type(self, type_name):
         """Check if a type is valid."""
-        return type_name in ['int', 'float', 'void', 'char', 'boolean']
+        return type_name in BASE_TYPES
 
     def are_types_compatible(self, type1, type2):
         """Check if two types are compatible for assignment."""
-        if type1 == type2:
-            return True
-        if type1 == 'float' and type2 == 'int':
-            return True
-        return False
+        return is_assignable(get_type(type1), get_type(type2))
 
     def visit_call(self, node):
         fun_name = node[1]
@@ -253,7 +395,7 @@ class SemanticAnalyzer:
         """Analyze function declaration."""
         _, return_type, name, params, body = decl
         # Add function to global scope
-        self.symbol_table.insert(name, f'function_{return_type}')
+        self.symbol_table.insert(name, function_type(return_type).name)
         
         self.current_function = name
         self.symbol_table.enter_scope(name)
@@ -339,7 +481,7 @@ class SemanticAnalyzer:
         if expr:
             expr_type = self._analyze_expression(expr)
             func_type = self.symbol_table.lookup(self.current_function).type
-            expected_type = func_type.split('_')[1]
+            expected_type = get_type(func_type).base
             if expr_type != expected_type:
                 self.errors.append(f"Error: Return type mismatch in function '{self.current_function}'")
 
@@ -358,17 +500,16 @@ class SemanticAnalyzer:
             elif expr[0] in ('addop', 'mulop'):
                 left_type = self._analyze_expression(expr[2])
                 right_type = self._analyze_expression(expr[3])
-                if left_type == right_type == 'int':
-                    return 'int'
-                elif left_type in ('int', 'float') and right_type in ('int', 'float'):
-                    return 'float'
+                result_type = arithmetic_result(get_type(left_type), get_type(right_type))
+                if result_type:
+                    return result_type.name
                 else:
                     self.errors.append(f"Invalid operand types for {expr[1]}: {left_type} and {right_type}")
                     return None
             elif expr[0] == 'relop':
                 left_type = self._analyze_expression(expr[2])
                 right_type = self._analyze_expression(expr[3])
-                if left_type in ('int', 'float') and right_type in ('int', 'float'):
+                if is_numeric_pair(get_type(left_type), get_type(right_type)):
                     return 'boolean'
                 else:
                     self.errors.append(f"Invalid operand types for comparison: {left_type} and {right_type}")
@@ -404,7 +545,7 @@ class SemanticAnalyzer:
             self.errors.append(f"Error: Undefined function '{func_name}'")
             return None
             
-        if not symbol.type.startswith('function_'):
+        if get_type(symbol.type).kind != FUNCTION:
             self.errors.append(f"Error: '{func_name}' is not a function")
             return None
         
@@ -423,7 +564,7 @@ class SemanticAnalyzer:
                 self.errors.append(f"Error: Type mismatch in argument {i+1} of function '{func_name}': expected {expected}, got {actual}")
                 return None
                 
-        return symbol.type.split('_')[1]
+        return get_type(symbol.type).base
 
     def _analyze_binary_operation(self, expr):
         """Analyze binary operation."""
@@ -435,10 +576,10 @@ class SemanticAnalyzer:
         if not left_type or not right_type:
             return None
             
-        # If both operands are numeric (int or float)
-        if left_type in ('int', 'float') and right_type in ('int', 'float'):
-            # If either is float, result is float
-            return 'float' if 'float' in (left_type, right_type) else 'int'
+        # If both operands are numeric (int or float); if either is float, result is float
+        result_type = arithmetic_result(get_type(left_type), get_type(right_type))
+        if result_type:
+            return result_type.name
         else:
             self.errors.append(f"Error: Invalid operands for {op}: {left_type} and {right_type}")
             return None
@@ -477,7 +618,20 @@ class SemanticAnalyzer:
 
     def visit_array_decl(self, node):
         """Handle array declarations."""
-        array_type, array_name, size = node[1], node[2], node[3]
+        element_type, array_name, size = node[1], node[2], node[3]
+        declared = self.symbol_table.lookup(array_name, current_scope_only=True)
+        if self._complete_extern(node, array_name, array_type(element_type).name):
+            if declared.size is not None and declared.size != size:
+                self.errors.append(f"Definition of '{array_name}' conflicts with its declaration")
+            declared.size = size
+            self.symbol_table.update_symbol(array_name, size=size)
+        else:
+            try:
+                self.symbol_table.insert(array_name, array_type(element_type).name, kind='array', size=size)
+                self.symbol_table.update_symbol(array_name, size=size)
+                self._record_definition(node, array_name)
+            except Exception as e:
+                self.errors.append(str(e))
         if size <= 0:
             self.errors.append(f"Array size must be positive, got {size}")
             return False
@@ -491,7 +645,8 @@ class SemanticAnalyzer:
         if not array_symbol:
             self.errors.append(f"Undefined array '{array_name}'")
             return None
-        if not array_symbol.type.startswith('array_'):
+        symbol_type = get_type(array_symbol.type)
+        if symbol_type.kind != ARRAY:
             self.errors.append(f"'{array_name}' is not an array")
             return None
             
@@ -502,4 +657,4 @@ class SemanticAnalyzer:
             return None
             
         # Return the base type of the array (e.g., 'int' from 'array_int')
-        return array_symbol.type.replace('array_', '') 
\ No newline at end of file
+        return symbol_type.base 
\ No newline at end of file
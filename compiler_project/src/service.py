@@ -0,0 +1,155 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+from .frame_layout import layout_frames
+from .parser import Parser
+from .semantic import SemanticAnalyzer
+from .symbol_table import SymbolTable
+from .xref import CrossReferenceIndex
+
+
+class CompileCancelled(Exception):
+    """Raised by CompileEngine.compile when its `cancelled` check returns true."""
+    pass
+
+
+class CompileResult:
+    """Everything one compilation produces, independent of the engine that ran it."""
+
+    def __init__(self, tokens, ast, syntax_errors, semantic_success, semantic_errors, symbol_table, frames=None,
+                 xref=None, calls=None, safe_accesses=None):
+        self.tokens = tokens
+        self.ast = ast
+        self.syntax_errors = syntax_errors
+        self.semantic_success = semantic_success
+        self.semantic_errors = semantic_errors
+        self.symbol_table = symbol_table
+        self.frames = frames or {}
+        self.xref = xref
+        self.calls = calls or []
+        self.safe_accesses = safe_accesses or set()  # For compile_program / compile_native
+
+    @property
+    def syntax_success(self):
+        return len(self.syntax_errors) == 0
+
+    def summary(self):
+        """Diagnostics and symbols as plain data, for JSON responses."""
+        symbols = [
+            {'name': name, 'scope': scope, 'type': symbol.type, 'kind': symbol.kind}
+            for (name, scope), symbol in self.symbol_table.symbols.items()
+        ]
+        return {
+            'syntax_success': self.syntax_success,
+            'syntax_errors': self.syntax_errors,
+            'semantic_success': self.semantic_success,
+            'semantic_errors': self.semantic_errors,
+            'token_count': len(self.tokens),
+            'symbols': symbols,
+        }
+
+
+class CompileEngine:
+    """A warm lexer and parser pair.
+
+    Building these compiles the lexer regexes and loads the yacc tables, so
+    engines are kept around and reused. The PLY objects hold per-parse state,
+    so an engine must only be used by one thread at a time.
+    """
+
+    def __init__(self, hash_cons=False):
+        self.parser = Parser(hash_cons)
+        self.lexer = self.parser.lexer  # The parser builds its own lexer; share it
+
+    def compile(self, code, imports=None, module=None, cancelled=None):
+        """Run all front-end phases over source text.
+
+        imports maps names to globals of other modules (see modules.merge_exports);
+        entries exported by `module` itself are skipped. cancelled, if given, is
+        called between phases; once it returns true the compilation stops with
+        CompileCancelled.
+        """
+        # Lex once; the parser reads the same TokenBuffer
+        tokens = self.lexer.tokenize(code)
+        if cancelled is not None and cancelled():
+            raise CompileCancelled()
+        ast = self.parser.parse(code, tokens)
+        syntax_errors = list(self.parser.errors)
+        if cancelled is not None and cancelled():
+            raise CompileCancelled()
+
+        symbol_table = SymbolTable()
+        if imports:
+            symbol_table.imports = imports
+            symbol_table.module = module
+        xref = CrossReferenceIndex(code, self.parser.positions, self.parser.occurrences)
+        if ast:
+            analyzer = SemanticAnalyzer(symbol_table, xref)
+            semantic_success = analyzer.analyze(ast)
+            semantic_errors = analyzer.errors
+            calls = analyzer.calls
+            safe_accesses = analyzer.safe_accesses
+        else:
+            semantic_success = False
+            semantic_errors = []
+            calls = []
+            safe_accesses = set()
+        frames = layout_frames(symbol_table)
+        return CompileResult(tokens, ast, syntax_errors, semantic_success, semantic_errors, symbol_table, frames,
+                             xref, calls, safe_accesses)
+
+
+class EnginePool:
+    """A bounded pool of CompileEngines checked out one request at a time.
+
+    Engines are created lazily up to `size`; when all of them are busy,
+    `engine()` blocks until one is returned.
+    """
+
+    def __init__(self, size=4, factory=CompileEngine):
+        self.size = size
+        self.factory = factory
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return self.factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return self._idle.get(timeout=timeout)
+
+    @contextmanager
+    def engine(self, timeout=None):
+        """Check an engine out of the pool for the duration of a with block."""
+        engine = self._acquire(timeout)
+        try:
+            yield engine
+        finally:
+            self._idle.put(engine)
+
+    def warm(self):
+        """Create all engines up front instead of on first use."""
+        engines = [self._acquire(None) for _ in range(self.size)]
+        for engine in engines:
+            self._idle.put(engine)
+
+    def compile(self, code, timeout=None):
+        """Compile source text on a pooled engine."""
+        with self.engine(timeout) as engine:
+            return engine.compile(code)
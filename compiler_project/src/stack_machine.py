@@ -0,0 +1,385 @@
+"""
+Stack machine execution: calls that don't use the Python stack.
+
+The tree-walking Interpreter recurses in Python for every nested node, so
+one call in the source costs about ten Python frames plus a Scope per
+block and an exception to unwind the `return`. A recursion a hundred or so
+calls deep runs into Python's recursion limit. StackMachine compiles each
+function to a flat list of instructions over a value stack and runs them
+in one loop. A call saves the caller's (code, pc, slots) on a list and
+switches to the callee's code; a return restores them. Recursion depth is
+bounded by MAX_DEPTH instead of the Python stack, and a call costs one
+list of slots.
+
+Names are resolved when a function is compiled: parameters and locals get
+slots in the function's frame (sibling blocks share slots, see
+frame_layout), globals an index in one list for the program. A block's
+locals are reset to their zero value, arrays to a fresh list, each time it
+is entered. Results and run-time errors are the Interpreter's, including
+the order operands are evaluated in.
+
+    machine = StackMachine(ast)
+    value = machine.run('main', [10])
+"""
+import operator
+
+from .interpreter import DECLARATIONS_ONLY, ExecutionError, default_value, int_divide, out_of_bounds, truth
+
+MAX_DEPTH = 1000000
+
+# Opcodes; an instruction is (opcode, a, b)
+(CONST, LOAD, GLOAD, SET, GSET, DUP, POP, FLOAT, ELEM, SET_ELEM, BINARY, BOOL,
+ JUMP, JUMP_IF_FALSE, COMPARE_JUMP, CALL, RETURN, INIT, NEW_ARRAY, FAIL) = range(20)
+
+_COMPARISONS = {'<': operator.lt, '<=': operator.le, '>': operator.gt,
+                '>=': operator.ge, '==': operator.eq, '!=': operator.ne}
+
+
+def _divide(left, right):
+    if left.__class__ is int and right.__class__ is int:
+        return int_divide(left, right)
+    if right == 0:
+        raise ExecutionError("Division by zero")
+    return left / right
+
+
+_ARITHMETIC = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': _divide}
+
+
+class Function:
+    """One compiled function: its instructions and frame size."""
+
+    def __init__(self, decl):
+        self.name = decl[2]
+        self.type = decl[1]
+        self.params = [] if decl[3] == 'void' else decl[3]
+        self.code = []
+        self.size = len(self.params)
+        self.padding = []  # Slots after the parameters, appended to the arguments on a call
+
+    def __repr__(self):
+        return f"Function({self.name}, {len(self.code)} instructions, {self.size} slots)"
+
+
+class _Compiler:
+    """Compiles one function body to instructions."""
+
+    def __init__(self, function, functions, global_slots):
+        self.function = function
+        self.functions = functions
+        self.global_slots = global_slots  # name -> (index, type)
+        self.code = function.code
+        self.scopes = [{param[2]: (k, param[1] if param[0] == 'param' else f'array_{param[1]}')
+                        for k, param in enumerate(function.params)}]
+        self.next_slot = len(function.params)
+
+    def compile(self, body):
+        for k, param in enumerate(self.function.params):
+            if param[0] == 'param' and param[1] == 'float':
+                self.emit(LOAD, k)
+                self.emit(FLOAT)
+                self.emit(SET, k)
+        self.statement(body)
+        fun_type = self.function.type
+        self.emit(CONST, None if fun_type == 'void' else default_value(fun_type))
+        self.emit(RETURN)
+        self.function.padding = [None] * (self.function.size - len(self.function.params))
+
+    def emit(self, op, a=None, b=None):
+        self.code.append((op, a, b))
+        return len(self.code) - 1
+
+    def patch(self, at, target):
+        op, a, _ = self.code[at]
+        if op == COMPARE_JUMP:
+            self.code[at] = (op, a, target)
+        else:
+            self.code[at] = (op, target, None)
+
+    # Names
+
+    def resolve(self, name):
+        """Get (is_global, index, type) for a name, or None if it isn't declared."""
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return (False,) + scope[name]
+        if name in self.global_slots:
+            return (True,) + self.global_slots[name]
+        return None
+
+    def load(self, name):
+        found = self.resolve(name)
+        if found is None:
+            self.emit(FAIL, f"Variable '{name}' not declared")
+        else:
+            self.emit(GLOAD if found[0] else LOAD, found[1])
+        return found
+
+    # Statements
+
+    def statement(self, node):
+        kind = node[0]
+        if kind == 'compound_stmt':
+            saved = self.next_slot
+            scope = {}
+            for decl in node[1]:
+                slot = self.next_slot
+                self.next_slot += 1
+                if decl[0] == 'array_decl':
+                    scope[decl[2]] = (slot, f'array_{decl[1]}')
+                    self.emit(NEW_ARRAY, slot, (default_value(decl[1]), decl[3]))
+                else:
+                    scope[decl[2]] = (slot, decl[1])
+                    self.emit(INIT, slot, default_value(decl[1]))
+            self.function.size = max(self.function.size, self.next_slot)
+            self.scopes.append(scope)
+            for stmt in node[2]:
+                self.statement(stmt)
+            self.scopes.pop()
+            self.next_slot = saved
+        elif kind == 'expr_stmt':
+            if node[1][0] == 'assign':
+                self.assign(node[1], keep=False)
+            else:
+                self.expression(node[1])
+                self.emit(POP)
+        elif kind == 'if_stmt':
+            skip = self.branch(node[1])
+            self.statement(node[2])
+            for at in skip:
+                self.patch(at, len(self.code))
+        elif kind == 'if_else_stmt':
+            otherwise = self.branch(node[1])
+            self.statement(node[2])
+            done = self.emit(JUMP)
+            for at in otherwise:
+                self.patch(at, len(self.code))
+            self.statement(node[3])
+            self.patch(done, len(self.code))
+        elif kind == 'while_stmt':
+            top = len(self.code)
+            done = self.branch(node[1])
+            self.statement(node[2])
+            self.emit(JUMP, top)
+            for at in done:
+                self.patch(at, len(self.code))
+        elif kind == 'return_stmt':
+            if node[1] is None:
+                self.emit(CONST, None)
+            else:
+                self.expression(node[1])
+                if self.function.type == 'float':
+                    self.emit(FLOAT)
+            self.emit(RETURN)
+        elif kind != 'empty_stmt':
+            self.emit(FAIL, f"Cannot execute node '{kind}'")
+
+    def branch(self, node):
+        """Compile a condition; returns the jumps to patch to where it is false."""
+        if node[0] == 'and':
+            return self.branch(node[1]) + self.branch(node[2])
+        if node[0] == 'relop':
+            self.expression(node[2])
+            self.expression(node[3])
+            return [self.emit(COMPARE_JUMP, _COMPARISONS[node[1]])]
+        self.expression(node)
+        return [self.emit(JUMP_IF_FALSE)]
+
+    # Expressions
+
+    def expression(self, node):
+        kind = node[0]
+        if kind == 'number' or kind == 'char':
+            self.emit(CONST, node[1])
+        elif kind == 'boolean':
+            self.emit(CONST, node[1] == 'true')
+        elif kind == 'var':
+            self.load(node[1])
+        elif kind == 'array_access':
+            self.load(node[1])
+            self.expression(node[2])
+            self.emit(ELEM, node[1])
+        elif kind == 'assign':
+            self.assign(node, keep=True)
+        elif kind in ('addop', 'mulop'):
+            self.expression(node[2])
+            self.expression(node[3])
+            self.emit(BINARY, _ARITHMETIC[node[1]])
+        elif kind == 'relop':
+            self.expression(node[2])
+            self.expression(node[3])
+            self.emit(BINARY, _COMPARISONS[node[1]])
+        elif kind in ('and', 'or'):
+            # `a and b` is false without evaluating b when a is false; `a or b` the other way
+            self.expression(node[1])
+            if kind == 'and':
+                short = self.emit(JUMP_IF_FALSE)
+                self.expression(node[2])
+                self.emit(BOOL)
+                done = self.emit(JUMP)
+                self.patch(short, len(self.code))
+                self.emit(CONST, False)
+            else:
+                long = self.emit(JUMP_IF_FALSE)
+                self.emit(CONST, True)
+                done = self.emit(JUMP)
+                self.patch(long, len(self.code))
+                self.expression(node[2])
+                self.emit(BOOL)
+            self.patch(done, len(self.code))
+        elif kind == 'call':
+            callee = self.functions.get(node[1])
+            if callee is None:
+                self.emit(FAIL, f"Function '{node[1]}' not declared")
+                return
+            for arg in node[2]:
+                self.expression(arg)
+            if len(callee.params) != len(node[2]):
+                self.emit(FAIL, f"Wrong number of arguments for function '{node[1]}'")
+            else:
+                self.emit(CALL, callee, len(node[2]))
+        else:
+            self.emit(FAIL, f"Cannot evaluate node '{kind}'")
+
+    def assign(self, node, keep):
+        target = node[1]
+        self.expression(node[2])
+        found = self.resolve(target[1])
+        if found is None:
+            self.emit(FAIL, f"Variable '{target[1]}' not declared")
+            return
+        is_global, index, type = found
+        if target[0] == 'array_access':
+            if type == 'array_float':
+                self.emit(FLOAT)
+            if keep:
+                self.emit(DUP)
+            self.emit(GLOAD if is_global else LOAD, index)
+            self.expression(target[2])
+            self.emit(SET_ELEM, target[1])
+        else:
+            if type == 'float':
+                self.emit(FLOAT)
+            if keep:
+                self.emit(DUP)
+            self.emit(GSET if is_global else SET, index)
+
+
+class StackMachine:
+    """Runs a program's compiled functions with an explicit call stack.
+
+    Same interface as Interpreter: run() returns the entry function's
+    result and `globals` holds the final values of the globals.
+    """
+
+    def __init__(self, ast):
+        if ast is None:
+            raise ExecutionError("Cannot execute a program that failed to parse")
+        self.functions = {}
+        self.global_decls = []
+        self.global_slots = {}
+        self.global_values = []
+        bodies = []
+        for decl in ast[1]:
+            if decl[0] == 'fun_decl':
+                self.functions[decl[2]] = Function(decl)
+                bodies.append((self.functions[decl[2]], decl[4]))
+            elif decl[0] in ('var_decl', 'array_decl'):
+                type = f'array_{decl[1]}' if decl[0] == 'array_decl' else decl[1]
+                self.global_slots[decl[2]] = (len(self.global_decls), type)
+                self.global_decls.append(decl)
+            elif decl[0] not in DECLARATIONS_ONLY:
+                raise ExecutionError(f"Cannot execute node '{decl[0]}'")
+        for function, body in bodies:
+            _Compiler(function, self.functions, self.global_slots).compile(body)
+
+    @property
+    def globals(self):
+        """Current values of the global variables."""
+        return {decl[2]: list(value) if isinstance(value, list) else value
+                for decl, value in zip(self.global_decls, self.global_values)}
+
+    def run(self, entry='main', args=None):
+        """Run the program from a fresh global state and return the entry function's result."""
+        self.global_values = [[default_value(decl[1])] * decl[3] if decl[0] == 'array_decl'
+                              else default_value(decl[1]) for decl in self.global_decls]
+        function = self.functions.get(entry)
+        if function is None:
+            raise ExecutionError(f"Function '{entry}' not declared")
+        args = list(args or [])
+        if len(function.params) != len(args):
+            raise ExecutionError(f"Wrong number of arguments for function '{entry}'")
+        return self._execute(function, args)
+
+    def _execute(self, function, args):
+        globals_ = self.global_values
+        stack = []
+        push, pop = stack.append, stack.pop
+        frames = []  # (code, pc, slots) of every caller
+        code, pc, slots = function.code, 0, args + function.padding
+        while True:
+            op, a, b = code[pc]
+            pc += 1
+            if op == LOAD:
+                push(slots[a])
+            elif op == CONST:
+                push(a)
+            elif op == BINARY:
+                right = pop()
+                stack[-1] = a(stack[-1], right)
+            elif op == COMPARE_JUMP:
+                right = pop()
+                if not a(pop(), right):
+                    pc = b
+            elif op == SET:
+                slots[a] = pop()
+            elif op == ELEM:
+                index = pop()
+                array = stack[-1]
+                if not 0 <= index < len(array):
+                    out_of_bounds(a, index, len(array))
+                stack[-1] = array[index]
+            elif op == JUMP:
+                pc = a
+            elif op == JUMP_IF_FALSE:
+                if not truth(pop()):
+                    pc = a
+            elif op == CALL:
+                if len(frames) >= MAX_DEPTH:
+                    raise ExecutionError(f"Recursion deeper than {MAX_DEPTH} calls")
+                frames.append((code, pc, slots))
+                if b:
+                    slots = stack[-b:] + a.padding
+                    del stack[-b:]
+                else:
+                    slots = a.padding[:]
+                code, pc = a.code, 0
+            elif op == RETURN:
+                if not frames:
+                    return pop()
+                code, pc, slots = frames.pop()
+            elif op == GLOAD:
+                push(globals_[a])
+            elif op == GSET:
+                globals_[a] = pop()
+            elif op == SET_ELEM:
+                index = pop()
+                array = pop()
+                if not 0 <= index < len(array):
+                    out_of_bounds(a, index, len(array))
+                array[index] = pop()
+            elif op == INIT:
+                slots[a] = b
+            elif op == NEW_ARRAY:
+                slots[a] = [b[0]] * b[1]
+            elif op == FLOAT:
+                if stack[-1].__class__ is int:
+                    stack[-1] = float(stack[-1])
+            elif op == POP:
+                pop()
+            elif op == DUP:
+                push(stack[-1])
+            elif op == BOOL:
+                stack[-1] = truth(stack[-1])
+            else:
+                raise ExecutionError(a)
@@ -0,0 +1,210 @@
+"""
+Persistent symbol index for multi-file codebases.
+
+Each source file is compiled once and its symbol table and call sites are
+stored in a SQLite database, keyed by the file's content digest. Updating
+the index only recompiles files whose digest changed, so "where is X
+declared" and "who calls X" stay cheap across thousands of files.
+
+    python -m src.main index update symbols.db src/ lib/
+    python -m src.main index find symbols.db fib
+    python -m src.main index callers symbols.db fib
+"""
+import argparse
+import json
+import os
+import sqlite3
+
+from .artifact import source_digest
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    digest TEXT NOT NULL,
+    errors INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    type TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    line INTEGER,
+    memory_location INTEGER,
+    params TEXT
+);
+CREATE TABLE IF NOT EXISTS calls (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    caller TEXT,
+    callee TEXT NOT NULL,
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS symbols_name ON symbols(name);
+CREATE INDEX IF NOT EXISTS symbols_file ON symbols(file_id);
+CREATE INDEX IF NOT EXISTS calls_callee ON calls(callee);
+CREATE INDEX IF NOT EXISTS calls_caller ON calls(caller);
+CREATE INDEX IF NOT EXISTS calls_file ON calls(file_id);
+"""
+
+SOURCE_EXTENSIONS = ('.c',)
+
+
+def find_sources(paths):
+    """Expand files and directories into a sorted list of source files."""
+    sources = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                sources.update(os.path.join(root, name) for name in names if name.endswith(SOURCE_EXTENSIONS))
+        else:
+            sources.add(path)
+    return sorted(os.path.abspath(source) for source in sources)
+
+
+class SymbolIndex:
+    """A SQLite-backed index of declarations and call sites across files."""
+
+    def __init__(self, path, engine=None):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.executescript(SCHEMA)
+        self._engine = engine
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from .service import CompileEngine
+            self._engine = CompileEngine()
+        return self._engine
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Updating
+
+    def update(self, paths, prune=True):
+        """Bring the index up to date with the sources under paths.
+
+        Returns counts of files that were indexed, unchanged and removed.
+        With prune, indexed files that no longer exist on disk are dropped.
+        """
+        digests = dict(self.connection.execute('SELECT path, digest FROM files'))
+        stats = {'indexed': 0, 'unchanged': 0, 'removed': 0}
+        with self.connection:
+            for path in find_sources(paths):
+                with open(path, 'r') as file:
+                    source = file.read()
+                digest = source_digest(source)
+                if digests.get(path) == digest:
+                    stats['unchanged'] += 1
+                    continue
+                self._index_file(path, source, digest)
+                stats['indexed'] += 1
+            if prune:
+                for path in digests:
+                    if not os.path.exists(path):
+                        self.connection.execute('DELETE FROM files WHERE path = ?', (path,))
+                        stats['removed'] += 1
+        return stats
+
+    def _index_file(self, path, source, digest):
+        result = self.engine.compile(source)
+        errors = len(result.syntax_errors) + len(result.semantic_errors)
+        self.connection.execute('DELETE FROM files WHERE path = ?', (path,))
+        file_id = self.connection.execute(
+            'INSERT INTO files (path, digest, errors) VALUES (?, ?, ?)', (path, digest, errors)
+        ).lastrowid
+
+        symbols = []
+        for (name, scope), symbol in result.symbol_table.symbols.items():
+            params = symbol.attributes.get('params')
+            symbols.append((file_id, name, symbol.kind, symbol.type, scope, symbol.line_no,
+                            symbol.attributes.get('memory_location'),
+                            json.dumps(params) if params is not None else None))
+        self.connection.executemany('INSERT INTO symbols VALUES (?, ?, ?, ?, ?, ?, ?, ?)', symbols)
+        self.connection.executemany(
+            'INSERT INTO calls VALUES (?, ?, ?, ?)',
+            [(file_id, caller, callee, line) for caller, callee, line in result.calls]
+        )
+
+    # Queries
+
+    def declarations(self, name, kind=None):
+        """Get every declaration of name as dicts, optionally only of one kind."""
+        query = ('SELECT files.path, symbols.name, kind, type, scope, line, memory_location, params '
+                 'FROM symbols JOIN files ON files.id = symbols.file_id WHERE name = ?')
+        args = [name]
+        if kind is not None:
+            query += ' AND kind = ?'
+            args.append(kind)
+        rows = self.connection.execute(query + ' ORDER BY files.path, line', args)
+        return [
+            {'path': path, 'name': name, 'kind': kind, 'type': type, 'scope': scope, 'line': line,
+             'memory_location': memory_location, 'params': json.loads(params) if params else None}
+            for path, name, kind, type, scope, line, memory_location, params in rows
+        ]
+
+    def callers(self, callee):
+        """Get every call site of a function as (path, caller, line) tuples."""
+        return self.connection.execute(
+            'SELECT files.path, caller, line FROM calls JOIN files ON files.id = calls.file_id '
+            'WHERE callee = ? ORDER BY files.path, line', (callee,)
+        ).fetchall()
+
+    def callees(self, caller):
+        """Get every call made from functions named caller as (path, callee, line) tuples."""
+        return self.connection.execute(
+            'SELECT files.path, callee, line FROM calls JOIN files ON files.id = calls.file_id '
+            'WHERE caller = ? ORDER BY files.path, line', (caller,)
+        ).fetchall()
+
+    def file_count(self):
+        return self.connection.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog='main.py index', description="Persistent symbol index")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    update = commands.add_parser('update', help="Index new and changed sources")
+    update.add_argument('database')
+    update.add_argument('paths', nargs='+', help="Source files or directories")
+    update.add_argument('--no-prune', action='store_true', help="Keep entries for deleted files")
+    find = commands.add_parser('find', help="Where is a name declared")
+    find.add_argument('database')
+    find.add_argument('name')
+    find.add_argument('--kind', choices=['function', 'variable', 'parameter', 'array'])
+    callers = commands.add_parser('callers', help="Who calls a function")
+    callers.add_argument('database')
+    callers.add_argument('name')
+    callees = commands.add_parser('callees', help="What a function calls")
+    callees.add_argument('database')
+    callees.add_argument('name')
+    args = arg_parser.parse_args(argv)
+
+    with SymbolIndex(args.database) as index:
+        if args.command == 'update':
+            stats = index.update(args.paths, prune=not args.no_prune)
+            print(f"{stats['indexed']} indexed, {stats['unchanged']} unchanged, {stats['removed']} removed")
+        elif args.command == 'find':
+            for row in index.declarations(args.name, args.kind):
+                params = f" ({', '.join(row['params'])})" if row['params'] is not None else ''
+                print(f"{row['path']}:{row['line']}: {row['kind']} {row['name']}: {row['type']}{params} in {row['scope']}")
+        elif args.command == 'callers':
+            for path, caller, line in index.callers(args.name):
+                print(f"{path}:{line}: {caller}")
+        else:
+            for path, callee, line in index.callees(args.name):
+                print(f"{path}:{line}: {callee}")
+
+
+if __name__ == '__main__':
+    main()
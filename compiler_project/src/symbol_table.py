@@ -1,3 +1,7 @@
+import bisect
+
+from .type_system import get_type
+
 class Symbol:
     def __init__(self, name, type, line_no=None, kind='variable', size=None):
         self.name = name
@@ -5,6 +9,7 @@ class Symbol:
         self.line_no = line_no
         self.kind = kind
         self.size = size  # For arrays
+        self.scope = None  # Qualified scope name, set on insert
         self.attributes = {
             'size': None,          # Size for arrays
             'params': [],          # Parameter list for functions
@@ -27,11 +32,20 @@ class SymbolTable:
         self.next_memory_location = 0
         self.scope_symbols = {"global": set()}
         self.scope_sizes = {"global": 0}
+        self._scope_index = ["global"]  # Sorted scope names, for prefix counts
+        self.module = None
+        self.imports = {}  # name -> (module, kind, type, params, size) of globals other modules export
+        self._imported = {}
 
     def enter_scope(self, scope_name):
         """Enter a new scope."""
-        # Create a unique scope name by combining parent scope and scope name with a counter
-        scope_counter = len([s for s in self.scope_symbols.keys() if s.startswith(f"{self.current_scope}.{scope_name}")])
+        # Create a unique scope name by combining parent scope and scope name with a
+        # counter of the existing scopes sharing that prefix
+        if len(self._scope_index) != len(self.scope_symbols):
+            self._scope_index = sorted(self.scope_symbols)
+        prefix = f"{self.current_scope}.{scope_name}"
+        scope_counter = (bisect.bisect_left(self._scope_index, prefix + '\U0010ffff')
+                         - bisect.bisect_left(self._scope_index, prefix))
         qualified_scope = f"{self.current_scope}.{scope_name}_{scope_counter}"
         
         self.scope_stack.append(qualified_scope)
@@ -41,6 +55,7 @@ class SymbolTable:
         # Initialize the new scope's data structures
         if qualified_scope not in self.scope_symbols:
             self.scope_symbols[qualified_scope] = set()
+            bisect.insort(self._scope_index, qualified_scope)
         if qualified_scope not in self.scope_sizes:
             self.scope_sizes[qualified_scope] = 0
 
@@ -66,6 +81,7 @@ class SymbolTable:
             raise Exception(f"Symbol '{name}' already declared in current scope")
             
         self.symbols[key] = Symbol(name, type, line_no, kind, size)
+        self.symbols[key].scope = self.current_scope
         self.symbols[key].attributes['memory_location'] = self._allocate_memory(type)
         
         # Add to current scope's symbol set
@@ -95,7 +111,27 @@ class SymbolTable:
             key = (name, scope)
             if key in self.symbols:
                 return self.symbols[key]
-        return None
+        return self._lookup_import(name)
+
+    def _lookup_import(self, name):
+        """Resolve a name through the imported module interfaces, behind every scope."""
+        symbol = self._imported.get(name)
+        if symbol is None and name in self.imports:
+            module, kind, type, params, size = self.imports[name]
+            if module == self.module:
+                return None
+            # Imports are shared between tables; each table gets its own Symbol
+            symbol = Symbol(name, type, None, kind, size)
+            symbol.scope = 'global'
+            symbol.attributes['extern'] = True
+            symbol.attributes['module'] = module
+            if params is not None:
+                symbol.attributes['params'] = list(params)
+            if size is not None:
+                symbol.attributes['size'] = size
+                symbol.attributes['array_dimensions'] = [size]
+            self._imported[name] = symbol
+        return symbol
 
     def update_symbol(self, name, **attributes):
         """Update symbol attributes."""
@@ -145,15 +181,7 @@ class SymbolTable:
         """Get size of a type in symbolic memory units."""
         if type is None:
             return 0
-        type_sizes = {
-            'int': 4,
-            'float': 4,
-            'char': 1,
-            'boolean': 1,
-            'void': 0
-        }
-        base_type = type.split('_')[0] if '_' in type else type
-        return type_sizes.get(base_type, 4)  # Default to 4 for unknown types
+        return get_type(type).size  # Default to 4 for unknown types
 
     def _add_reference(self, symbol, line_number):
         """Add a reference to a symbol."""
@@ -0,0 +1,208 @@
+"""
+Tail-call elimination for self-recursive functions.
+
+A tail call is a `return f(args);` inside `f` itself: nothing of the
+caller's frame is needed once the call is made, so the call can reuse it.
+TailCallEliminator rewrites such a function into a loop that reassigns the
+parameters and starts the body again:
+
+    int fact(int n, int acc) {          int fact(int n, int acc) {
+        if (n <= 1) return acc;             int _arg_n; boolean _again;
+        return fact(n - 1, acc * n);        _again = true;
+    }                                       while (_again) {
+                                                _again = false;
+                                                if (n <= 1) return acc;
+                                                else { _arg_n = n - 1; acc = acc * n;
+                                                       n = _arg_n; _again = true; }
+                                            }
+                                        }
+
+Each tail call becomes assignments of its arguments to the parameters and
+`_again = true`. Arguments are evaluated left to right before any
+parameter they read is changed: a parameter read by a later argument goes
+through a `_arg_<name>` temporary first. A tail call must end its path
+through the body, so statements after a statement containing one are moved
+onto the paths of that statement that don't (as the inliner does with
+returns). The body block is entered anew on each iteration, so its locals
+start from zero like they would in a fresh call. Other returns are left as
+they are and still leave the function.
+
+A function is left alone when a tail call is inside a `while` loop (there
+is no `break` to leave it), when it passes a different array for an array
+parameter, or when a block declares a name that would capture a parameter
+or a moved statement. The generated names can't be spelled in source.
+
+Every backend runs the result, so tail recursion runs in constant stack
+space everywhere. Recursion that isn't a tail call is left to the backend;
+StackMachine runs it without Python frames.
+
+    looped, eliminator = eliminate_tail_calls(ast, positions)
+    print(eliminator.report())
+"""
+AGAIN = '_again'
+
+
+class NotTransformable(Exception):
+    """Raised while rewriting a function whose tail calls can't become a loop."""
+    pass
+
+
+def _is_tail_call(node, name):
+    return (node[0] == 'return_stmt' and node[1] is not None
+            and node[1][0] == 'call' and node[1][1] == name)
+
+
+def _has_tail_call(node, name):
+    if isinstance(node, list):
+        return any(_has_tail_call(item, name) for item in node)
+    if not isinstance(node, tuple):
+        return False
+    if _is_tail_call(node, name):
+        return True
+    return any(_has_tail_call(child, name) for child in node[1:] if isinstance(child, (tuple, list)))
+
+
+def _names(node, found):
+    """Collect every variable and array name an AST fragment mentions."""
+    if isinstance(node, list):
+        for item in node:
+            _names(item, found)
+    elif isinstance(node, tuple):
+        if node[0] in ('var', 'array_access'):
+            found.add(node[1])
+        for child in node[1:]:
+            if isinstance(child, (tuple, list)):
+                _names(child, found)
+    return found
+
+
+def _declared(node, found):
+    """Collect the names declared by every block in a statement."""
+    if isinstance(node, tuple):
+        if node[0] == 'compound_stmt':
+            found.update(decl[2] for decl in node[1])
+            for stmt in node[2]:
+                _declared(stmt, found)
+        else:
+            for child in node[1:]:
+                if isinstance(child, tuple):
+                    _declared(child, found)
+    return found
+
+
+class TailCallEliminator:
+    """Rewrites self tail calls into loops; see the module docstring."""
+
+    def __init__(self, ast, positions=None):
+        self.ast = ast
+        self.positions = positions if positions is not None else {}
+        self.looped = {}  # name -> tail calls rewritten
+        self.kept = {}  # name -> why a function with tail calls was left alone
+        self._name = None
+        self._params = []
+        self._temporaries = []
+
+    def eliminate(self):
+        """Get the rewritten copy of the AST; untouched functions are shared with the original."""
+        decls = []
+        for decl in self.ast[1]:
+            if decl[0] == 'fun_decl' and _has_tail_call(decl[4], decl[2]):
+                try:
+                    decl = self._function(decl)
+                except NotTransformable as e:
+                    self.kept[decl[2]] = str(e)
+            decls.append(decl)
+        return (self.ast[0], decls)
+
+    def report(self):
+        """Format one line per function with self tail calls."""
+        out = [f"looped {name}: {count} tail call{'s' if count != 1 else ''}"
+               for name, count in self.looped.items()]
+        out.extend(f"kept {name}: {reason}" for name, reason in self.kept.items())
+        return '\n'.join(out)
+
+    def _rebuilt(self, old, new):
+        """Give a rebuilt node the source position of the node it replaces."""
+        position = self.positions.get(id(old))
+        if position is not None:
+            self.positions[id(new)] = position
+        return new
+
+    def _function(self, decl):
+        fun_type, name, params, body = decl[1], decl[2], decl[3], decl[4]
+        self._name = name
+        self._params = [] if params == 'void' else params
+        self._temporaries = []
+        if {param[2] for param in self._params} & _declared(body, set()):
+            raise NotTransformable("a block declares a parameter's name")
+        self.looped[name] = 0
+        try:
+            body = self._push(body, [])
+        except NotTransformable:
+            del self.looped[name]
+            raise
+
+        again = ('var', AGAIN)
+        loop = ('while_stmt', again, ('compound_stmt', [], [
+            ('expr_stmt', ('assign', again, ('boolean', 'false'))),
+            body,
+        ]))
+        looped = ('compound_stmt', self._temporaries + [('var_decl', 'boolean', AGAIN)], [
+            ('expr_stmt', ('assign', again, ('boolean', 'true'))),
+            self._rebuilt(decl[4], loop),
+        ])
+        return self._rebuilt(decl, ('fun_decl', fun_type, name, params, looped))
+
+    def _tail(self, stmts):
+        """Move the statements after one with a tail call onto its paths without one."""
+        for k, stmt in enumerate(stmts):
+            if _has_tail_call(stmt, self._name):
+                return stmts[:k] + [self._push(stmt, stmts[k + 1:])]
+        return stmts
+
+    def _push(self, stmt, rest):
+        kind = stmt[0]
+        if _is_tail_call(stmt, self._name):
+            return self._rebuilt(stmt, self._rebind(stmt[1][2]))  # Whatever follows is unreachable
+        if not _has_tail_call(stmt, self._name):
+            return ('compound_stmt', [], [stmt] + self._tail(rest)) if rest else stmt
+        if kind == 'compound_stmt':
+            if rest and {decl[2] for decl in stmt[1]} & _names(rest, set()):
+                raise NotTransformable("a block local would capture a name used after it")
+            return self._rebuilt(stmt, ('compound_stmt', stmt[1], self._tail(stmt[2] + rest)))
+        if kind == 'if_stmt':
+            otherwise = ('compound_stmt', [], self._tail(rest)) if rest else ('empty_stmt',)
+            return self._rebuilt(stmt, ('if_else_stmt', stmt[1], self._push(stmt[2], rest), otherwise))
+        if kind == 'if_else_stmt':
+            return self._rebuilt(stmt, ('if_else_stmt', stmt[1], self._push(stmt[2], rest), self._push(stmt[3], rest)))
+        raise NotTransformable("tail call inside a loop")
+
+    def _rebind(self, args):
+        """Get the statements that take the place of one tail call."""
+        if len(args) != len(self._params):
+            raise NotTransformable("tail call with the wrong number of arguments")
+        self.looped[self._name] += 1
+        stmts, deferred = [], []
+        for k, (param, arg) in enumerate(zip(self._params, args)):
+            name = param[2]
+            if arg == ('var', name):
+                continue  # Passed through unchanged
+            if param[0] == 'array_param':
+                raise NotTransformable("passes a different array")
+            if any(name in _names(later, set()) for later in args[k + 1:]):
+                temporary = f'_arg_{name}'
+                if not any(decl[2] == temporary for decl in self._temporaries):
+                    self._temporaries.append(('var_decl', param[1], temporary))
+                stmts.append(('expr_stmt', ('assign', ('var', temporary), arg)))
+                deferred.append(('expr_stmt', ('assign', ('var', name), ('var', temporary))))
+            else:
+                stmts.append(('expr_stmt', ('assign', ('var', name), arg)))
+        stmts.extend(deferred)
+        stmts.append(('expr_stmt', ('assign', ('var', AGAIN), ('boolean', 'true'))))
+        return ('compound_stmt', [], stmts)
+
+
+def eliminate_tail_calls(ast, positions=None):
+    """Rewrite the self tail calls of a checked AST into loops; returns (new AST, eliminator)."""
+    eliminator = TailCallEliminator(ast, positions)
+    return eliminator.eliminate(), eliminator
@@ -0,0 +1,120 @@
+"""
+Canonical type objects shared by the parser, semantic analyzer and symbol
+table.
+
+Type strings such as 'int', 'array_float' or 'function_void' map to exactly
+one Type each, so type checks are identity comparisons and table lookups
+instead of repeated string splitting. Symbols keep their type as the
+(interned) string name for display and serialization.
+
+Every type the grammar can name is created at import. Any other name is
+created on first use under a lock, so threads compiling at the same time
+(see service.EnginePool) still share one Type per name.
+"""
+import sys
+import threading
+
+SCALAR = 'scalar'
+ARRAY = 'array'
+FUNCTION = 'function'
+
+BASE_TYPES = ('int', 'float', 'void', 'char', 'boolean')
+
+# Sizes in symbolic memory units, keyed by the part of the name before the
+# first '_'; anything else (arrays, functions, unknown types) takes 4.
+_SIZES = {'int': 4, 'float': 4, 'char': 1, 'boolean': 1, 'void': 0}
+
+intern_name = sys.intern
+
+
+class Type:
+    """A canonical type: `base` is the scalar name, or the element/return type for arrays and functions."""
+    __slots__ = ('name', 'kind', 'base', 'element', 'size')
+
+    def __init__(self, name, kind, base, element):
+        self.name = name
+        self.kind = kind
+        self.base = base
+        self.element = element
+        self.size = _SIZES.get(name.split('_')[0], 4)
+
+    def __repr__(self):
+        return f"Type({self.name})"
+
+    def __str__(self):
+        return self.name
+
+
+_types = {}
+_types_lock = threading.RLock()  # Reentrant: an array or function type creates its element type
+
+
+def get_type(name):
+    """Get the canonical Type for a type string, or None for None."""
+    if name is None:
+        return None
+    type = _types.get(name)
+    if type is None:
+        with _types_lock:
+            type = _types.get(name)
+            if type is None:
+                type = _types[name] = _new_type(name)
+    return type
+
+
+def _new_type(name):
+    """Build the Type for a name that has none yet."""
+    if name.startswith('array_'):
+        element = get_type(name[len('array_'):])
+        return Type(intern_name(name), ARRAY, element.name, element)
+    if name.startswith('function_'):
+        element = get_type(name[len('function_'):])
+        return Type(intern_name(name), FUNCTION, element.name, element)
+    return Type(intern_name(name), SCALAR, intern_name(name), None)
+
+
+def array_type(base):
+    """Get the canonical array-of-base Type."""
+    return get_type(f'array_{base}')
+
+
+def function_type(return_type):
+    """Get the canonical Type of a function returning return_type."""
+    return get_type(f'function_{return_type}')
+
+
+INT = get_type('int')
+FLOAT = get_type('float')
+CHAR = get_type('char')
+BOOLEAN = get_type('boolean')
+VOID = get_type('void')
+
+for _base in BASE_TYPES:
+    array_type(_base)
+    function_type(_base)
+
+# Assignments allowed between different types (target, source)
+_PROMOTIONS = frozenset({(FLOAT, INT)})
+
+# Result type of + - * / and of relational operators over numeric operands
+_ARITHMETIC = {
+    (INT, INT): INT,
+    (INT, FLOAT): FLOAT,
+    (FLOAT, INT): FLOAT,
+    (FLOAT, FLOAT): FLOAT,
+}
+
+
+def is_assignable(target, source):
+    """Check if a value of type source can be assigned to target."""
+    return target is source or (target, source) in _PROMOTIONS
+
+
+def arithmetic_result(left, right):
+    """Get the result Type of an arithmetic operation, or None if the operands aren't numeric."""
+    return _ARITHMETIC.get((left, right))
+
+
+def is_numeric_pair(left, right):
+    """Check if both operands of a comparison are numeric."""
+    return (left, right) in _ARITHMETIC
@@ -0,0 +1,327 @@
+"""
+Vectorization of element-wise array loops with NumPy.
+
+recognize_loop finds `while` loops that apply the same arithmetic to every
+element of one or more arrays:
+
+    while (i < n) {
+        c[i] = a[i] + b[i] * k;
+        total = total + a[i];
+        i = i + 1;
+    }
+
+The condition is `i < bound` or `i <= bound` with a bound the loop can't
+change, the body assigns array elements at `i` plus or minus a constant and
+may add to `int` accumulators, and its last statement is `i = i + 1`.
+Right-hand sides use `+`, `-`, `*`, division by a nonzero literal, the
+index, scalars the loop doesn't assign and elements of `int` and `float`
+arrays. There is no loop-carried dependency when every access to an
+array the loop stores into uses the same offset: each iteration then
+reads only what it writes itself, so the statements can run one after
+another over the whole range. Float accumulators are left scalar, since
+NumPy sums in a different order and would round differently.
+
+The Python backend (`compile_program(ast, vectorize=True)`) emits a call to
+VectorLoop.run in front of each recognized loop, and the scalar loop runs
+when it returns None: NumPy isn't installed, the range is short, an index
+would fall outside an array (the scalar loop then reports it at the same
+iteration), two array parameters share storage, or an `int` value could
+leave the 64-bit range NumPy computes in. With vectorize the backend
+stores `int` arrays as `array('q')` next to the `array('d')` of `float`
+arrays, so NumPy works on them in place through the buffer protocol;
+arrays held in lists (from other callers) are copied in and out.
+"""
+from array import array
+
+try:
+    import numpy
+except ImportError:  # Optional; recognized loops then always run scalar
+    numpy = None
+
+# Shorter ranges run faster as plain Python than through NumPy's call overhead
+MIN_LENGTH = 32
+
+_DTYPES = {'d': 'float64', 'q': 'int64'}
+
+_INT_LIMIT = 2 ** 63
+_NUMERIC = ('int', 'float')
+
+
+class _Fallback(Exception):
+    """Raised while evaluating a vector loop that has to run scalar after all."""
+    pass
+
+
+def _offset(index, name):
+    """Get c for an index `name`, `name + c` or `name - c`, else None."""
+    if index[0] == 'var' and index[1] == name:
+        return 0
+    if (index[0] == 'addop' and index[2] == ('var', name) and index[3][0] == 'number'
+            and index[3][1].__class__ is int):
+        return index[3][1] if index[1] == '+' else -index[3][1]
+    if (index[0] == 'addop' and index[1] == '+' and index[3] == ('var', name) and index[2][0] == 'number'
+            and index[2][1].__class__ is int):
+        return index[2][1]
+    return None
+
+
+class VectorLoop:
+    """A recognized element-wise loop and the NumPy code that runs it."""
+
+    def __init__(self, index, inclusive, statements, arrays, scalars, types):
+        self.index = index
+        self.inclusive = inclusive
+        self.statements = statements  # ('store', array, offset, expr) or ('reduce', name, expr)
+        self.arrays = arrays  # Names, in the order run() gets their storage
+        self.scalars = scalars  # Names, in the order run() gets their values
+        self.reductions = [stmt[1] for stmt in statements if stmt[0] == 'reduce']
+        self.types = types  # name -> type for every name the loop uses
+        self.runs = 0
+        self.fallbacks = 0
+
+    def run(self, start, bound, arrays, scalars):
+        """Run the loop from index `start`; returns (index, *accumulators) or None to run it scalar."""
+        if numpy is None or start.__class__ is not int or bound.__class__ is not int:
+            return None
+        stop = bound + 1 if self.inclusive else bound
+        if stop - start < MIN_LENGTH:
+            return None
+        storage = dict(zip(self.arrays, arrays))
+        try:
+            self._check(storage, start, stop)
+            values = dict(zip(self.scalars, scalars))
+            pending = {}
+            for stmt in self.statements:
+                vector, type, magnitude = self._evaluate(stmt[-1], storage, values, pending, start, stop)
+                if type == 'int' and magnitude >= _INT_LIMIT:
+                    raise _Fallback()
+                if stmt[0] == 'store':
+                    if self.types[stmt[1]] == 'array_float':
+                        vector = numpy.asarray(vector, dtype=numpy.float64)
+                    pending[stmt[1]] = numpy.broadcast_to(vector, (stop - start,))
+                else:
+                    total = values[stmt[1]]
+                    if abs(total) + magnitude * (stop - start) >= _INT_LIMIT:
+                        raise _Fallback()
+                    count = stop - start if numpy.ndim(vector) == 0 else 1
+                    values[stmt[1]] = total + int(numpy.sum(vector)) * count
+        except (_Fallback, OverflowError):
+            self.fallbacks += 1
+            return None
+
+        offsets = {stmt[1]: stmt[2] for stmt in self.statements if stmt[0] == 'store'}
+        for name, vector in pending.items():
+            target = storage[name]
+            low = start + offsets[name]
+            if isinstance(target, array):
+                numpy.frombuffer(target, dtype=_DTYPES[target.typecode])[low:low + stop - start] = vector
+            else:
+                target[low:low + stop - start] = vector.tolist()
+        self.runs += 1
+        return (stop,) + tuple(values[name] for name in self.reductions)
+
+    def _check(self, storage, start, stop):
+        """Fall back unless every access stays in bounds and stored arrays share no storage."""
+        for stmt in self.statements:
+            if stmt[0] == 'store':
+                self._check_access(storage[stmt[1]], stmt[2], start, stop)
+            self._check_reads(stmt[-1], storage, start, stop)
+        stored = {stmt[1] for stmt in self.statements if stmt[0] == 'store'}
+        for name in stored:
+            for other in self.arrays:
+                if other != name and storage[other] is storage[name]:
+                    raise _Fallback()
+
+    def _check_access(self, target, offset, start, stop):
+        if start + offset < 0 or stop - 1 + offset >= len(target):
+            raise _Fallback()
+
+    def _check_reads(self, node, storage, start, stop):
+        if node[0] == 'array_access':
+            self._check_access(storage[node[1]], _offset(node[2], self.index), start, stop)
+        elif node[0] in ('addop', 'mulop'):
+            self._check_reads(node[2], storage, start, stop)
+            self._check_reads(node[3], storage, start, stop)
+
+    def _evaluate(self, node, storage, values, pending, start, stop):
+        """Get (vector or scalar, type, largest magnitude if int) for an element-wise expression."""
+        kind = node[0]
+        if kind == 'number':
+            value = node[1]
+            return value, 'int' if value.__class__ is int else 'float', abs(value)
+        if kind == 'var':
+            if node[1] == self.index:
+                return numpy.arange(start, stop, dtype=numpy.int64), 'int', max(abs(start), abs(stop - 1))
+            value = values[node[1]]
+            return value, self.types[node[1]], abs(value)
+        if kind == 'array_access':
+            name = node[1]
+            if name in pending:
+                vector = pending[name]
+            else:
+                low = start + _offset(node[2], self.index)
+                source = storage[name]
+                if isinstance(source, array):
+                    vector = numpy.frombuffer(source, dtype=_DTYPES[source.typecode])[low:low + stop - start]
+                else:
+                    dtype = numpy.float64 if self.types[name] == 'array_float' else numpy.int64
+                    vector = numpy.array(source[low:low + stop - start], dtype=dtype)
+            type = self.types[name][len('array_'):]
+            if type == 'float':
+                return vector, type, 0
+            return vector, type, max(int(vector.max()), -int(vector.min()))
+
+        left, left_type, left_magnitude = self._evaluate(node[2], storage, values, pending, start, stop)
+        right, right_type, right_magnitude = self._evaluate(node[3], storage, values, pending, start, stop)
+        type = 'float' if 'float' in (left_type, right_type) else 'int'
+        op = node[1]
+        if op == '+':
+            result, magnitude = left + right, left_magnitude + right_magnitude
+        elif op == '-':
+            result, magnitude = left - right, left_magnitude + right_magnitude
+        elif op == '*':
+            result, magnitude = left * right, left_magnitude * right_magnitude
+        elif type == 'float':
+            result, magnitude = numpy.true_divide(left, right), 0
+        else:
+            # Truncate toward zero like int_divide
+            quotient = numpy.abs(left) // abs(right)
+            result = numpy.where((numpy.asarray(left) < 0) != (right < 0), -quotient, quotient)
+            magnitude = left_magnitude
+        if type == 'int' and magnitude >= _INT_LIMIT:
+            raise _Fallback()
+        return result, type, magnitude if type == 'int' else 0
+
+
+class _Recognizer:
+    """Checks one while loop against the shape VectorLoop runs."""
+
+    def __init__(self, lookup):
+        self.lookup = lookup
+        self.types = {}
+        self.arrays = []
+        self.scalars = []
+
+    def _type(self, name):
+        if name not in self.types:
+            self.types[name] = self.lookup(name)
+        return self.types[name]
+
+    def recognize(self, node):
+        condition, body = node[1], node[2]
+        if condition[0] != 'relop' or condition[1] not in ('<', '<=') or condition[2][0] != 'var':
+            return None
+        index = condition[2][1]
+        if self._type(index) != 'int' or body[0] != 'compound_stmt' or body[1] or not body[2]:
+            return None
+        step = body[2][-1]
+        if step != ('expr_stmt', ('assign', ('var', index), ('addop', '+', ('var', index), ('number', 1)))) and \
+                step != ('expr_stmt', ('assign', ('var', index), ('addop', '+', ('number', 1), ('var', index)))):
+            return None
+
+        statements = []
+        stored = {}  # array -> offset
+        for stmt in body[2][:-1]:
+            if stmt[0] != 'expr_stmt' or stmt[1][0] != 'assign':
+                return None
+            target, value = stmt[1][1], stmt[1][2]
+            if target[0] == 'array_access':
+                offset = _offset(target[2], index)
+                if offset is None or self._type(target[1]) not in ('array_int', 'array_float'):
+                    return None
+                if stored.setdefault(target[1], offset) != offset:
+                    return None
+                statements.append(('store', target[1], offset, value))
+            elif target[1] != index and self._type(target[1]) == 'int' and value[0] == 'addop' and value[1] == '+':
+                # Accumulator: s = s + e or s = e + s
+                expr = value[3] if value[2] == target else value[2] if value[3] == target else None
+                if expr is None:
+                    return None
+                statements.append(('reduce', target[1], expr))
+            else:
+                return None
+
+        reductions = {stmt[1] for stmt in statements if stmt[0] == 'reduce'}
+        if len(reductions) != sum(stmt[0] == 'reduce' for stmt in statements):
+            return None
+        if not self._invariant(condition[3], index, reductions | set(stored)):
+            return None
+        for stmt in statements:
+            if not self._elementwise(stmt[-1], index, stored, reductions):
+                return None
+            if stmt[0] == 'reduce' and self._result_type(stmt[-1]) != 'int':
+                return None
+            if stmt[0] == 'store' and self._type(stmt[1]) == 'array_int' and self._result_type(stmt[-1]) != 'int':
+                return None
+        return VectorLoop(index, condition[1] == '<=', statements, self.arrays, self.scalars, self.types)
+
+    def _invariant(self, node, index, assigned):
+        """Whether the bound is integer arithmetic on names the loop doesn't assign."""
+        kind = node[0]
+        if kind == 'number':
+            return node[1].__class__ is int
+        if kind == 'var':
+            return node[1] != index and node[1] not in assigned and self._type(node[1]) == 'int'
+        if kind in ('addop', 'mulop'):
+            return self._invariant(node[2], index, assigned) and self._invariant(node[3], index, assigned)
+        return False
+
+    def _elementwise(self, node, index, stored, reductions):
+        kind = node[0]
+        if kind == 'number':
+            return True
+        if kind == 'var':
+            name = node[1]
+            if name == index:
+                return True
+            if name in reductions or self._type(name) not in _NUMERIC:
+                return False
+            if name not in self.scalars:
+                self.scalars.append(name)
+            return True
+        if kind == 'array_access':
+            name, offset = node[1], _offset(node[2], index)
+            if offset is None or self._type(name) not in ('array_int', 'array_float'):
+                return False
+            if name in stored and stored[name] != offset:
+                return False  # Reads an element another iteration writes
+            if name not in self.arrays:
+                self.arrays.append(name)
+            return True
+        if kind in ('addop', 'mulop'):
+            if kind == 'mulop' and node[1] == '/':
+                divisor = node[3]
+                if divisor[0] != 'number' or divisor[1] == 0:
+                    return False
+            return (self._elementwise(node[2], index, stored, reductions)
+                    and self._elementwise(node[3], index, stored, reductions))
+        return False
+
+    def _result_type(self, node):
+        kind = node[0]
+        if kind == 'number':
+            return 'int' if node[1].__class__ is int else 'float'
+        if kind == 'var':
+            return self._type(node[1])
+        if kind == 'array_access':
+            return self._type(node[1])[len('array_'):]
+        left, right = self._result_type(node[2]), self._result_type(node[3])
+        return 'float' if 'float' in (left, right) else 'int'
+
+
+def recognize_loop(node, lookup):
+    """Get a VectorLoop for a while_stmt node, or None if it isn't element-wise.
+
+    `lookup(name)` gives the type of a name in scope ('int', 'array_float',
+    ...) or None.
+    """
+    recognizer = _Recognizer(lookup)
+    loop = recognizer.recognize(node)
+    if loop is None:
+        return None
+    for stmt in loop.statements:
+        if stmt[0] == 'store' and stmt[1] not in loop.arrays:
+            loop.arrays.append(stmt[1])
+        elif stmt[0] == 'reduce' and stmt[1] not in loop.scalars:
+            loop.scalars.append(stmt[1])  # Its value on entry
+    return loop
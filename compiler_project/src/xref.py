@@ -0,0 +1,117 @@
+"""
+Cross-reference index from source positions to resolved symbols.
+
+The semantic analyzer records every declaration and every resolved use of
+a name while it has the right scope in hand. Identifier spans never
+overlap, so the index keeps them sorted by start offset and answers
+"what is at this position" with one bisect; references are grouped per
+symbol for "find all references".
+
+With a hash-consing Parser, one shared node stands for every occurrence
+of an identical name or expression, and its positions come in source
+order from the Parser's `occurrences`. The analyzer records uses in
+source order too, so each record of a shared node takes its next
+occurrence.
+"""
+import bisect
+
+
+class Reference:
+    """One occurrence of a name: a definition or a use."""
+    __slots__ = ('start', 'end', 'line', 'column', 'name', 'scope', 'is_definition')
+
+    def __init__(self, start, end, line, column, name, scope, is_definition):
+        self.start = start
+        self.end = end
+        self.line = line
+        self.column = column
+        self.name = name
+        self.scope = scope
+        self.is_definition = is_definition
+
+    @property
+    def key(self):
+        """The (name, scope) key of the referenced symbol in the SymbolTable."""
+        return (self.name, self.scope)
+
+    def __repr__(self):
+        kind = 'def' if self.is_definition else 'ref'
+        return f"Reference({kind} {self.name}@{self.scope} {self.line}:{self.column})"
+
+
+class CrossReferenceIndex:
+    """Maps use sites (offset, line, column) to symbols and back."""
+
+    def __init__(self, source, positions, occurrences=None):
+        self.positions = positions  # id(AST node) -> (lexpos, line), filled in by the Parser
+        self.occurrences = occurrences or {}  # id(shared node) -> [(lexpos, line), ...]
+        self._recorded = {}  # id(shared node) -> occurrences recorded so far
+        self._line_starts = [0]
+        for line in source.split('\n')[:-1]:
+            self._line_starts.append(self._line_starts[-1] + len(line) + 1)
+        self._references = []
+        self._starts = []
+        self._sorted = True
+        self._by_symbol = {}
+
+    def record(self, node, symbol, is_definition=False):
+        """Record that the name in an AST node resolves to symbol.
+
+        Returns the Reference, or None if the parser has no position for the node.
+        """
+        position = self.positions.get(id(node))
+        if position is None and id(node) in self.occurrences:
+            seen = self._recorded.get(id(node), 0)
+            occurrences = self.occurrences[id(node)]
+            if seen < len(occurrences):
+                position = occurrences[seen]
+                self._recorded[id(node)] = seen + 1
+        if position is None or symbol is None:
+            return None
+        start, line = position
+        column = start - self._line_starts[line - 1] + 1 if line <= len(self._line_starts) else None
+        reference = Reference(start, start + len(symbol.name), line, column,
+                              symbol.name, symbol.scope, is_definition)
+        if self._references and start < self._references[-1].start:
+            self._sorted = False
+        self._references.append(reference)
+        self._by_symbol.setdefault(reference.key, []).append(reference)
+        return reference
+
+    def _ensure_sorted(self):
+        if not self._sorted:
+            self._references.sort(key=lambda reference: reference.start)
+            for references in self._by_symbol.values():
+                references.sort(key=lambda reference: reference.start)
+            self._sorted = True
+        if len(self._starts) != len(self._references):
+            self._starts = [reference.start for reference in self._references]
+
+    def __len__(self):
+        return len(self._references)
+
+    def symbol_at(self, offset):
+        """Get the Reference covering a source offset, or None."""
+        self._ensure_sorted()
+        i = bisect.bisect_right(self._starts, offset) - 1
+        if i >= 0 and offset < self._references[i].end:
+            return self._references[i]
+        return None
+
+    def symbol_at_line(self, line, column):
+        """Get the Reference covering a 1-based line and column, or None."""
+        if not 1 <= line <= len(self._line_starts):
+            return None
+        return self.symbol_at(self._line_starts[line - 1] + column - 1)
+
+    def references(self, name, scope):
+        """Get every occurrence of the symbol (name, scope), definitions included, in source order."""
+        self._ensure_sorted()
+        return list(self._by_symbol.get((name, scope), []))
+
+    def definition(self, name, scope):
+        """Get the declaring occurrence of a symbol, or None."""
+        for reference in self.references(name, scope):
+            if reference.is_definition:
+                return reference
+        return None
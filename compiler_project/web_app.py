@@ -1,14 +1,12 @@
 from flask import Flask, render_template, request
-import io
-import sys
-from contextlib import redirect_stdout
-from src.lexer import Lexer
-from src.parser import Parser
-from src.semantic import SemanticAnalyzer
-from src.symbol_table import SymbolTable
+import os
+from src.service import EnginePool
 
 app = Flask(__name__)
 
+# Warm lexer/parser engines shared by request threads; each request checks one out
+engine_pool = EnginePool(size=int(os.environ.get('COMPILER_POOL_SIZE', 8)))
+
 # Example program for initial display
 EXAMPLE_PROGRAM = """// Example program
 int factorial(int n) {
@@ -95,32 +93,15 @@ def index():
     if request.method == 'POST':
         code = request.form.get('code', '')
         results = {}
-        
-        # Initialize components
-        symbol_table = SymbolTable()
-        lexer = Lexer()
-        parser = Parser()
-        semantic_analyzer = SemanticAnalyzer(symbol_table)
+        compiled = engine_pool.compile(code)
 
         # Lexical Analysis
-        tokens = []
-        lexer.input(code)
-        while True:
-            token = lexer.token()
-            if not token:
-                break
-            tokens.append({
-                'type': token.type,
-                'value': token.value,
-                'line': token.lineno,
-                'position': token.lexpos
-            })
-        results['tokens'] = tokens
+        results['tokens'] = compiled.tokens.rows()
 
         # Syntax Analysis
-        ast = parser.parse(code)
-        results['syntax_success'] = len(parser.errors) == 0
-        results['syntax_errors'] = parser.errors
+        ast = compiled.ast
+        results['syntax_success'] = compiled.syntax_success
+        results['syntax_errors'] = compiled.syntax_errors
         if ast:
             results['syntax_analysis'] = format_ast(ast)
         else:
@@ -128,34 +109,27 @@ def index():
 
         # Semantic Analysis
         if ast:  # Only perform semantic analysis if syntax analysis succeeded
-            semantic_success = semantic_analyzer.analyze(ast)
-            results['semantic_success'] = semantic_success
-            results['semantic_errors'] = semantic_analyzer.errors
-            def format_semantic_result():
-                if semantic_success:
-                    print("✓ Semantic analysis successful")
-                else:
-                    print("✗ Semantic analysis failed")
-                    for error in semantic_analyzer.errors:
-                        print(f"• {error}")
-
-            results['semantic_analysis'] = capture_output(format_semantic_result)
+            results['semantic_success'] = compiled.semantic_success
+            results['semantic_errors'] = compiled.semantic_errors
+            results['semantic_analysis'] = format_semantic_result(compiled)
         else:
             results['semantic_success'] = False
             results['semantic_analysis'] = "Semantic analysis skipped due to syntax errors"
             results['semantic_errors'] = []
 
         # Symbol Table
-        results['symbol_table'] = format_symbol_table(symbol_table)
+        results['symbol_table'] = format_symbol_table(compiled.symbol_table)
 
     return render_template('index.html', code=code, results=results)
 
-def capture_output(func):
-    """Capture stdout output from a function."""
-    output = io.StringIO()
-    with redirect_stdout(output):
-        func()
-    return output.getvalue()
+def format_semantic_result(compiled):
+    """Format the semantic analysis outcome as text."""
+    if compiled.semantic_success:
+        return "✓ Semantic analysis successful\n"
+    lines = ["✗ Semantic analysis failed"]
+    for error in compiled.semantic_errors:
+        lines.append(f"• {error}")
+    return '\n'.join(lines) + '\n'
 
 if __name__ == '__main__':
     app.run(debug=True) 
\ No newline at end of file